@@ -1,15 +1,71 @@
 # APEXGIFMAKER / apexgifmaker.py
+import time
+_T0 = time.perf_counter()
+
 import os
 import sys
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import QLockFile, QStandardPaths, QThread, Qt, QLocale
+from PySide6.QtCore import QLockFile, QStandardPaths, QThread, Qt, QLocale, QTimer
 from PySide6.QtNetwork import QLocalServer, QLocalSocket
-from src.ui import MainWindow
 
 APP_UNIQUE_NAME = "ApexGifMaker_v2_localserver"
 LOCKFILE_NAME   = "ApexGifMaker_v2.lock"
 
 
+class _StartupProfile:
+    """
+    APEXGIF_STARTUP_PROFILE=1 (또는 --startup-profile): 시작 단계별 경과 시간과 src.* 모듈 import 시간을
+    측정해 표준 오류(stderr)로 출력합니다. 표준 출력은 건드리지 않습니다.
+    - import 시간은 하위 모듈 import를 포함한 누적값입니다.
+    """
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.marks = [("python + PySide6 import", time.perf_counter())]
+        self.imports = []
+        if enabled:
+            sys.meta_path.insert(0, self)
+
+    # importlib 메타 경로 파인더: src.* 모듈의 실행(exec_module) 시간을 잽니다.
+    def find_spec(self, name, path=None, target=None):
+        if not name.startswith("src."):
+            return None
+        import importlib.machinery
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        if spec is None or spec.loader is None:
+            return spec
+        loader, records = spec.loader, self.imports
+        class _TimedLoader:
+            def create_module(self, s): return loader.create_module(s)
+            def exec_module(self, module):
+                t = time.perf_counter()
+                try: loader.exec_module(module)
+                finally: records.append((name, time.perf_counter() - t))
+        spec.loader = _TimedLoader()
+        return spec
+
+    def mark(self, label: str):
+        if self.enabled:
+            self.marks.append((label, time.perf_counter()))
+
+    def report(self):
+        if not self.enabled:
+            return
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        out = sys.stderr
+        if out is None:  # 콘솔 없는 실행(pythonw 등)
+            return
+        print("[STARTUP] 단계별 시간 (프로세스 시작 기준)", file=out)
+        prev = _T0
+        for label, t in self.marks:
+            print(f"  {label:<28}{(t - prev) * 1000:8.1f} ms   (누적 {(t - _T0) * 1000:8.1f} ms)", file=out)
+            prev = t
+        print("[STARTUP] src 모듈 import (누적, 느린 순)", file=out)
+        for name, dt in sorted(self.imports, key=lambda r: r[1], reverse=True):
+            print(f"  {name:<28}{dt * 1000:8.1f} ms", file=out)
+        out.flush()
+
+
 def _temp_dir() -> str:
     path = QStandardPaths.writableLocation(QStandardPaths.TempLocation)
     if not path:
@@ -65,7 +121,7 @@ def _send_activate_signal(name: str) -> bool:
     return True
 
 
-def _bring_to_front(win: MainWindow):
+def _bring_to_front(win):
     """기존 창을 확실히 전면 활성화 (Windows 강화 루틴 포함)."""
     try:
         win.setWindowState(win.windowState() & ~Qt.WindowMinimized)
@@ -192,7 +248,12 @@ def _acquire_single_instance(name: str, lockfile_path: str):
 
 
 def main() -> int:
-    app = QApplication(sys.argv)
+    profile = _StartupProfile(os.environ.get("APEXGIF_STARTUP_PROFILE", "") not in ("", "0")
+                              or "--startup-profile" in sys.argv)
+    argv = [a for a in sys.argv if a != "--startup-profile"]
+
+    app = QApplication(argv)
+    profile.mark("QApplication")
 
     # 단일 인스턴스 확보
     lock_path = os.path.join(_temp_dir(), LOCKFILE_NAME)
@@ -207,10 +268,20 @@ def main() -> int:
             if ko else "Apex GIF Maker is already running.\nBrought the existing window to the front."
         )
         return 0
+    profile.mark("single instance")
 
-    # 메인 윈도우
+    # 메인 윈도우 (ui 모듈은 단일 인스턴스 확인 후에 불러와 중복 실행 시 비용을 줄입니다)
+    from src.ui import MainWindow
+    profile.mark("import src.ui")
     w = MainWindow()
+    profile.mark("MainWindow()")
     w.show()
+    profile.mark("show()")
+    # 이벤트 루프가 첫 화면을 그린 직후 보고합니다.
+    def _first_frame():
+        profile.mark("first frame")
+        profile.report()
+    QTimer.singleShot(0, _first_frame)
 
     # 클라이언트 연결 시: PID 먼저 송신 → 클라이언트가 포커스 권한 부여 후 activate 수신 → 창 전면화
     if server is not None:
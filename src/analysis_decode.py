@@ -0,0 +1,102 @@
+# analysis_decode.py
+# 영상 분석 한 번 디코딩: 움직임 인덱스(motion_index), 호버 스프라이트(scrub), 색 인덱스(color_index)를
+# ffmpeg 하나로 만듭니다. 원본을 한 번만 디코딩하고 split으로 나눠 각 분석의 필터를 그대로 적용하므로,
+# 따로 만들 때와 같은 프레임을 얻으면서 디코딩 비용은 1/3이 됩니다.
+#   - 움직임 프레임은 표준 출력으로 받아 바로 처리하고, 색 프레임은 임시 raw 파일에 받아 끝난 뒤 처리합니다.
+#   - 이미 캐시가 있는 분석은 빼고, 남은 것이 하나뿐이면 각 모듈의 build 함수를 그대로 씁니다.
+#   python -m src.analysis_decode <영상> <길이(초)>
+from . import color_index, motion_index, scrub
+from .ffmpeg_tools import raw_frames_filter, stream_stdout
+from .frame_probe import np, PROBE_W, PROBE_H
+
+
+def build_all(ffmpeg_path: str, video_path: str, duration: float, motion: bool = True, sprite: bool = True,
+              colors: bool = True, should_stop=lambda: False) -> dict:
+    """
+    요청한 분석을 만들어 {"motion": 인덱스, "sprite": 스프라이트 정보, "colors": 색 인덱스}로 반환합니다
+    (요청하지 않았거나 실패한 항목은 None). numpy가 없으면 스프라이트만 만듭니다.
+    """
+    result = {"motion": None, "sprite": None, "colors": None}
+    motion, colors = motion and np is not None, colors and np is not None
+    plan = scrub.sprite_plan(video_path, duration) if sprite else None
+    if int(motion) + int(plan is not None) + int(colors) < 2:
+        if motion:
+            result["motion"] = motion_index.build_index(ffmpeg_path, video_path, should_stop=should_stop)
+        if plan is not None:
+            result["sprite"] = scrub.build_sprite(ffmpeg_path, video_path, duration, should_stop=should_stop)
+        if colors:
+            result["colors"] = color_index.build_index(ffmpeg_path, video_path, should_stop=should_stop)
+        return result
+
+    # 한 그래프: [0:v] → split → 분석마다 자기 필터 → 출력
+    branches, outs = [], []
+    if plan is not None:
+        branches.append((plan["vf"], "s"))
+        outs += ["-map", "[s]", *plan["out_args"]]
+    raw_path = None
+    if colors:
+        frame = raw_frames_filter(color_index.COLOR_FPS, color_index.COLOR_W, color_index.COLOR_H,
+                                  "rgb24", "lanczos")
+        branches.append((frame, "c"))
+        if motion:  # 표준 출력은 움직임 프레임이 쓰므로 색 프레임은 파일로
+            raw_path = color_index.INDEX_DIR / "frames.tmp.raw"
+            raw_path.parent.mkdir(parents=True, exist_ok=True)
+            outs += ["-map", "[c]", "-f", "rawvideo", "-pix_fmt", "rgb24", "-y", str(raw_path)]
+    if motion:
+        branches.append((raw_frames_filter(motion_index.ANALYSIS_FPS, PROBE_W, PROBE_H), "m"))
+    stdout_label = "m" if motion else "c"
+    graph = f"[0:v]split={len(branches)}" + "".join(f"[i{k}]" for k in range(len(branches))) + ";" + \
+        ";".join(f"[i{k}]{vf}[{label}]" for k, (vf, label) in enumerate(branches))
+    outs += ["-map", f"[{stdout_label}]", "-f", "rawvideo",
+             "-pix_fmt", "gray" if stdout_label == "m" else "rgb24", "-"]
+    cmd = [ffmpeg_path, "-hide_banner", "-loglevel", "error", "-i", video_path, "-filter_complex", graph, *outs]
+
+    if motion:
+        chunk = PROBE_W * PROBE_H * motion_index.CHUNK_SEC * motion_index.ANALYSIS_FPS
+    else:
+        chunk = color_index.COLOR_W * color_index.COLOR_H * 3 * color_index.CHUNK_SEC * color_index.COLOR_FPS
+    status = {}
+    side_files = [p for p in (plan and plan["tmp"], raw_path) if p is not None]
+    chunks = stream_stdout(cmd, chunk, kind="analysis", outputs=side_files, status=status)
+    try:
+        index = (motion_index.index_from_chunks(video_path, chunks, should_stop) if motion
+                 else color_index.index_from_chunks(video_path, chunks, should_stop))
+        if status.get("rc") != 0:  # 중단 또는 실패: 부분 결과는 저장하지 않은 것으로 봅니다
+            return result
+        result["motion" if motion else "colors"] = index
+        if plan is not None:
+            result["sprite"] = scrub.finish_sprite(plan)
+        if raw_path is not None and not should_stop():
+            result["colors"] = color_index.index_from_chunks(video_path, _read_chunks(raw_path), should_stop)
+        return result
+    finally:
+        chunks.close()
+        for p in side_files:
+            try: p.unlink()
+            except OSError: pass
+
+
+def _read_chunks(path):
+    """색 인덱스 조각 크기(CHUNK_SEC초)로 raw 파일을 읽습니다."""
+    size = color_index.COLOR_W * color_index.COLOR_H * 3 * color_index.CHUNK_SEC * color_index.COLOR_FPS
+    with open(path, "rb") as f:
+        while True:
+            buf = f.read(size)
+            if not buf:
+                return
+            yield buf
+
+
+if __name__ == "__main__":
+    import argparse, sys, time
+    from .ffmpeg_tools import find_executable
+    ap = argparse.ArgumentParser(prog="python -m src.analysis_decode", description="움직임/스프라이트/색 분석 한 번에")
+    ap.add_argument("video")
+    ap.add_argument("duration", type=float)
+    args = ap.parse_args()
+    ff = find_executable("ffmpeg")
+    if not ff:
+        print("[ERR] ffmpeg를 찾을 수 없습니다."); sys.exit(2)
+    t0 = time.perf_counter()
+    res = build_all(ff, args.video, args.duration)
+    print(f"[OK] {time.perf_counter() - t0:.2f}s: " + ", ".join(f"{k}={'ok' if v else '-'}" for k, v in res.items()))
@@ -0,0 +1,192 @@
+# autotune.py
+# 머신별 ffmpeg 스레드 설정 자동 보정.
+#   - 짧은 합성 영상으로 (스레드 설정 x 동시 작업 수) 조합을 한 번 측정하고,
+#     동시 작업 수별로 가장 빠른 설정을 cache/autotune.json에 저장합니다.
+#   - 이후 명령 생성 시 thread_args(ffmpeg_path)가 현재 실행 중인 작업 수에 맞는 옵션을 돌려줍니다
+#     (프로필의 머신 키가 지금 머신·ffmpeg와 다르면 기본값, 즉 빈 목록).
+#   python -m src.autotune [--force]
+import hashlib, json, os, platform, sys, threading, time
+from contextlib import contextmanager
+from datetime import datetime
+
+from .constants import CACHE_DIR, DEFAULT_WIDTH, DEFAULT_HEIGHT
+from .ffmpeg_tools import find_executable, run_quiet, build_gif_commands_auto, output_paths
+from .capabilities import version_line
+
+PROFILE_PATH = CACHE_DIR / "autotune.json"
+CLIP_PATH    = CACHE_DIR / "autotune_clip.mp4"
+
+CLIP_SEC = 3
+CONCURRENCY_LEVELS = (1, 2, 4)
+
+_lock = threading.Lock()
+_active = 0
+_profile_cache: dict | None = None
+
+
+# --- 동시 작업 수 추적 ---
+@contextmanager
+def job_slot():
+    """ffmpeg 작업 하나가 실행되는 동안 동시 작업 수를 1 늘립니다."""
+    global _active
+    with _lock:
+        _active += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _active -= 1
+
+
+def active_jobs() -> int:
+    with _lock:
+        return _active
+
+
+# --- 프로필 저장/적용 ---
+def machine_key(ffmpeg_path: str) -> str:
+    """같은 머신·같은 ffmpeg에서만 프로필을 재사용하기 위한 키."""
+    ident = "|".join([platform.node(), platform.machine(), platform.processor(),
+                      str(os.cpu_count()), version_line(ffmpeg_path)])
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()[:16]
+
+
+def load_profile() -> dict | None:
+    global _profile_cache
+    if _profile_cache is None and PROFILE_PATH.exists():
+        try:
+            _profile_cache = json.loads(PROFILE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _profile_cache = None
+    return _profile_cache
+
+
+def has_profile(ffmpeg_path: str) -> bool:
+    prof = load_profile()
+    return bool(prof) and prof.get("key") == machine_key(ffmpeg_path)
+
+
+def _args_for(cfg: dict) -> list[str]:
+    t, ft = cfg.get("threads", 0), cfg.get("filter_threads", 0)
+    if not t and not ft:
+        return []  # ffmpeg 기본값이 가장 빨랐던 경우
+    return ["-threads", str(t), "-filter_threads", str(ft), "-filter_complex_threads", str(ft)]
+
+
+def thread_args(ffmpeg_path: str, jobs: int | None = None) -> list[str]:
+    """
+    현재 동시 작업 수에 맞는 스레드 옵션을 반환합니다(보정 전이거나, 다른 머신/ffmpeg에서 만든 프로필이면 빈 목록).
+    - 반환값은 ffmpeg 실행 파일 바로 뒤에 넣습니다. '-threads'는 첫 입력(원본 영상)의
+      디코더 옵션, '-filter_threads'/'-filter_complex_threads'는 전역 옵션으로 적용됩니다.
+    - jobs: 이 작업을 포함한 동시 작업 수 (생략 시 현재 실행 중인 작업 수 + 1)
+    """
+    if not has_profile(ffmpeg_path):
+        return []
+    prof = load_profile()
+    if not prof.get("levels"):
+        return []
+    jobs = max(1, jobs if jobs is not None else active_jobs() + 1)
+    levels = sorted(int(k) for k in prof["levels"])
+    level = max([lv for lv in levels if lv <= jobs] or levels[:1])
+    return _args_for(prof["levels"][str(level)])
+
+
+# --- 보정 ---
+def _candidates() -> list[dict]:
+    cpu = os.cpu_count() or 1
+    counts = sorted({n for n in (1, 2, 4, cpu // 2, cpu) if 1 <= n <= cpu})
+    return [{"threads": 0, "filter_threads": 0}] + [{"threads": n, "filter_threads": n} for n in counts]
+
+
+def _make_clip(ffmpeg_path: str) -> bool:
+    if CLIP_PATH.exists() and CLIP_PATH.stat().st_size > 0:
+        return True
+    CLIP_PATH.parent.mkdir(parents=True, exist_ok=True)
+    p = run_quiet([ffmpeg_path, "-hide_banner", "-loglevel", "error",
+                   "-f", "lavfi", "-i", f"testsrc2=size=1280x720:rate=30:duration={CLIP_SEC}",
+                   "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p", "-y", str(CLIP_PATH)],
+                  kind="autotune", outputs=[CLIP_PATH])
+    return p.returncode == 0
+
+
+def _run_job(ffmpeg_path: str, cfg: dict, idx: int):
+    out = CACHE_DIR / f"autotune_{idx}.gif"
+    cmds = build_gif_commands_auto(ffmpeg_path, str(CLIP_PATH), 0.0, float(CLIP_SEC), 24,
+                                   DEFAULT_WIDTH * 2, DEFAULT_HEIGHT * 2, "cover", "even",
+                                   "floyd_steinberg", str(out), thread_args=_args_for(cfg),
+                                   palette_out=CACHE_DIR / f"autotune_palette_{idx}.png")
+    for cmd in cmds:
+        p = run_quiet(cmd, kind="autotune", outputs=output_paths(cmd))
+        if p.returncode != 0:
+            raise RuntimeError(p.stderr.strip() or "ffmpeg failed")
+
+
+IDLE_POLL_SEC = 0.5
+
+
+def _wait_idle(should_stop) -> bool:
+    """다른 ffmpeg 작업(job_slot)이 끝날 때까지 기다립니다. 측정이 다른 작업과 겹치면 결과가 틀어지기 때문입니다.
+    기다리는 중 should_stop()이 True가 되면 False."""
+    while active_jobs() > 0:
+        if should_stop():
+            return False
+        time.sleep(IDLE_POLL_SEC)
+    return not should_stop()
+
+
+def calibrate(ffmpeg_path: str, log=lambda *_: None, should_stop=lambda: False) -> dict | None:
+    """
+    모든 (설정 x 동시 작업 수) 조합을 측정하고 가장 빠른 설정을 저장합니다.
+    - 조합마다 다른 작업이 없을 때까지 기다렸다가 측정합니다.
+    - should_stop()이 True가 되면 진행 중인 측정만 마치고 중단합니다(프로필은 저장하지 않고 None).
+    """
+    global _profile_cache
+    from concurrent.futures import ThreadPoolExecutor
+    if not _make_clip(ffmpeg_path):
+        log("[WARN] 자동 보정용 영상 생성 실패")
+        return None
+
+    cpu = os.cpu_count() or 1
+    levels = [lv for lv in CONCURRENCY_LEVELS if lv <= max(1, cpu)]
+    result = {}
+    try:
+        for lv in levels:
+            best = None
+            for cfg in _candidates():
+                if not _wait_idle(should_stop):
+                    log("[TUNE] 자동 보정을 중단했습니다.")
+                    return None
+                t0 = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=lv) as ex:
+                    list(ex.map(lambda i: _run_job(ffmpeg_path, cfg, i), range(lv)))
+                wall = time.perf_counter() - t0
+                log(f"[TUNE] jobs={lv} threads={cfg['threads'] or 'auto'}: {wall:.2f}s")
+                if best is None or wall < best[0]:
+                    best = (wall, cfg)
+            result[str(lv)] = {**best[1], "wall_s": round(best[0], 3)}
+    finally:
+        for p in CACHE_DIR.glob("autotune_*.*"):
+            if p != CLIP_PATH:
+                try: p.unlink()
+                except OSError: pass
+
+    prof = {"key": machine_key(ffmpeg_path), "created": datetime.now().isoformat(timespec="seconds"),
+            "cpu_count": cpu, "levels": result}
+    PROFILE_PATH.write_text(json.dumps(prof, indent=2), encoding="utf-8")
+    _profile_cache = prof
+    log(f"[TUNE] 보정 완료: " + ", ".join(f"{k}개 작업 → threads={v['threads'] or 'auto'}"
+                                          for k, v in result.items()))
+    return prof
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(prog="python -m src.autotune", description="ffmpeg 스레드 설정 자동 보정")
+    ap.add_argument("--force", action="store_true", help="기존 프로필이 있어도 다시 측정")
+    args = ap.parse_args()
+    ff = find_executable("ffmpeg")
+    if not ff:
+        print("[ERR] ffmpeg를 찾을 수 없습니다."); sys.exit(2)
+    if has_profile(ff) and not args.force:
+        print(json.dumps(load_profile(), indent=2)); sys.exit(0)
+    sys.exit(0 if calibrate(ff, print) else 1)
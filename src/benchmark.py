@@ -0,0 +1,204 @@
+# benchmark.py
+# 파이프라인 단계별 성능 측정 도구.
+#   python -m src.benchmark run [--quick] [--repeat 3] [--out results.json]
+#   python -m src.benchmark compare base.json new.json [--threshold 0.10]
+#
+# 테스트 영상은 ffmpeg lavfi 소스(testsrc2)로 로컬에서 매번 같은 내용으로 생성하므로
+# 외부 파일 없이 같은 머신에서 재현 가능한 결과를 얻을 수 있습니다.
+import argparse, json, platform, statistics, sys, time
+from datetime import datetime
+from pathlib import Path
+
+from .constants import APP_VERSION, CACHE_DIR
+from .ffmpeg_tools import (
+    find_executable, run_quiet, probe_duration_sec, extract_preview_frame,
+    build_timeline_thumbs, build_gif_commands_auto, output_paths
+)
+from .capabilities import version_line
+
+BENCH_DIR = CACHE_DIR / "bench"
+
+# (코덱, 컨테이너 확장자, 추가 인코더 옵션)
+CODECS = {
+    "h264": ("libx264", "mp4", ["-preset", "veryfast", "-pix_fmt", "yuv420p"]),
+    "mpeg4": ("mpeg4", "mp4", ["-q:v", "5"]),
+    "vp9": ("libvpx-vp9", "webm", ["-deadline", "realtime", "-cpu-used", "8", "-b:v", "2M"]),
+}
+RESOLUTIONS = {"360p": (640, 360), "720p": (1280, 720), "1080p": (1920, 1080)}
+LENGTHS = (10, 60)
+
+# --quick: 가장 흔한 조합만 측정
+QUICK_MATRIX = [("h264", "720p", 10)]
+
+# GIF 단계는 앱 기본 옵션(160x80, 12fps, 6초 구간)으로 측정합니다.
+GIF_RANGE = (1.0, 7.0)
+GIF_OPTS = dict(fps=12, w=160, h=80, mode="cover", alg="even", dither="floyd_steinberg")
+
+STAGES = ("probe", "preview", "thumbs", "pass1", "pass2")
+
+
+def make_media(ffmpeg_path: str, codec: str, res: str, length: int, log=print) -> Path | None:
+    """lavfi testsrc2로 결정적인 테스트 영상을 만들고 경로를 반환합니다(이미 있으면 재사용)."""
+    encoder, ext, enc_args = CODECS[codec]
+    w, h = RESOLUTIONS[res]
+    out = BENCH_DIR / "media" / f"{codec}_{res}_{length}s.{ext}"
+    if out.exists() and out.stat().st_size > 0:
+        return out
+    out.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [ffmpeg_path, "-hide_banner", "-loglevel", "error",
+           "-f", "lavfi", "-i", f"testsrc2=size={w}x{h}:rate=30:duration={length}",
+           "-c:v", encoder, *enc_args, "-g", "60", "-fflags", "+bitexact", "-y", str(out)]
+    p = run_quiet(cmd, kind="bench_media", outputs=[out])
+    if p.returncode != 0:
+        log(f"[WARN] 테스트 영상 생성 실패({codec}/{res}): {p.stderr.strip()[:200]}")
+        if out.exists(): out.unlink()
+        return None
+    return out
+
+
+def _time(fn, repeat: int) -> list[float]:
+    """워밍업 1회(디스크 캐시 등) 후 repeat회 측정한 시간(초) 목록을 반환합니다."""
+    fn()
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return runs
+
+
+def _check(p):
+    if p.returncode != 0:
+        raise RuntimeError(p.stderr.strip() or "ffmpeg failed")
+
+
+def bench_media(ffmpeg_path: str, ffprobe_path: str, video: Path, repeat: int) -> dict:
+    """하나의 테스트 영상에 대해 각 파이프라인 단계를 repeat회 측정합니다."""
+    v = str(video)
+    work = BENCH_DIR / "work"
+    work.mkdir(parents=True, exist_ok=True)
+    out_gif = str(work / "bench.gif")
+    pass1, pass2 = build_gif_commands_auto(ffmpeg_path, v, *GIF_RANGE, GIF_OPTS["fps"], GIF_OPTS["w"],
+                                           GIF_OPTS["h"], GIF_OPTS["mode"], GIF_OPTS["alg"],
+                                           GIF_OPTS["dither"], out_gif)
+
+    def preview():
+        # 프리뷰 캐시에 걸리지 않도록 매번 결과 파일을 지웁니다.
+        extract_preview_frame(ffmpeg_path, v, 3.0).unlink()
+
+    # 테스트 영상 길이는 파일명에 들어 있으므로 ffprobe가 없어도 썸네일 단계를 측정할 수 있습니다.
+    length = float(video.stem.split("_")[-1].rstrip("s"))
+    stages = {
+        "probe": lambda: probe_duration_sec(ffprobe_path, v),
+        "preview": preview,
+        "thumbs": lambda: build_timeline_thumbs(ffmpeg_path, v, length, 10, work / "timeline"),
+        "pass1": lambda: _check(run_quiet(pass1, kind="pass1", outputs=output_paths(pass1))),
+        "pass2": lambda: _check(run_quiet(pass2, kind="pass2", outputs=output_paths(pass2))),
+    }
+    if not ffprobe_path:
+        del stages["probe"]
+
+    result = {}
+    for name, fn in stages.items():
+        try:
+            runs = _time(fn, repeat)
+            result[name] = {"runs": runs, "median": statistics.median(runs), "min": min(runs)}
+        except Exception as e:
+            result[name] = {"error": str(e)[:300]}
+    return result
+
+
+def run(args) -> int:
+    ffmpeg_path, ffprobe_path = find_executable("ffmpeg"), find_executable("ffprobe")
+    if not ffmpeg_path:
+        print("[ERR] ffmpeg를 찾을 수 없습니다.")
+        return 2
+    if not ffprobe_path:
+        print("[WARN] ffprobe가 없어 probe 단계를 건너뜁니다.")
+
+    if args.quick:
+        matrix = QUICK_MATRIX
+    else:
+        matrix = [(c, r, n) for c in CODECS for r in RESOLUTIONS for n in LENGTHS]
+
+    report = {
+        "meta": {
+            "app_version": APP_VERSION,
+            "ffmpeg": version_line(ffmpeg_path),
+            "machine": platform.node(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "repeat": args.repeat,
+            "created": datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": {},
+    }
+    for codec, res, length in matrix:
+        video = make_media(ffmpeg_path, codec, res, length)
+        if video is None:
+            continue
+        key = video.stem
+        print(f"[BENCH] {key} ...", flush=True)
+        report["results"][key] = r = bench_media(ffmpeg_path, ffprobe_path, video, args.repeat)
+        print("        " + "  ".join(f"{s}={r[s]['median']*1000:.0f}ms" if "median" in r[s] else f"{s}=ERR"
+                                    for s in STAGES if s in r))
+
+    out = Path(args.out) if args.out else BENCH_DIR / f"results_{datetime.now():%Y%m%d_%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"[OK] 결과 저장: {out}")
+    return 0
+
+
+def compare(base: dict, new: dict, threshold: float) -> list[tuple]:
+    """
+    두 측정 결과의 단계별 중앙값을 비교합니다.
+    반환: [(영상, 단계, 기준 ms, 신규 ms, 변화율, 판정)] — 판정은 'REGRESSION' | 'FASTER' | 'ok'
+    """
+    rows = []
+    for media, stages in new.get("results", {}).items():
+        for stage, r in stages.items():
+            b = base.get("results", {}).get(media, {}).get(stage, {})
+            if "median" not in r or "median" not in b or b["median"] <= 0:
+                continue
+            ratio = r["median"] / b["median"] - 1.0
+            verdict = "REGRESSION" if ratio > threshold else "FASTER" if ratio < -threshold else "ok"
+            rows.append((media, stage, b["median"] * 1000, r["median"] * 1000, ratio, verdict))
+    return rows
+
+
+def run_compare(args) -> int:
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    new = json.loads(Path(args.new).read_text(encoding="utf-8"))
+    if base.get("meta", {}).get("machine") != new.get("meta", {}).get("machine"):
+        print("[WARN] 서로 다른 머신의 결과입니다. 비교 결과를 신뢰하기 어렵습니다.")
+
+    rows = compare(base, new, args.threshold)
+    for media, stage, b, n, ratio, verdict in rows:
+        print(f"{media:<22} {stage:<8} {b:9.1f}ms → {n:9.1f}ms  {ratio:+7.1%}  {verdict}")
+    regressions = [r for r in rows if r[5] == "REGRESSION"]
+    print(f"[{'FAIL' if regressions else 'OK'}] 회귀 {len(regressions)}건 / 비교 {len(rows)}건"
+          f" (임계값 {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m src.benchmark", description="APEX GIF MAKER 성능 측정")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run", help="파이프라인 단계별 시간 측정")
+    r.add_argument("--repeat", type=int, default=3)
+    r.add_argument("--quick", action="store_true", help="h264/720p/10s 한 가지만 측정")
+    r.add_argument("--out", help="결과 JSON 경로 (기본: cache/bench/results_<시각>.json)")
+
+    c = sub.add_parser("compare", help="두 결과 JSON 비교 (회귀가 있으면 종료 코드 1)")
+    c.add_argument("base")
+    c.add_argument("new")
+    c.add_argument("--threshold", type=float, default=0.10, help="회귀 판정 비율 (기본 0.10 = 10%%)")
+
+    args = ap.parse_args(argv)
+    return run(args) if args.cmd == "run" else run_compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# build_cache.py
+# 결과물 캐시: 같은 영상·구간·옵션·ffmpeg로 다시 "생성"하면 두 패스를 다시 돌리지 않고
+# 캐시해 둔 결과를 대상 경로에 복사해 바로 내놓습니다.
+#   - 위치: cache/builds/<키>.<확장자>, 전체 크기가 MAX_BYTES를 넘으면 오래 쓰지 않은 것부터 지웁니다.
+#   - 하드링크가 아니라 복사이므로, 사용자가 결과 파일을 그 자리에서 고쳐도 캐시는 바뀌지 않습니다.
+import hashlib, json, os, shutil
+from pathlib import Path
+
+from .constants import CACHE_DIR, APP_VERSION
+from .capabilities import version_line
+
+BUILD_DIR = CACHE_DIR / "builds"
+MAX_BYTES = 512 * 1024 ** 2
+
+
+def build_key(ffmpeg_path: str, video_path: str, segments, opts: dict, formats) -> str:
+    """
+    원본 지문(경로, 크기, 수정 시각) + 정확한 구간 + 옵션 전체 + 출력 형식 목록 + ffmpeg/앱 버전으로 만든 키.
+    출력 형식 목록이 바뀌면 GIF도 다르게 만들어질 수 있으므로(예: 장면별 팔레트 대체) 함께 넣습니다.
+    """
+    st = os.stat(video_path)
+    ident = json.dumps([str(Path(video_path).resolve()), st.st_size, st.st_mtime_ns,
+                        [[round(a, 3), round(b, 3)] for a, b in segments], opts, sorted(formats),
+                        version_line(ffmpeg_path), APP_VERSION], sort_keys=True)
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()[:20]
+
+
+def _entry(key: str, out_path) -> Path:
+    return BUILD_DIR / f"{key}{Path(out_path).suffix.lower()}"
+
+
+def _place(src: Path, dest: Path):
+    """src를 dest에 복사합니다(임시 파일에 쓴 뒤 교체하므로 중간에 실패해도 깨진 파일이 남지 않음)."""
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    try: tmp.unlink()
+    except OSError: pass
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+def lookup(key: str, out_paths: list[str]) -> bool:
+    """모든 출력이 캐시에 있으면 대상 경로에 내놓고 True. 하나라도 없으면 아무것도 하지 않고 False."""
+    entries = [_entry(key, p) for p in out_paths]
+    if not all(e.is_file() for e in entries):
+        return False
+    try:
+        for e, p in zip(entries, out_paths):
+            Path(p).parent.mkdir(parents=True, exist_ok=True)
+            _place(e, Path(p))
+            os.utime(e)  # 최근 사용 표시(정리 순서)
+    except OSError:
+        return False
+    return True
+
+
+def release(out_paths: list[str]):
+    """
+    대상 파일이 (이전 버전이 만든) 캐시 하드링크로 묶여 있으면 지웁니다(ffmpeg가 덮어쓸 때 캐시가 바뀌지 않도록).
+    """
+    for p in out_paths:
+        try:
+            if os.stat(p).st_nlink > 1:
+                os.unlink(p)
+        except OSError:
+            pass
+
+
+def store(key: str, out_paths: list[str]):
+    """생성된 출력들을 캐시에 넣고 용량 제한에 맞춰 정리합니다. 실패해도 변환 결과에는 영향이 없습니다."""
+    try:
+        BUILD_DIR.mkdir(parents=True, exist_ok=True)
+        for p in out_paths:
+            if Path(p).is_file():
+                _place(Path(p), _entry(key, p))
+        _trim(MAX_BYTES)
+    except OSError:
+        pass
+
+
+def _trim(max_bytes: int):
+    files = [(f.stat().st_mtime, f.stat().st_size, f) for f in BUILD_DIR.iterdir()
+             if f.is_file() and not f.name.startswith(".")]
+    total = sum(s for _, s, _ in files)
+    for _, size, f in sorted(files, key=lambda x: x[0]):
+        if total <= max_bytes:
+            break
+        try:
+            f.unlink()
+            total -= size
+        except OSError:
+            pass
@@ -0,0 +1,176 @@
+# capabilities.py
+# ffmpeg 실행 파일별 기능 조회(버전, 필터, 디코더/인코더, 옵션 문법)를 한 번만 실행하고 캐시합니다.
+#   - 캐시 위치: cache/capabilities.json (실행 파일 경로별, 수정 시각/크기가 바뀌면 다시 조회)
+#   - 명령 생성 시 실제로 지원되는 옵션/필터를 골라 쓰므로 실행 중 시행착오가 없습니다.
+#   python -m src.capabilities [ffmpeg 경로]
+import json, os, re, threading
+
+from .constants import CACHE_DIR
+
+CAPS_PATH = CACHE_DIR / "capabilities.json"
+CAPS_SCHEMA = 2
+
+_lock = threading.Lock()
+_mem: dict[str, dict] = {}
+
+
+def _stamp(exe: str) -> list | None:
+    try:
+        st = os.stat(exe)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_disk() -> dict:
+    try:
+        data = json.loads(CAPS_PATH.read_text(encoding="utf-8"))
+        return data if data.get("schema") == CAPS_SCHEMA else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_disk(exe: str, caps: dict):
+    try:
+        data = _load_disk() or {"schema": CAPS_SCHEMA}
+        data.setdefault("tools", {})[exe] = caps
+        CAPS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CAPS_PATH.with_name(CAPS_PATH.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        os.replace(tmp, CAPS_PATH)
+    except OSError:
+        pass  # 캐시 저장 실패는 다음 실행에서 다시 조회하면 되므로 무시합니다.
+
+
+def _names(listing: str) -> list[str]:
+    """'-filters'/'-decoders'/'-encoders' 출력에서 이름 열만 뽑습니다(플래그 열 다음 단어)."""
+    names = []
+    for line in listing.splitlines():
+        m = re.match(r"\s*[A-Z.|]{3,6}\s+(\S+)\s", line)
+        if m and m.group(1) != "=":
+            names.append(m.group(1))
+    return names
+
+
+def _filter_options(help_text: str) -> list[str]:
+    """'-h filter=<이름>' 출력에서 AVOption 이름 목록을 뽑습니다."""
+    return re.findall(r"^   (\w+)\s+<", help_text, flags=re.M)
+
+
+def _query(exe: str) -> dict:
+    from .ffmpeg_tools import run_quiet
+
+    def out(*args) -> str:
+        p = run_quiet([exe, "-hide_banner", *args], kind="caps")
+        return p.stdout if p.returncode == 0 else ""
+
+    version = (out("-version").splitlines() or [""])[0].strip()
+    m = re.search(r"version n?(\d+)\.(\d+)", version)
+    help_long = out("-h", "long")
+    return {
+        "stamp": _stamp(exe),
+        "version": version,
+        # git 빌드(N-xxxxx)는 번호가 없으므로 None
+        "version_tuple": [int(m.group(1)), int(m.group(2))] if m else None,
+        "filters": _names(out("-filters")),
+        "decoders": _names(out("-decoders")),
+        "encoders": _names(out("-encoders")),
+        "options": sorted(set(re.findall(r"^-(\w+)", help_long, flags=re.M))),
+        # 7.0부터 -filter_script 등은 '-/filter <파일>' 문법으로 대체됨
+        "slash_files": "use -/filter" in help_long,
+        "paletteuse": _filter_options(out("-h", "filter=paletteuse")),
+    }
+
+
+def probe(exe: str) -> dict:
+    """
+    실행 파일의 기능 정보를 반환합니다. 실행 파일당 한 번만 조회하고, 이후에는 메모리/디스크 캐시를 씁니다.
+    - 경로가 잘못되었거나 조회에 실패하면 빈 정보를 반환합니다(기존 기본 옵션으로 동작).
+    """
+    exe = str(exe or "")
+    stamp = _stamp(exe) if exe else None
+    if stamp is None:
+        return {}
+    with _lock:
+        caps = _mem.get(exe)
+        if caps and caps.get("stamp") == stamp:
+            return caps
+        caps = _load_disk().get("tools", {}).get(exe)
+        if not caps or caps.get("stamp") != stamp:
+            try:
+                caps = _query(exe)
+            except Exception:
+                return {}
+            if caps["version"]:
+                _save_disk(exe, caps)
+        _mem[exe] = caps
+        return caps
+
+
+def version_line(exe: str) -> str:
+    """'ffmpeg version ...' 첫 줄 (조회 실패 시 빈 문자열)."""
+    return probe(exe).get("version", "")
+
+
+def has_filter(exe: str, name: str) -> bool:
+    """필터 지원 여부. 정보를 얻지 못한 경우에는 있다고 가정합니다(기존 동작 유지)."""
+    caps = probe(exe)
+    return name in caps["filters"] if caps.get("filters") else True
+
+
+def has_decoder(exe: str, name: str) -> bool:
+    caps = probe(exe)
+    return name in caps["decoders"] if caps.get("decoders") else True
+
+
+def has_encoder(exe: str, name: str) -> bool:
+    caps = probe(exe)
+    return name in caps["encoders"] if caps.get("encoders") else True
+
+
+def vfr_args(exe: str) -> list[str]:
+    """가변 프레임 출력 옵션: 신형 '-fps_mode vfr', 구형(5.0 이하)은 '-vsync vfr'."""
+    opts = probe(exe).get("options")
+    if opts and "fps_mode" not in opts:
+        return ["-vsync", "vfr"]
+    return ["-fps_mode", "vfr"]
+
+
+def script_flag(exe: str, option: str) -> str:
+    """
+    필터 그래프를 파일로 넘기는 옵션 이름. (option: '-vf' 또는 '-lavfi')
+    - 7.0 이상은 '-/filter:v', '-/filter_complex', 이전 버전은 '-filter_script:v', '-filter_complex_script'
+    """
+    if probe(exe).get("slash_files"):
+        return "-/filter:v" if option == "-vf" else "-/filter_complex"
+    return "-filter_script:v" if option == "-vf" else "-filter_complex_script"
+
+
+def paletteuse_extra(exe: str, diff_rect: bool = False) -> str:
+    """
+    paletteuse에 덧붙일 옵션. 기본은 없음(이전과 같은 출력).
+    - diff_rect: diff_mode=rectangle을 켭니다(빌드가 지원할 때만). 프레임마다 바뀐 사각형만 다시 양자화하므로
+      정지 구간이 많은 GIF에서 인코딩이 빨라지고 파일도 작아지지만, 디더링 무늬가 달라져 결과 바이트/화질이 바뀝니다.
+    """
+    return ":diff_mode=rectangle" if diff_rect and "diff_mode" in probe(exe).get("paletteuse", []) else ""
+
+
+def forget():
+    """메모리 캐시를 비웁니다(ffmpeg 자동 설치 직후 등)."""
+    with _lock:
+        _mem.clear()
+
+
+if __name__ == "__main__":
+    import sys
+    from .ffmpeg_tools import find_executable
+    ff = sys.argv[1] if len(sys.argv) > 1 else find_executable("ffmpeg")
+    if not ff:
+        print("[ERR] ffmpeg를 찾을 수 없습니다."); sys.exit(2)
+    caps = probe(ff)
+    print(f"[INFO] {caps.get('version') or '?'}")
+    print(f"       filters={len(caps.get('filters', []))} decoders={len(caps.get('decoders', []))}"
+          f" encoders={len(caps.get('encoders', []))}"
+          f" vfr={' '.join(vfr_args(ff))} script={script_flag(ff, '-lavfi')}"
+          f" paletteuse{paletteuse_extra(ff, diff_rect=True) or ' (diff_mode 없음)'}")
+    print(f"       scdet={has_filter(ff, 'scdet')} mpdecimate={has_filter(ff, 'mpdecimate')}")
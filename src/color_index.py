@@ -0,0 +1,214 @@
+# color_index.py
+# 초당 색 히스토그램 인덱스: 영상 전체를 작은 컬러 프레임(96x54, 초당 2장)으로 한 번 훑어
+# 초마다 RGB 6비트(64x64x64칸) 히스토그램을 저장해 두고, 어떤 구간이든 히스토그램을 합쳐
+# median cut으로 256색 팔레트를 바로 만듭니다(ffmpeg palettegen 패스 없이 수십 밀리초).
+#   - 결과는 영상별로 cache/colors/<키>.npz에 저장되어 다시 열 때 바로 쓰입니다.
+#   - 인덱스는 출력 크기/크롭과 무관하게 원본 화면 전체의 색 분포입니다(팔레트 근사).
+#     축소는 출력과 같은 lanczos로 합니다(area 평균은 가장자리의 진한 색을 잃어 팔레트 품질이 떨어짐).
+#   python -m src.color_index <영상> [--start 0 --end 10] [--out palette.png]
+import hashlib, os
+from pathlib import Path
+
+from .constants import CACHE_DIR
+from .ffmpeg_tools import stream_raw_frames
+from .frame_probe import np
+
+INDEX_DIR = CACHE_DIR / "colors"
+INDEX_VERSION = 1
+
+COLOR_FPS = 2
+COLOR_W, COLOR_H = 96, 54
+CHUNK_SEC = 30
+BITS = 6                       # 채널당 비트 수 → 히스토그램 칸 수 2^(3*BITS)
+BINS = 1 << (3 * BITS)
+PALETTE_SIZE = 256
+
+
+def _index_path(video_path: str) -> Path:
+    st = os.stat(video_path)
+    ident = f"{Path(video_path).resolve()}|{st.st_mtime_ns}|{st.st_size}"
+    return INDEX_DIR / f"{hashlib.sha1(ident.encode('utf-8')).hexdigest()[:16]}.npz"
+
+
+_loaded: tuple[Path, dict] | None = None   # 마지막으로 읽은 인덱스 (같은 영상을 반복 변환할 때 재사용)
+
+
+def load_index(video_path: str) -> dict | None:
+    """
+    저장된 색 인덱스가 있으면 반환합니다. numpy가 없으면 None.
+    반환: {"seconds": 길이, "offsets": (seconds+1,), "bins": (n,) uint32, "counts": (n,) uint16}
+      - offsets[s]:offsets[s+1]이 s초의 (칸 번호, 픽셀 수) 목록입니다.
+    """
+    global _loaded
+    if np is None:
+        return None
+    try:
+        path = _index_path(video_path)
+    except OSError:
+        return None
+    if _loaded is not None and _loaded[0] == path:
+        return _loaded[1]
+    try:
+        with np.load(path) as z:
+            if int(z["version"]) != INDEX_VERSION:
+                return None
+            index = {"seconds": int(len(z["offsets"]) - 1), "offsets": z["offsets"],
+                     "bins": z["bins"], "counts": z["counts"]}
+    except (OSError, ValueError, KeyError):
+        return None
+    _loaded = (path, index)
+    return index
+
+
+def build_index(ffmpeg_path: str, video_path: str, should_stop=lambda: False) -> dict | None:
+    """
+    영상 전체를 읽어 초당 색 히스토그램 인덱스를 만들고 저장합니다.
+    - 초 번호와 칸 번호를 한 키로 묶어 np.unique 한 번으로 청크 안의 모든 초를 집계합니다.
+    - should_stop()이 True가 되면 중단하고 None을 반환합니다(ffmpeg도 종료). numpy가 없어도 None.
+    """
+    if np is None:
+        return None
+    chunks = stream_raw_frames(ffmpeg_path, video_path, COLOR_FPS, COLOR_W, COLOR_H,
+                               CHUNK_SEC * COLOR_FPS, pix_fmt="rgb24", scale_flags="lanczos")
+    return index_from_chunks(video_path, chunks, should_stop)
+
+
+def index_from_chunks(video_path: str, chunks, should_stop=lambda: False) -> dict | None:
+    """
+    COLOR_W x COLOR_H rgb24, 초당 COLOR_FPS장 원시 프레임 조각들(bytes, 조각마다 CHUNK_SEC초)로
+    인덱스를 만들고 저장합니다. (build_index와 analysis_decode가 공유. 중단되면 chunks를 닫고 None)
+    """
+    global _loaded
+    frame_size = COLOR_W * COLOR_H * 3
+    bins, counts, secs = [], [], []
+    first_sec = 0
+    try:
+        for buf in chunks:
+            if should_stop():
+                return None
+            n = len(buf) // frame_size
+            if n == 0:
+                continue
+            px = np.frombuffer(buf, np.uint8, count=n * frame_size).reshape(n, -1, 3) >> (8 - BITS)
+            q = ((px[..., 0].astype(np.int64) << (2 * BITS)) | (px[..., 1].astype(np.int64) << BITS)
+                 | px[..., 2])
+            sec = first_sec + np.arange(n) // COLOR_FPS
+            keys, cnt = np.unique(q + (sec * BINS)[:, None], return_counts=True)
+            secs.append(keys // BINS)
+            bins.append((keys % BINS).astype(np.uint32))
+            counts.append(cnt.astype(np.uint16))
+            first_sec += CHUNK_SEC  # 청크는 초 단위로 나뉩니다(CHUNK_SEC * COLOR_FPS 프레임)
+    finally:
+        chunks.close()
+
+    sec = np.concatenate(secs) if secs else np.zeros(0, np.int64)
+    seconds = int(sec[-1]) + 1 if len(sec) else 0
+    offsets = np.searchsorted(sec, np.arange(seconds + 1)).astype(np.int64)
+    index = {"seconds": seconds, "offsets": offsets,
+             "bins": np.concatenate(bins) if bins else np.zeros(0, np.uint32),
+             "counts": np.concatenate(counts) if counts else np.zeros(0, np.uint16)}
+    path = _index_path(video_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez_compressed(tmp, version=INDEX_VERSION, offsets=offsets,
+                            bins=index["bins"], counts=index["counts"])
+        os.replace(tmp, path)
+        _loaded = (path, index)
+    except OSError:
+        pass
+    return index
+
+
+def range_histogram(index: dict, segments) -> "np.ndarray":
+    """(시작, 끝) 구간들에 걸친 초들의 히스토그램을 합칩니다. 반환: (BINS,) float64"""
+    offsets = index["offsets"]
+    picked = np.zeros(index["seconds"], bool)
+    for a, b in segments:
+        s0 = max(0, int(a))
+        s1 = min(index["seconds"], max(s0 + 1, int(np.ceil(b))))
+        picked[s0:s1] = True
+    rows = np.flatnonzero(picked)
+    if len(rows) == 0:
+        return np.zeros(BINS)
+    # 고른 초들의 [offsets[s], offsets[s+1]) 구간을 한 번에 모읍니다.
+    lens = offsets[rows + 1] - offsets[rows]
+    starts = np.repeat(offsets[rows] - np.concatenate([[0], np.cumsum(lens)[:-1]]), lens)
+    take = starts + np.arange(lens.sum())
+    return np.bincount(index["bins"][take], weights=index["counts"][take], minlength=BINS)
+
+
+def _bin_colors(idx: "np.ndarray") -> "np.ndarray":
+    """칸 번호 → 대표 RGB. 0칸은 0, 마지막 칸은 255가 되도록 펼칩니다(순수 흑백 유지)."""
+    m = (1 << BITS) - 1
+    ch = np.stack([(idx >> (2 * BITS)) & m, (idx >> BITS) & m, idx & m], axis=1)
+    return ch * (255.0 / m)
+
+
+def median_cut(hist: "np.ndarray", size: int = PALETTE_SIZE) -> "np.ndarray":
+    """
+    가중 히스토그램에 median cut을 적용해 최대 size개의 색(k, 3) uint8을 반환합니다.
+    - 가중 제곱오차가 가장 큰 상자를, 분산이 가장 큰 채널의 가중 중앙값에서 나눕니다.
+    - 각 상자의 색은 상자 안 칸들의 가중 평균입니다.
+    """
+    nz = np.flatnonzero(hist)
+    if len(nz) == 0:
+        return np.zeros((1, 3), np.uint8)
+    colors, weights = _bin_colors(nz), hist[nz].astype(np.float64)
+
+    def stats(ix):
+        """(평균 색, 채널별 가중 제곱오차, 나눌 우선순위(칸이 하나면 -1))"""
+        w = weights[ix]
+        mean = (colors[ix] * w[:, None]).sum(axis=0) / w.sum()
+        var = ((colors[ix] - mean) ** 2 * w[:, None]).sum(axis=0)
+        return mean, var, float(var.sum()) if len(ix) > 1 else -1.0
+
+    boxes = [np.arange(len(nz))]
+    box_stats = [stats(boxes[0])]
+    err = [box_stats[0][2]]
+    while len(boxes) < size:
+        i = max(range(len(err)), key=err.__getitem__)
+        if err[i] <= 0:
+            break
+        ix, (_, var, _) = boxes[i], box_stats[i]
+        ch = int(np.argmax(var))
+        ix = ix[np.argsort(colors[ix, ch], kind="stable")]
+        cw = np.cumsum(weights[ix])
+        cut = int(np.searchsorted(cw, cw[-1] / 2))
+        cut = min(max(cut, 1), len(ix) - 1)  # 양쪽 모두 비지 않도록
+        left, right = ix[:cut], ix[cut:]
+        boxes[i:i + 1] = [left, right]
+        box_stats[i:i + 1] = [stats(left), stats(right)]
+        err[i:i + 1] = [box_stats[i][2], box_stats[i + 1][2]]
+    return np.clip(np.rint([m for m, _, _ in box_stats]), 0, 255).astype(np.uint8)
+
+
+def range_palette(index: dict, segments, reserve=()) -> "np.ndarray":
+    """
+    구간 팔레트(k, 3) uint8. reserve: 항상 넣을 색(예: 레터박스 여백의 검정) — median cut은 나머지 칸만 씁니다.
+    """
+    reserve = np.asarray(reserve, np.uint8).reshape(-1, 3)
+    pal = median_cut(range_histogram(index, segments), PALETTE_SIZE - len(reserve))
+    return np.concatenate([reserve, pal]) if len(reserve) else pal
+
+
+if __name__ == "__main__":
+    import argparse, sys, time
+    from .ffmpeg_tools import find_executable
+    from .palette_library import write_palette_png
+    ap = argparse.ArgumentParser(prog="python -m src.color_index", description="초당 색 인덱스와 구간 팔레트")
+    ap.add_argument("video")
+    ap.add_argument("--start", type=float, default=0.0)
+    ap.add_argument("--end", type=float, default=None, help="끝 위치(초, 기본: 영상 끝)")
+    ap.add_argument("--out", default=str(CACHE_DIR / "palette_index.png"))
+    args = ap.parse_args()
+    ff = find_executable("ffmpeg")
+    if not ff or np is None:
+        print("[ERR] ffmpeg 또는 numpy가 없습니다."); sys.exit(2)
+    t0 = time.perf_counter()
+    idx = load_index(args.video) or build_index(ff, args.video)
+    print(f"[INFO] 인덱스: {idx['seconds']}초, {len(idx['bins'])}칸 ({time.perf_counter() - t0:.2f}s)")
+    t0 = time.perf_counter()
+    pal = range_palette(idx, [(args.start, args.end if args.end is not None else idx["seconds"])])
+    write_palette_png(pal, args.out)
+    print(f"[OK] {len(pal)}색 팔레트 ({(time.perf_counter() - t0) * 1000:.1f} ms): {args.out}")
@@ -20,13 +20,12 @@ def app_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
 # --- 핵심 경로 상수 ---
+# 디렉터리는 import 시점이 아니라 실제로 파일을 쓰는 곳에서 필요할 때 생성합니다(시작 속도).
 APP_DIR   = app_root()
 CACHE_DIR = APP_DIR / "cache"
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # ffmpeg 실행 파일이 위치할 디렉터리
 FFMPEG_DIR = APP_DIR / "ffmpeg-bin"
-FFMPEG_DIR.mkdir(parents=True, exist_ok=True)
 
 # 프로그램의 설정을 저장하고 불러올 JSON 파일의 경로입니다.
 SETTINGS_PATH = APP_DIR / "settings.json"
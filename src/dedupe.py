@@ -0,0 +1,50 @@
+# dedupe.py
+# 저해상도 프레임 비교로 중복 프레임을 골라내는 분석 패스.
+# 제거된 프레임은 직전 프레임의 표시 시간(GIF 지연)으로 합쳐지므로 재생 타이밍이 유지됩니다.
+from .frame_probe import np, PROBE_W, PROBE_H
+
+# 블록 크기 (PROBE_W x PROBE_H를 8x6 격자로 나눔)
+BLOCK_W, BLOCK_H = 8, 6
+
+# 0~255 밝기 기준 임계값: 화면 전체 평균 차이 / 가장 많이 변한 블록의 평균 차이
+MEAN_THRESHOLD  = 1.5
+BLOCK_THRESHOLD = 6.0
+
+
+def _block_diff(a, b) -> tuple[float, float]:
+    """두 프레임의 (전체 평균 차이, 최대 블록 평균 차이)를 계산합니다."""
+    d = np.abs(a - b)
+    blocks = d.reshape(PROBE_H // BLOCK_H, BLOCK_H, PROBE_W // BLOCK_W, BLOCK_W).mean(axis=(1, 3))
+    return float(d.mean()), float(blocks.max())
+
+
+def find_kept_frames(frames, mean_threshold: float = MEAN_THRESHOLD,
+                     block_threshold: float = BLOCK_THRESHOLD) -> list[int]:
+    """
+    분석 프레임 배열(frame_probe.load_probe_frames)에서 남길 프레임 번호 목록을 반환합니다.
+    - 비교 대상은 '직전에 남긴 프레임'이므로 느린 변화가 누적되어도 놓치지 않습니다.
+    - 작은 영역의 움직임(커서, 숫자 등)도 살리기 위해 블록 단위 최대 차이를 함께 봅니다.
+    - 마지막 프레임은 항상 남깁니다. GIF의 마지막 프레임 지연은 한 프레임 길이뿐이라, 끝부분의 멈춘 화면을
+      지우면 그만큼 재생 시간이 짧아집니다(남긴 마지막 프레임까지의 시간은 직전 프레임 지연으로 합쳐짐).
+    """
+    n = len(frames)
+    if n == 0:
+        return []
+
+    # 인접 프레임 차이를 한 번에 계산해 확실히 바뀐 프레임은 바로 유지합니다.
+    step = np.abs(frames[1:] - frames[:-1]).reshape(
+        n - 1, PROBE_H // BLOCK_H, BLOCK_H, PROBE_W // BLOCK_W, BLOCK_W).mean(axis=(2, 4))
+    changed = (step.mean(axis=(1, 2)) >= mean_threshold) | (step.max(axis=(1, 2)) >= block_threshold)
+
+    kept = [0]
+    for i in range(1, n):
+        if changed[i - 1]:
+            kept.append(i)
+            continue
+        # 인접 차이는 작아도 마지막으로 남긴 프레임과는 많이 달라졌을 수 있습니다.
+        mean_d, block_d = _block_diff(frames[i], frames[kept[-1]])
+        if mean_d >= mean_threshold or block_d >= block_threshold:
+            kept.append(i)
+    if kept[-1] != n - 1:
+        kept.append(n - 1)
+    return kept
@@ -0,0 +1,214 @@
+# downloader.py
+# ffmpeg 자동 설치용 다운로더: 다중 연결(Range) 병렬 다운로드 + 이어받기 + 체크섬 검증.
+#   - 서버가 Range를 지원하면 파일을 connections개 구간으로 나눠 동시에 받습니다.
+#   - 구간마다 <dest>.partN 파일에 쓰므로, 실패해도 다음 실행에서 받은 만큼 이어받습니다.
+#   - 체크섬(.sha256/.md5 또는 checksums 목록 파일)이 있으면 압축 해제 전에 검증합니다.
+import hashlib, json, re, threading, urllib.error, urllib.parse, urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+CHUNK = 1024 * 256
+MIN_SPLIT_BYTES = 4 * 1024 * 1024   # 이보다 작은 파일은 나누지 않습니다.
+USER_AGENT = "ApexGifMaker-Downloader"
+
+
+def _request(url: str, byte_range: tuple[int, int | None] | None = None):
+    headers = {"User-Agent": USER_AGENT}
+    if byte_range is not None:
+        a, b = byte_range
+        headers["Range"] = f"bytes={a}-" + ("" if b is None else str(b))
+    return urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=30)
+
+
+def probe(url: str) -> tuple[int, bool]:
+    """(전체 크기, Range 지원 여부)를 반환합니다. 크기를 모르면 0."""
+    try:
+        with _request(url, (0, 0)) as resp:
+            m = re.match(r"bytes 0-0/(\d+)", resp.headers.get("Content-Range", ""))
+            if resp.status == 206 and m:
+                return int(m.group(1)), True
+            return int(resp.headers.get("Content-Length", "0") or 0), False
+    except urllib.error.HTTPError as e:
+        if e.code == 416:  # 빈 파일 등 Range를 거부하는 경우
+            return 0, False
+        raise
+
+
+class _Progress:
+    """여러 스레드의 진행량을 합쳐 5% 단위로 로그를 남깁니다."""
+    def __init__(self, total: int, done: int, log):
+        self.total, self.done, self.log = total, done, log
+        self._lock = threading.Lock()
+        self._last = -1
+
+    def add(self, n: int):
+        with self._lock:
+            self.done += n
+            if not self.total:
+                return
+            pct = int(self.done * 100 / self.total)
+            if pct // 5 != self._last // 5:
+                self._last = pct
+                self.log(f"[DL] {pct}%")
+
+
+def _fetch_part(url: str, part: Path, start: int, end: int, progress: _Progress):
+    """[start, end] 구간을 part 파일에 이어서 받습니다(이미 받은 만큼은 건너뜀)."""
+    have = part.stat().st_size if part.exists() else 0
+    need = end - start + 1
+    if have >= need:
+        return
+    with _request(url, (start + have, end)) as resp, open(part, "ab") as out:
+        if resp.status != 206:
+            raise RuntimeError("server ignored Range request")
+        while True:
+            chunk = resp.read(CHUNK)
+            if not chunk: break
+            out.write(chunk)
+            progress.add(len(chunk))
+    if part.stat().st_size != need:
+        raise RuntimeError(f"incomplete part {part.name}")
+
+
+def _parts_plan(total: int, connections: int) -> list[tuple[int, int]]:
+    n = max(1, min(connections, total // MIN_SPLIT_BYTES or 1))
+    size = -(-total // n)
+    return [(i * size, min(total, (i + 1) * size) - 1) for i in range(n)]
+
+
+def _load_plan(state_path: Path, url: str, total: int) -> list | None:
+    try:
+        st = json.loads(state_path.read_text(encoding="utf-8"))
+        if st.get("url") == url and st.get("total") == total:
+            return [tuple(r) for r in st["ranges"]]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _cleanup(dest: Path):
+    for p in dest.parent.glob(dest.name + ".part*"):
+        try: p.unlink()
+        except OSError: pass
+
+
+def _single_stream(url: str, dest: Path, resumable: bool, total: int, state_path: Path, log) -> None:
+    """
+    Range를 나눌 수 없을 때: 하나의 연결로 받되, 가능하면 이어받습니다.
+    - 계획 파일의 URL/크기가 같을 때만 이어받습니다(다른 URL이 남긴 .part0에 이어 쓰지 않음).
+    """
+    part = dest.with_name(dest.name + ".part0")
+    if not (resumable and part.exists() and _load_plan(state_path, url, total) is not None):
+        _cleanup(dest)
+        if resumable:
+            state_path.write_text(json.dumps({"url": url, "total": total, "ranges": [(0, total - 1)]}),
+                                  encoding="utf-8")
+    have = part.stat().st_size if part.exists() else 0
+    progress = _Progress(total, have, log)
+    with _request(url, (have, None) if have else None) as resp:
+        mode = "ab" if have and resp.status == 206 else "wb"
+        if mode == "wb":
+            progress.done = 0
+        with open(part, mode) as out:
+            while True:
+                chunk = resp.read(CHUNK)
+                if not chunk: break
+                out.write(chunk)
+                progress.add(len(chunk))
+    part.replace(dest)
+
+
+def download(url: str, dest: Path, log=lambda *_: None, connections: int = 4,
+             checksum_url: str | None = None) -> bool:
+    """
+    url을 dest로 받습니다. 성공(및 체크섬 일치) 시 True.
+    - 실패 시 부분 파일(<dest>.partN)과 계획 파일(<dest>.parts.json)을 남겨 다음 호출에서 이어받습니다.
+    - checksum_url이 주어졌는데 값이 다르면 받은 파일을 모두 지우고 False를 반환합니다.
+    """
+    dest = Path(dest)
+    state_path = dest.with_name(dest.name + ".parts.json")
+    try:
+        total, ranged = probe(url)
+        if ranged and total >= MIN_SPLIT_BYTES and connections > 1:
+            plan = _load_plan(state_path, url, total)
+            if plan is None:
+                _cleanup(dest)
+                plan = _parts_plan(total, connections)
+                state_path.write_text(json.dumps({"url": url, "total": total, "ranges": plan}), encoding="utf-8")
+            parts = [dest.with_name(f"{dest.name}.part{i}") for i in range(len(plan))]
+            have = sum(p.stat().st_size for p in parts if p.exists())
+            if have:
+                log(f"[DL] 이어받기: {have * 100 // total}% 부터")
+            log(f"[DL] {len(plan)}개 연결로 다운로드 ({total / 1048576:.1f} MB)")
+            progress = _Progress(total, have, log)
+            with ThreadPoolExecutor(max_workers=len(plan)) as ex:
+                futures = [ex.submit(_fetch_part, url, p, a, b, progress) for p, (a, b) in zip(parts, plan)]
+                for f in futures:
+                    f.result()
+            with open(dest, "wb") as out:
+                for p in parts:
+                    with open(p, "rb") as src:
+                        while True:
+                            chunk = src.read(1024 * 1024)
+                            if not chunk: break
+                            out.write(chunk)
+            _cleanup(dest)
+        else:
+            _single_stream(url, dest, ranged, total, state_path, log)
+        try: state_path.unlink()
+        except OSError: pass
+        log(f"[DL] 다운로드 완료: {url}")
+    except Exception as e:
+        log(f"[DL] err: {e} (다음 시도 때 이어받습니다)")
+        return False
+
+    name = Path(urllib.parse.urlparse(url).path).name
+    if checksum_url and not verify_checksum(dest, checksum_url, log, name=name):
+        try: dest.unlink()
+        except OSError: pass
+        return False
+    return True
+
+
+def _expected_digest(text: str, filename: str, hex_len: int) -> str | None:
+    """'<hex>' 단독 파일 또는 '<hex>  <파일명>' 목록 파일에서 기대 해시를 찾습니다."""
+    pattern = re.compile(rf"\b([0-9a-fA-F]{{{hex_len}}})\b")
+    lines = [ln for ln in text.splitlines() if ln.strip()]
+    for ln in lines:
+        if filename in ln:
+            m = pattern.search(ln)
+            if m: return m.group(1).lower()
+    if len(lines) == 1:
+        m = pattern.search(lines[0])
+        if m: return m.group(1).lower()
+    return None
+
+
+def verify_checksum(path: Path, checksum_url: str, log=lambda *_: None, name: str | None = None) -> bool:
+    """
+    체크섬 파일을 받아 path의 해시와 비교합니다. (.md5면 MD5, 그 외는 SHA-256)
+    - name: 목록형 체크섬 파일에서 찾을 원래 파일명 (기본: path의 파일명)
+    - 체크섬 파일을 받을 수 없거나 해당 항목이 없으면 경고만 남기고 통과시킵니다.
+    """
+    algo, hex_len = ("md5", 32) if checksum_url.lower().endswith(".md5") else ("sha256", 64)
+    try:
+        with _request(checksum_url) as resp:
+            text = resp.read(1024 * 1024).decode("utf-8", "ignore")
+    except Exception as e:
+        log(f"[WARN] 체크섬 파일을 받을 수 없어 검증을 건너뜁니다: {e}")
+        return True
+    expected = _expected_digest(text, name or Path(path).name, hex_len)
+    if not expected:
+        log("[WARN] 체크섬 항목을 찾지 못해 검증을 건너뜁니다.")
+        return True
+    h = hashlib.new(algo)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk: break
+            h.update(chunk)
+    if h.hexdigest() != expected:
+        log(f"[ERR] 체크섬 불일치({algo}): 받은 파일이 손상되었습니다.")
+        return False
+    log(f"[OK] 체크섬 확인({algo})")
+    return True
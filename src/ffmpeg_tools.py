@@ -1,68 +1,261 @@
 # ffmpeg_tools.py
-import os, stat, shutil, platform, zipfile, tarfile, urllib.request, subprocess
+# zipfile/tarfile/urllib은 ffmpeg 자동 설치 때만 필요하므로 해당 함수 안에서 불러옵니다(시작 속도).
+import hashlib, os, stat, shutil, platform, subprocess, threading, time
 from pathlib import Path
 from typing import List
 from .constants import CACHE_DIR, FFMPEG_DIR
+from . import telemetry
+
+_exe_cache: dict[str, str] = {}
 
 def find_executable(name: str) -> str:
     """
     로컬 ffmpeg-bin 디렉터리 또는 시스템 PATH에서 실행 파일 경로를 찾습니다.
     - name: 'ffmpeg' 또는 'ffprobe'
+    - 찾은 경로는 기억해 두고 재사용합니다(설치 후에는 forget_executables()로 초기화).
     """
+    cached = _exe_cache.get(name)
+    if cached and os.path.exists(cached):
+        return cached
+
     # 1. 앱과 함께 배포된 로컬 디렉터리를 우선적으로 확인합니다.
     local = FFMPEG_DIR / (name + (".exe" if os.name == "nt" else ""))
     if local.exists():
-        return str(local)
-    
-    # 2. 로컬 디렉터리에 없으면, 시스템 환경 변수(PATH)에 등록된 위치를 탐색합니다.
-    return shutil.which(name) or ""
+        found = str(local)
+    else:
+        # 2. 로컬 디렉터리에 없으면, 시스템 환경 변수(PATH)에 등록된 위치를 탐색합니다.
+        found = shutil.which(name) or ""
+    if found:
+        _exe_cache[name] = found
+    return found
 
-def run_quiet(cmd: list[str]):
-    """
-    콘솔 창(터미널)을 띄우지 않고 외부 명령어를 실행하고 결과를 반환합니다.
-    - cmd: 실행할 명령어와 인자 리스트
-    """
-    # 자식 프로세스의 표준 출력/에러를 캡처하기 위한 공통 옵션
-    kw = dict(capture_output=True, text=True, encoding='utf-8', errors='ignore')
-    
+def forget_executables():
+    """기억해 둔 실행 파일 경로와 기능 정보를 비웁니다(ffmpeg 자동 설치 직후 호출)."""
+    from . import capabilities
+    _exe_cache.clear()
+    capabilities.forget()
+
+def _quiet_kwargs() -> dict:
+    """Windows에서 자식 프로세스의 콘솔 창이 뜨지 않도록 하는 공통 옵션을 반환합니다."""
+    kw = {}
     # Windows 환경에서 실행 시 검은색 cmd 창이 깜빡이는 것을 방지합니다.
     if os.name == "nt":
         kw["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0)
         si = subprocess.STARTUPINFO(); si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
         kw["startupinfo"] = si
-        
-    return subprocess.run(cmd, **kw)
+    return kw
+
+def _run_wait4(cmd: list[str], text: bool, stdout=None, **kw):
+    """
+    POSIX 전용: 자식 프로세스를 직접 os.wait4로 회수하여 그 프로세스만의 자원 사용량을 얻습니다.
+    (getrusage(RUSAGE_CHILDREN)은 누적값이라 동시 실행 시 서로 섞이기 때문)
+    - stdout: 표준 출력을 보낼 파일 객체 (None이면 메모리로 캡처)
+    """
+    proc = subprocess.Popen(cmd, stdout=stdout or subprocess.PIPE, stderr=subprocess.PIPE, **kw)
+    bufs = {}
+    def drain(name, f):
+        bufs[name] = f.read(); f.close()
+    readers = [threading.Thread(target=drain, args=("err", proc.stderr), daemon=True)]
+    if stdout is None:
+        readers.append(threading.Thread(target=drain, args=("out", proc.stdout), daemon=True))
+    for th in readers: th.start()
+    for th in readers: th.join()
+    _, status, ru = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    out, err = bufs.get("out", b""), bufs.get("err", b"")
+    if text:
+        out, err = out.decode("utf-8", "ignore"), err.decode("utf-8", "ignore")
+    return subprocess.CompletedProcess(cmd, proc.returncode, out, err), telemetry.usage_from_rusage(ru)
+
+def _run_span(cmd: list[str], kind: str, text: bool = False, stdout=None, outputs=()):
+    """
+    외부 명령을 실행하고(출력 캡처) 실행 시간·CPU·최대 RSS를 span으로 기록합니다(telemetry).
+    - stdout: 표준 출력을 메모리 대신 이 파일 객체로 바로 씁니다(대용량 raw 출력용)
+    - outputs: 명령이 쓰는 출력 파일 경로들 (span의 out_bytes, 없으면 0)
+    """
+    started = time.perf_counter()
+    if hasattr(os, "wait4"):
+        p, usage = _run_wait4(cmd, text, stdout=stdout, **_quiet_kwargs())
+    else:
+        kw = dict(text=True, encoding='utf-8', errors='ignore') if text else {}
+        pipes = dict(stdout=stdout, stderr=subprocess.PIPE) if stdout else dict(capture_output=True)
+        p, usage = subprocess.run(cmd, **pipes, **kw, **_quiet_kwargs()), None
+    telemetry.record(kind, cmd, time.perf_counter() - started, usage, p, outputs)
+    return p
+
+def run_quiet(cmd: list[str], kind: str = "other", outputs=()):
+    """
+    콘솔 창(터미널)을 띄우지 않고 외부 명령어를 실행하고 결과를 반환합니다.
+    - cmd: 실행할 명령어와 인자 리스트
+    - kind: 실행 기록(span)에 남길 명령 종류 (probe, preview, thumbs, pass1, pass2, playback 등)
+    - outputs: 명령이 쓰는 출력 파일 경로들 (실행 기록의 출력 크기, 조회 명령은 생략)
+    """
+    # 자식 프로세스의 표준 출력/에러를 텍스트로 캡처합니다.
+    return _run_span(cmd, kind, text=True, outputs=outputs)
+
+def output_paths(cmd: list[str]) -> list[str]:
+    """
+    이 모듈이 만든 변환 명령(build_gif_commands_auto, build_export_commands 등)의 출력 파일 경로들.
+    이 명령들은 출력마다 바로 앞에 '-y'를 둡니다.
+    """
+    return [str(cmd[i + 1]) for i, a in enumerate(cmd[:-1]) if a == "-y"]
+
+def read_raw_frames(ffmpeg_path: str, video_path: str, start: float, duration: float,
+                    fps: float, w: int, h: int, pix_fmt: str = "gray", input_args=None) -> bytes:
+    """
+    지정 구간을 fps로 샘플링하고 w x h로 축소한 원시(raw) 프레임 바이트를 반환합니다.
+    - 분석용 저해상도 패스 전용입니다. (pix_fmt: 'gray' 또는 'rgb24')
+    - input_args: 원본 대신 사용할 입력 옵션 (range_cache.RangeSource.input_args())
+    """
+    inp = input_args or ["-ss", f"{start:.3f}", "-t", f"{duration:.3f}", "-i", video_path]
+    cmd = [ffmpeg_path, "-hide_banner", "-loglevel", "error", *inp,
+           "-vf", f"fps={fps},scale={w}:{h}:flags=area,format={pix_fmt}",
+           "-f", "rawvideo", "-pix_fmt", pix_fmt, "-"]
+    p = _run_span(cmd, "analysis")
+    if p.returncode != 0:
+        raise RuntimeError(p.stderr.decode("utf-8", "ignore").strip() or "raw decode failed")
+    return p.stdout
+
+def raw_frames_filter(fps: float, w: int, h: int, pix_fmt: str = "gray", scale_flags: str = "area") -> str:
+    """분석용 원시 프레임 필터 (stream_raw_frames와 analysis_decode가 같은 프레임을 얻도록 공유)."""
+    return f"fps={fps},scale={w}:{h}:flags={scale_flags},format={pix_fmt}"
+
+def stream_raw_frames(ffmpeg_path: str, video_path: str, fps: float, w: int, h: int,
+                      chunk_frames: int, pix_fmt: str = "gray", kind: str = "analysis",
+                      scale_flags: str = "area"):
+    """
+    영상 전체를 fps로 샘플링한 w x h 원시 프레임을 chunk_frames개씩 bytes로 내보내는 제너레이터입니다.
+    - 긴 영상도 메모리에 한꺼번에 담지 않고 읽는 즉시 처리할 수 있습니다(백그라운드 분석용).
+    - 소비 측에서 중간에 멈추면(close) ffmpeg 프로세스를 종료합니다.
+    - scale_flags: 축소 방식 (밝기 분석은 area, 색 분포 분석은 출력과 같은 lanczos)
+    """
+    bpp = 3 if pix_fmt == "rgb24" else 1
+    cmd = [ffmpeg_path, "-hide_banner", "-loglevel", "error", "-i", video_path,
+           "-vf", raw_frames_filter(fps, w, h, pix_fmt, scale_flags),
+           "-f", "rawvideo", "-pix_fmt", pix_fmt, "-"]
+    yield from stream_stdout(cmd, w * h * bpp * chunk_frames, kind)
+
+def stream_stdout(cmd: list[str], chunk_bytes: int, kind: str = "analysis", outputs=(), status=None):
+    """
+    cmd의 표준 출력을 chunk_bytes씩 bytes로 내보내는 제너레이터입니다(마지막 조각은 짧을 수 있음).
+    - 소비 측에서 중간에 멈추면(close) 프로세스를 종료합니다.
+    - outputs: 표준 출력 외에 명령이 쓰는 파일들 (실행 기록의 출력 크기)
+    - status: dict를 주면 끝난 뒤 "rc"에 종료 코드를 넣습니다(중단되면 None).
+    """
+    started = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, **_quiet_kwargs())
+    finished = False
+    try:
+        while True:
+            buf = proc.stdout.read(chunk_bytes)
+            if not buf:
+                break
+            yield buf
+        finished = True
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+        if status is not None:
+            status["rc"] = proc.returncode if finished else None
+        telemetry.record(kind, cmd, time.perf_counter() - started, None, proc, outputs)
 
 def probe_duration_sec(ffprobe_path: str, video_path: str) -> float:
     """ffprobe를 사용하여 동영상의 총 길이를 초 단위로 반환합니다."""
     p = run_quiet([ffprobe_path, "-v", "error", "-show_entries", "format=duration",
-                   "-of", "default=noprint_wrappers=1:nokey=1", video_path])
+                   "-of", "default=noprint_wrappers=1:nokey=1", video_path], kind="probe")
     if p.returncode != 0:
         raise RuntimeError(p.stderr.strip() or "ffprobe failed")
     return float(p.stdout.strip())
 
-def extract_preview_frame(ffmpeg_path: str, video_path: str, ts: float) -> Path:
+def probe_video_size(ffprobe_path: str, video_path: str) -> tuple[int, int]:
+    """ffprobe로 첫 비디오 스트림의 (가로, 세로)를 반환합니다(회전 메타데이터 미반영)."""
+    p = run_quiet([ffprobe_path, "-v", "error", "-select_streams", "v:0",
+                   "-show_entries", "stream=width,height", "-of", "csv=p=0:s=x", video_path], kind="probe")
+    if p.returncode != 0:
+        raise RuntimeError(p.stderr.strip() or "ffprobe failed")
+    w, h = p.stdout.strip().splitlines()[0].split("x")[:2]
+    return int(w), int(h)
+
+def probe_frame_rate(ffprobe_path: str, video_path: str) -> float:
     """
-    동영상의 특정 시간(timestamp)에서 프레임을 추출하여 이미지 파일로 저장하고 경로를 반환합니다.
-    - ts: 추출할 시간 (초)
+    첫 비디오 스트림의 프레임 레이트를 반환합니다(r_frame_rate, 없으면 avg_frame_rate). 알 수 없으면 0.
+    - 타임라인을 실제 프레임 시각에 맞추는 데 사용합니다.
+    """
+    p = run_quiet([ffprobe_path, "-v", "error", "-select_streams", "v:0",
+                   "-show_entries", "stream=r_frame_rate,avg_frame_rate",
+                   "-of", "default=noprint_wrappers=1:nokey=1", video_path], kind="probe")
+    if p.returncode != 0:
+        return 0.0
+    for rate in p.stdout.split():
+        num, _, den = rate.partition("/")
+        try:
+            fps = float(num) / float(den or 1)
+        except (ValueError, ZeroDivisionError):
+            continue
+        if 0 < fps <= 1000:  # 일부 컨테이너의 90000/1 같은 타임베이스 값은 제외
+            return fps
+    return 0.0
+
+def preview_frame_cmd(ffmpeg_path: str, video_path: str, ts: float) -> tuple[list[str], Path]:
+    """
+    프리뷰 프레임 추출 명령과 결과 파일 경로를 반환합니다(비동기 실행기 등에서 직접 실행할 때 사용).
+    - 결과 파일이 이미 있으면(캐시) 명령은 빈 리스트입니다.
     """
     w, h = 1280, 720  # 프리뷰 이미지는 1280x720 해상도로 고정
     out_dir = CACHE_DIR / "previews"
     out_dir.mkdir(parents=True, exist_ok=True)
     
     # 동일한 영상, 동일한 시간의 요청에 대해 캐시된 이미지를 재사용하기 위해 고유 파일명 생성
-    out_path = out_dir / f"preview_{abs(hash((video_path, round(ts,3), f'{w}x{h}')))}.png"
+    # (hash()는 실행마다 값이 달라지므로 sha1을 사용해 재시작 후에도 같은 파일을 찾습니다)
+    st = os.stat(video_path)
+    ident = f"{video_path}|{st.st_size}|{st.st_mtime_ns}|{ts:.3f}|{w}x{h}"
+    out_path = out_dir / f"preview_{hashlib.sha1(ident.encode('utf-8')).hexdigest()[:20]}.png"
     if out_path.exists():
+        return [], out_path
+    return [ffmpeg_path, "-hide_banner", "-loglevel", "error",
+            "-ss", f"{ts:.3f}", "-i", video_path,
+            "-frames:v", "1", "-vf", f"scale={w}:{h}:flags=lanczos",
+            "-y", str(out_path)], out_path
+
+def extract_preview_frame(ffmpeg_path: str, video_path: str, ts: float) -> Path:
+    """
+    동영상의 특정 시간(timestamp)에서 프레임을 추출하여 이미지 파일로 저장하고 경로를 반환합니다.
+    - ts: 추출할 시간 (초)
+    """
+    cmd, out_path = preview_frame_cmd(ffmpeg_path, video_path, ts)
+    if not cmd:
         return out_path
-        
-    p = run_quiet([ffmpeg_path, "-hide_banner", "-loglevel", "error",
-                   "-ss", f"{ts:.3f}", "-i", video_path,
-                   "-frames:v", "1", "-vf", f"scale={w}:{h}:flags=lanczos",
-                   "-y", str(out_path)])
+    p = run_quiet(cmd, kind="preview", outputs=[out_path])
     if p.returncode != 0:
         raise RuntimeError(p.stderr.strip() or "preview failed")
     return out_path
 
+def clear_timeline_thumbs(thumbs_dir: Path):
+    """타임라인 썸네일 디렉터리의 이전 썸네일들을 삭제합니다."""
+    thumbs_dir.mkdir(parents=True, exist_ok=True)
+    for fp in thumbs_dir.glob("thumb_*.png"):
+        try: fp.unlink()
+        except OSError: pass
+
+def build_timeline_thumbs(ffmpeg_path: str, video_path: str, duration: float, cells: int,
+                          thumbs_dir: Path, log=lambda *_: None, thread_args=None) -> list[Path]:
+    """
+    영상 전체를 cells개 구간으로 나눈 간격으로 타임라인 썸네일(가로 320px)을 생성하고 파일 목록을 반환합니다.
+    - thumbs_dir의 이전 썸네일은 먼저 삭제됩니다.
+    - thread_args: autotune.thread_args() 결과 (ffmpeg 바로 뒤에 삽입)
+    """
+    clear_timeline_thumbs(thumbs_dir)
+    fps_val = max(0.01, cells / max(1e-9, duration))
+
+    vf = f"fps={fps_val:.6f},scale=320:-1:flags=lanczos"
+    cmd = [ffmpeg_path, *(thread_args or []), "-hide_banner", "-loglevel", "error",
+           "-i", video_path, "-vf", vf, str(thumbs_dir / "thumb_%05d.png")]
+    log("[RUN] thumbs(adaptive): " + " ".join(map(str, cmd)))
+    run_quiet(cmd, kind="thumbs", outputs=[thumbs_dir])
+    return sorted(thumbs_dir.glob("thumb_*.png"))
+
 def build_filters(width: int, height: int, mode: str, fps: int, extra: str = "") -> str:
     """GIF 생성 옵션에 따라 ffmpeg의 비디오 필터(-vf) 문자열을 조합합니다."""
     if mode == "letterbox":
@@ -81,31 +274,342 @@ def build_filters(width: int, height: int, mode: str, fps: int, extra: str = "")
     base = f"fps={fps},{scale}{post}"
     return f"{base},{extra}" if extra else base
 
-def build_gif_commands_auto(ffmpeg_path, video_path, start, end, fps, w, h, mode, alg, dither, out_path) -> List[list[str]]:
+# 팔레트 샘플링(Pass 1 가속): 'full'은 모든 프레임을 출력 크기로, 'fast'는 일부 프레임만 줄인 크기로,
+# 'auto'는 긴 구간/큰 출력일 때만 샘플링합니다. 팔레트 품질 비교: python -m src.palette_check
+# ('index'는 color_index의 색 인덱스로 팔레트를 바로 만들어 Pass 1 자체를 생략합니다.)
+PALETTE_SAMPLE_FRAMES = 90            # 샘플링 시 목표 프레임 수
+PALETTE_SAMPLE_MIN_FPS = 2
+PALETTE_SAMPLE_MAX_PIXELS = 320 * 180  # 샘플 프레임의 최대 픽셀 수 (넘으면 비율 유지해 축소)
+PALETTE_AUTO_MIN_FRAMES = 180          # auto: 전체 프레임 수가 이보다 적고 출력이 작으면 전체 분석
+
+def palette_sampling(sample: str, duration: float, fps: float, w: int, h: int):
+    """
+    Pass 1에서 분석할 (fps, 가로, 세로)를 정합니다. 전체 분석이면 None.
+    - 시간 방향으로는 약 PALETTE_SAMPLE_FRAMES장(최소 초당 2장), 공간으로는 PALETTE_SAMPLE_MAX_PIXELS 이하로 줄입니다.
+    - 'index'(색 인덱스 팔레트)인데 팔레트를 못 만들어 Pass 1을 돌리게 되면 'auto'처럼 동작합니다.
+    """
+    if sample == "index":
+        sample = "auto"
+    if sample not in ("auto", "fast") or duration <= 0:
+        return None
+    if sample == "auto" and duration * fps <= PALETTE_AUTO_MIN_FRAMES and w * h <= PALETTE_SAMPLE_MAX_PIXELS:
+        return None
+    sfps = min(float(fps), max(PALETTE_SAMPLE_MIN_FPS, PALETTE_SAMPLE_FRAMES / duration))
+    k = min(1.0, (PALETTE_SAMPLE_MAX_PIXELS / (w * h)) ** 0.5)
+    pw, ph = max(8, int(w * k) // 2 * 2), max(8, int(h * k) // 2 * 2)
+    if sfps >= fps and (pw, ph) == (w, h):
+        return None
+    return round(sfps, 3), pw, ph
+
+def _palette_chain(vf: str, mode: str, sampling) -> str:
+    """Pass 1 필터: 샘플링하지 않으면 Pass 2와 같은 vf, 샘플링하면 줄인 fps/크기 (중복 제거 select는 생략)."""
+    if sampling is None:
+        return vf
+    sfps, pw, ph = sampling
+    # 축소 시 색을 섞지 않도록 최근접 샘플링(실제 픽셀 색만 팔레트 통계에 들어감)
+    return build_filters(pw, ph, mode, sfps).replace("flags=lanczos", "flags=neighbor")
+
+def select_frames_expr(keep_frames: list[int]) -> str:
+    """
+    유지할 프레임 번호 목록을 연속 구간으로 묶어 select 필터 표현식으로 만듭니다.
+    마지막 구간은 끝을 열어 두어(gte), 분석 프레임보다 실제 프레임이 몇 장 더 나와도 끝부분이 잘리지 않습니다.
+    """
+    runs = []
+    for n in sorted(keep_frames):
+        if runs and n == runs[-1][1] + 1:
+            runs[-1][1] = n
+        else:
+            runs.append([n, n])
+    terms = [f"eq(n,{a})" if a == b else f"between(n,{a},{b})" for a, b in runs[:-1]]
+    if runs:
+        terms.append(f"gte(n,{runs[-1][0]})")
+    return "select='" + "+".join(terms) + "'"
+
+def _graph_args(ffmpeg_path: str, option: str, graph: str, name: str, work_dir=None) -> list[str]:
+    """
+    필터 그래프가 너무 길면(명령줄 길이 제한) 스크립트 파일로 저장하여 전달합니다.
+    - option: '-vf' 또는 '-lavfi' (파일 전달 옵션 이름은 ffmpeg 버전에 맞게 고릅니다)
+    - work_dir: 스크립트 파일을 둘 폴더 (기본: CACHE_DIR)
+    """
+    if len(graph) < 4000:
+        return [option, graph]
+    from .capabilities import script_flag
+    work_dir = Path(work_dir or CACHE_DIR)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    script = work_dir / f"{name}.txt"
+    script.write_text(graph, encoding="utf-8")
+    return [script_flag(ffmpeg_path, option), str(script)]
+
+def _scene_bounds(duration: float, scene_cuts) -> list[tuple[float, float | None]]:
+    """장면 전환 시각 목록을 (시작, 끝) trim 구간 목록으로 바꿉니다. 마지막 구간의 끝은 None(끝까지)."""
+    edges = [0.0, *sorted(c for c in scene_cuts if 0.0 < c < duration)]
+    return [(a, edges[i + 1] if i + 1 < len(edges) else None) for i, a in enumerate(edges)]
+
+def _trim(a: float, b) -> str:
+    return f"trim=start={a:.6f}" + (f":end={b:.6f}" if b is not None else "")
+
+# 여러 구간 사이의 간격이 이보다 짧으면 한 입력으로 이어서 디코딩하고, 길면 구간마다 따로 탐색(-ss)합니다.
+SEGMENT_SEEK_GAP_SEC = 10.0
+
+def _segment_source(video_path: str, segments) -> tuple[list[str], str, float]:
+    """
+    여러 (시작, 끝) 구간을 하나의 필터 그래프로 이어 붙이는 입력 옵션과 그래프 앞부분을 만듭니다.
+    - 반환: (입력 옵션, 그래프 앞부분(뒤에 필터를 바로 이어 쓸 수 있음), 전체 길이)
+    - 가까운 구간끼리는 입력 하나를 split/trim으로 나눠 쓰므로 원본을 한 번만 열고 디코딩합니다.
+    """
+    segs = sorted((float(a), float(b)) for a, b in segments if b > a)
+    groups = []
+    for a, b in segs:
+        if groups and a - groups[-1][-1][1] <= SEGMENT_SEEK_GAP_SEC:
+            groups[-1].append((a, b))
+        else:
+            groups.append([(a, b)])
+
+    inputs, parts, labels = [], [], []
+    for k, grp in enumerate(groups):
+        g0, g1 = grp[0][0], max(b for _, b in grp)
+        inputs += ["-ss", f"{g0:.3f}", "-t", f"{g1 - g0:.3f}", "-i", video_path]
+        names = [f"g{k}_{j}" for j in range(len(grp))]
+        if len(grp) > 1:
+            parts.append(f"[{k}:v]split={len(grp)}" + "".join(f"[{nm}]" for nm in names))
+        for nm, (a, b) in zip(names, grp):
+            src = f"[{nm}]" if len(grp) > 1 else f"[{k}:v]"
+            parts.append(f"{src}{_trim(a - g0, b - g0)},setpts=PTS-STARTPTS[c{nm}]")
+            labels.append(f"[c{nm}]")
+    prefix = ";".join(parts) + ";" + "".join(labels) + f"concat=n={len(labels)}:v=1:a=0,"
+    return inputs, prefix, sum(b - a for a, b in segs)
+
+def build_gif_commands_auto(ffmpeg_path, video_path, start, end, fps, w, h, mode, alg, dither, out_path,
+                            keep_frames=None, scene_cuts=None, thread_args=None,
+                            palette_out=None, segments=None, source=None,
+                            palette_sample: str = "full", palette_path=None, work_dir=None,
+                            diff_rect: bool = False, frame_window=None) -> List[list[str]]:
     """
     고품질 GIF 생성을 위한 2-Pass ffmpeg 명령어 리스트를 생성합니다.
     - Pass 1: 영상에 최적화된 256색 팔레트 생성
     - Pass 2: 생성된 팔레트를 사용하여 GIF 변환
+    - keep_frames: 중복 제거 분석(dedupe.find_kept_frames) 결과. 남은 프레임은 원래 타임스탬프를
+      유지하므로, 제거된 프레임의 시간은 직전 프레임의 GIF 지연 시간으로 합쳐집니다.
+    - scene_cuts: 장면 전환 시각(scenes.find_scene_cuts). 주어지면 장면마다 팔레트를 따로 만들고
+      Pass 2에서 장면별로 paletteuse 후 이어 붙입니다(GIF 로컬 색상표).
+    - thread_args: autotune.thread_args() 결과 (ffmpeg 바로 뒤에 삽입)
+    - palette_out: Pass 1 팔레트 파일 경로 (동시에 여러 작업을 돌릴 때 겹치지 않도록 지정)
+    - work_dir: 작업 파일(기본 팔레트, 긴 필터 그래프 스크립트)을 둘 폴더. 동시에 도는 작업마다
+      다른 폴더를 주면 파일이 겹치지 않습니다(기본: CACHE_DIR).
+    - segments: 여러 (시작, 끝) 구간(초). 2개 이상이면 start/end 대신 사용하며, 구간들을 한 그래프에서
+      trim/concat으로 이어 붙이고 팔레트도 전체에서 한 번만 만듭니다(구간 간 색 일관성).
+      keep_frames의 프레임 번호와 scene_cuts 시각은 이어 붙인 결과 기준입니다.
+    - source: range_cache.RangeSource. 주어지면 원본 대신 미리 디코딩해 둔 구간 파일을 읽습니다
+      (start/end/segments는 이미 반영되어 있으므로 무시).
+    - palette_sample: 'full' | 'auto' | 'fast' — Pass 1을 일부 프레임/축소 크기로 분석할지(palette_sampling)
+    - palette_path: 미리 만든 팔레트 PNG(color_index 등). 주어지면 Pass 1을 생략하고 Pass 2 명령 하나만
+      반환합니다(scene_cuts는 무시하고 이 팔레트 하나를 사용).
+    - diff_rect: paletteuse diff_mode=rectangle 사용 (capabilities.paletteuse_extra, 기본 끔)
+    - frame_window: (a, b) — fps 필터가 만든 출력 프레임 중 번호(입력 시작 기준) [a, b)만 내보냅니다(b가 None이면 끝까지).
+      번호는 fps 필터의 타임스탬프로 세므로 시작 프레임이 빠져도 어긋나지 않습니다(gif_parallel 조각용).
+    - 옵션 문법(-fps_mode/-vsync, 스크립트 파일)과 paletteuse 옵션은 capabilities 조회 결과를 따릅니다.
     """
-    duration = max(0.0, end - start)
+    from . import capabilities as caps
+    if source is not None:
+        seek, src, duration = source.input_args(), "", source.duration
+    elif segments and len(segments) > 1:
+        seek, src, duration = _segment_source(video_path, segments)
+    else:
+        if segments:
+            start, end = segments[0]
+        duration = max(0.0, end - start)
+        # 입력 -t는 첫 프레임 시각부터 재므로, 끝 경계가 시작 위치와 원본 프레임의 어긋남에 따라 한 장씩 달라집니다.
+        # 끝은 탐색 위치 기준 trim으로 정확히 자르고 -t는 읽는 양만 제한합니다(gif_parallel 조각과 같은 끝 경계).
+        ss = round(start, 3)
+        seek = ["-ss", f"{ss:.3f}", "-t", f"{duration + 0.1:.3f}", "-i", video_path]
+        src = f"[0:v]trim=end={end - ss:.6f},"
     if duration <= 0: raise ValueError("Invalid time range")
+    n_in = seek.count("-i")
     
     # 프레임 제거 알고리즘(dedupe) 적용 시 추가 필터
-    extra = "" if alg == "even" else "mpdecimate,setpts=N/FRAME_RATE/TB"
+    # setpts로 타임스탬프를 다시 매기지 않고 vfr로 출력해야 재생 타이밍이 유지됩니다.
+    if alg == "even":
+        extra = ""
+    elif keep_frames is not None:
+        extra = select_frames_expr(keep_frames)
+    elif caps.has_filter(ffmpeg_path, "mpdecimate"):
+        extra = "mpdecimate"
+    else:
+        extra = ""  # mpdecimate가 없는 빌드: 중복 제거 없이 변환
+    if frame_window is not None:
+        a, b = frame_window
+        window = f"trim=start_pts={a}" + (f":end_pts={b}" if b is not None else "") + ",setpts=PTS-STARTPTS"
+        extra = f"{window},{extra}" if extra else window
     vf = build_filters(w, h, mode, fps, extra)
+    vf1 = _palette_chain(vf, mode, palette_sampling(palette_sample, duration, fps, w, h))
+    vsync = [] if alg == "even" else caps.vfr_args(ffmpeg_path)
+    puse = f"paletteuse=dither={dither}{caps.paletteuse_extra(ffmpeg_path, diff_rect)}"
+    head = [ffmpeg_path, *(thread_args or []), "-hide_banner", "-loglevel", "error"]
+    palette = Path(palette_out) if palette_out else Path(work_dir or CACHE_DIR) / "palette.png"
+    palette.parent.mkdir(parents=True, exist_ok=True)
+
+    scenes = _scene_bounds(duration, scene_cuts or [])
+    if len(scenes) > 1 and not palette_path:
+        n = len(scenes)
+        palettes = [str(palette.with_name(f"{palette.stem}_{i}.png")) for i in range(n)]
+        split = f"{src or '[0:v]'}{vf},split={n}" + "".join(f"[s{i}]" for i in range(n))
+        split1 = f"{src or '[0:v]'}{vf1},split={n}" + "".join(f"[s{i}]" for i in range(n))
+
+        # Pass 1: 한 번의 디코딩으로 장면별 팔레트를 동시에 생성
+        g1 = ";".join([split1] + [f"[s{i}]{_trim(a, b)},palettegen=stats_mode=full[p{i}]"
+                                  for i, (a, b) in enumerate(scenes)])
+        outs = []
+        for i, pal in enumerate(palettes):
+            outs += ["-map", f"[p{i}]", "-frames:v", "1", "-y", pal]
+        pass1 = [*head, *seek, *_graph_args(ffmpeg_path, "-lavfi", g1, "pass1_graph", work_dir), *outs]
+
+        # Pass 2: 장면마다 자기 팔레트로 양자화한 뒤 concat (장면 내부 시간은 0부터 다시 시작)
+        inputs = []
+        for pal in palettes:
+            inputs += ["-i", pal]
+        g2 = [split]
+        for i, (a, b) in enumerate(scenes):
+            g2.append(f"[s{i}]{_trim(a, b)},setpts=PTS-STARTPTS[t{i}];"
+                      f"[t{i}][{n_in + i}:v]{puse}[u{i}]")
+        g2.append("".join(f"[u{i}]" for i in range(n)) + f"concat=n={n}:v=1:a=0")
+        pass2 = [*head, *seek, *inputs,
+                 *_graph_args(ffmpeg_path, "-lavfi", ";".join(g2), "pass2_graph", work_dir),
+                 *vsync, "-loop", "0", "-y", out_path]
+        return [pass1, pass2]
+
+    palette = str(palette_path or palette)
     
-    palette = str(CACHE_DIR / "palette.png")
-    
-    # Pass 1: 최적의 색상 팔레트 생성 명령어
-    pass1 = [ffmpeg_path, "-hide_banner", "-loglevel", "error", "-ss", f"{start:.3f}", "-t", f"{duration:.3f}",
-             "-i", video_path, "-vf", f"{vf},palettegen=stats_mode=full", "-y", palette]
+    # Pass 1: 최적의 색상 팔레트 생성 명령어 (여러 구간이면 이어 붙인 전체에서 하나의 팔레트)
+    pass1 = [*head, *seek,
+             *_graph_args(ffmpeg_path, "-lavfi" if src else "-vf",
+                          f"{src}{vf1},palettegen=stats_mode=full", "pass1_graph", work_dir), "-y", palette]
              
     # Pass 2: 생성된 팔레트를 사용하여 최종 GIF 생성 명령어
-    pass2 = [ffmpeg_path, "-hide_banner", "-loglevel", "error", "-ss", f"{start:.3f}", "-t", f"{duration:.3f}",
-             "-i", video_path, "-i", palette, "-lavfi", f"{vf}[x];[x][1:v]paletteuse=dither={dither}",
-             "-loop", "0", "-y", out_path]
+    pass2 = [*head, *seek, "-i", palette,
+             *_graph_args(ffmpeg_path, "-lavfi", f"{src}{vf}[x];[x][{n_in}:v]{puse}", "pass2_graph", work_dir),
+             *vsync, "-loop", "0", "-y", out_path]
              
-    return [pass1, pass2]
+    return [pass2] if palette_path else [pass1, pass2]
+
+# 동시 출력 형식: 확장자와 인코더 옵션 (GIF는 팔레트 2-Pass 경로를 따로 사용)
+EXPORT_FORMATS = {
+    "gif": ".gif",
+    "webp": ".webp",
+    "apng": ".png",
+    "mp4": ".mp4",
+}
+
+def _encoder_args(ffmpeg_path: str, fmt: str) -> list[str]:
+    """형식별 인코더 옵션. 빌드에 없는 인코더는 가능한 대체 인코더로 바꿉니다(없으면 ValueError)."""
+    from . import capabilities as caps
+    if fmt == "gif":
+        return ["-loop", "0"]
+    if fmt == "webp":
+        if not caps.has_encoder(ffmpeg_path, "libwebp"):
+            raise ValueError("이 ffmpeg 빌드에는 WebP 인코더(libwebp)가 없습니다.")
+        return ["-c:v", "libwebp", "-lossless", "0", "-quality", "80", "-loop", "0"]
+    if fmt == "apng":
+        return ["-c:v", "apng", "-plays", "0", "-f", "apng"]
+    if fmt == "mp4":
+        if caps.has_encoder(ffmpeg_path, "libx264"):
+            enc = ["-c:v", "libx264", "-preset", "veryfast", "-crf", "20"]
+        else:
+            enc = ["-c:v", "mpeg4", "-q:v", "3"]
+        return [*enc, "-pix_fmt", "yuv420p", "-movflags", "+faststart", "-an"]
+    raise ValueError(f"unknown export format: {fmt}")
+
+def build_export_commands(ffmpeg_path, video_path, start, end, fps, mode, alg, dither, outputs,
+                          keep_frames=None, thread_args=None, palette_out=None,
+                          segments=None, source=None, palette_sample: str = "full",
+                          palette_path=None, work_dir=None, diff_rect: bool = False) -> List[list[str]]:
+    """
+    한 번의 디코딩으로 여러 형식/크기(GIF, WebP, APNG, MP4)를 동시에 만드는 명령어 리스트를 생성합니다.
+    - outputs: [{"fmt": 'gif'|'webp'|'apng'|'mp4', "w": 가로, "h": 세로, "path": 출력 경로}, ...]
+    - 원본은 한 번만 디코딩하고 split으로 나눠 출력마다 크기 조절/인코딩합니다.
+    - GIF 출력이 있으면 Pass 1에서 GIF 크기별 팔레트를 한 번에 만들고, 마지막 명령에서 모든 출력을 씁니다.
+    - keep_frames, segments, thread_args, source, palette_sample, work_dir, diff_rect는 build_gif_commands_auto와 같습니다
+      (장면별 팔레트는 미지원). palette_path가 주어지면 Pass 1 없이 모든 GIF 출력이 그 팔레트를 씁니다.
+    """
+    from . import capabilities as caps
+    if not outputs: raise ValueError("no outputs")
+    if source is not None:
+        seek, src, duration = source.input_args(), "[0:v]", source.duration
+    elif segments and len(segments) > 1:
+        seek, src, duration = _segment_source(video_path, segments)
+    else:
+        if segments:
+            start, end = segments[0]
+        duration = max(0.0, end - start)
+        seek, src = ["-ss", f"{start:.3f}", "-t", f"{duration:.3f}", "-i", video_path], "[0:v]"
+    if duration <= 0: raise ValueError("Invalid time range")
+    n_in = seek.count("-i")
+
+    if alg == "even":
+        extra = ""
+    elif keep_frames is not None:
+        extra = select_frames_expr(keep_frames)
+    elif caps.has_filter(ffmpeg_path, "mpdecimate"):
+        extra = "mpdecimate"
+    else:
+        extra = ""
+    vsync = [] if alg == "even" else caps.vfr_args(ffmpeg_path)
+    puse = f"paletteuse=dither={dither}{caps.paletteuse_extra(ffmpeg_path, diff_rect)}"
+    head = [ffmpeg_path, *(thread_args or []), "-hide_banner", "-loglevel", "error"]
+    palette = Path(palette_out) if palette_out else Path(work_dir or CACHE_DIR) / "palette.png"
+    palette.parent.mkdir(parents=True, exist_ok=True)
+
+    n = len(outputs)
+    chains = []
+    for o in outputs:
+        vf = build_filters(o["w"], o["h"], mode, fps, extra)
+        if o["fmt"] == "mp4":
+            vf += ",pad=ceil(iw/2)*2:ceil(ih/2)*2"  # yuv420p는 짝수 크기만 허용
+        chains.append(vf)
+    split = f"{src}split={n}" + "".join(f"[s{i}]" for i in range(n)) if n > 1 else None
+    branch = (lambda i: f"[s{i}]") if n > 1 else (lambda i: src)
+
+    # Pass 1: GIF 출력마다 (크기가 같으면 공유) 팔레트 생성 — 한 번의 디코딩
+    gif_idx = [i for i, o in enumerate(outputs) if o["fmt"] == "gif"]
+    pal_of, pal_files, pal_chains = {}, [], []
+    for i in gif_idx:
+        if palette_path:
+            pal_of[chains[i]] = 0
+            pal_files = [str(palette_path)]
+            continue
+        if chains[i] in pal_of:
+            continue
+        k = len(pal_files)
+        pal_of[chains[i]] = k
+        pal_files.append(str(palette.with_name(f"{palette.stem}_{k}.png")))
+        o = outputs[i]
+        pal_chains.append(_palette_chain(chains[i], mode,
+                                         palette_sampling(palette_sample, duration, fps, o["w"], o["h"])))
+    cmds = []
+    if pal_chains:
+        m = len(pal_files)
+        g1 = [f"{src}split={m}" + "".join(f"[q{k}]" for k in range(m))] if m > 1 else []
+        for k, chain in enumerate(pal_chains):
+            g1.append(f"{f'[q{k}]' if m > 1 else src}{chain},palettegen=stats_mode=full[p{k}]")
+        outs = []
+        for k, pal in enumerate(pal_files):
+            outs += ["-map", f"[p{k}]", "-frames:v", "1", "-y", pal]
+        cmds.append([*head, *seek, *_graph_args(ffmpeg_path, "-lavfi", ";".join(g1), "pass1_graph", work_dir), *outs])
+
+    # Pass 2: 모든 출력을 한 명령에서 인코딩
+    inputs = []
+    for pal in pal_files:
+        inputs += ["-i", pal]
+    g2 = [split] if split else []
+    outs = []
+    for i, o in enumerate(outputs):
+        if o["fmt"] == "gif":
+            g2.append(f"{branch(i)}{chains[i]}[x{i}];[x{i}][{n_in + pal_of[chains[i]]}:v]{puse}[o{i}]")
+        else:
+            g2.append(f"{branch(i)}{chains[i]}[o{i}]")
+        outs += ["-map", f"[o{i}]", *vsync, *_encoder_args(ffmpeg_path, o["fmt"]), "-y", str(o["path"])]
+    cmds.append([*head, *seek, *inputs, *_graph_args(ffmpeg_path, "-lavfi", ";".join(g2), "export_graph", work_dir),
+                 *outs])
+    return cmds
 
 def _onerror_chmod(func, path, excinfo):
     """shutil.rmtree에서 권한 문제 발생 시 파일 권한을 변경하고 재시도하는 헬퍼 함수입니다."""
@@ -115,29 +619,29 @@ def _onerror_chmod(func, path, excinfo):
     except Exception:
         pass
 
-def _download(url: str, dest_path: Path, log=lambda *_: None) -> bool:
-    """주어진 URL의 파일을 다운로드하고 진행률을 로그로 출력합니다."""
-    try:
-        with urllib.request.urlopen(url) as resp, open(dest_path, "wb") as out:
-            total = int(resp.headers.get("Content-Length", "0") or 0); read = 0
-            while True:
-                chunk = resp.read(1024*256)
-                if not chunk: break
-                out.write(chunk); read += len(chunk)
-                if total: log(f"[DL] {int(read*100/total)}%")
-        log(f"[DL] 다운로드 완료: {url}")
-        return True
-    except Exception as e:
-        log(f"[DL] err: {e}")
-        if dest_path.exists():
-            dest_path.unlink()
-        return False
+def _download(url: str, dest_path: Path, log=lambda *_: None, checksum_url: str | None = None) -> bool:
+    """
+    주어진 URL의 파일을 다운로드하고 진행률을 로그로 출력합니다.
+    - 다중 연결/이어받기/체크섬 검증은 downloader.download 참고
+    """
+    from .downloader import download
+    return download(url, dest_path, log, checksum_url=checksum_url)
 
 def auto_setup_ffmpeg(log=lambda *_: None):
     """로컬에 ffmpeg/ffprobe가 없으면 현재 OS에 맞게 자동으로 다운로드 및 준비합니다."""
     if find_executable("ffmpeg") and find_executable("ffprobe"):
         log("[INFO] ffmpeg/ffprobe 준비 완료"); return
+    FFMPEG_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        _install_ffmpeg(log)
+    finally:
+        forget_executables()
+    # ffmpeg-bin에 받아 설치했으면 실패한 대체 URL의 압축 파일/이어받기 조각 등을 한 번 정리합니다.
+    if all(Path(find_executable(n) or "").parent == FFMPEG_DIR for n in ("ffmpeg", "ffprobe")):
+        tidy_ffmpeg_dir(log)
 
+def _install_ffmpeg(log):
+    """현재 OS에 맞는 방법으로 ffmpeg/ffprobe를 설치합니다."""
     os_name = platform.system().lower()
     if "windows" in os_name:
         _setup_windows_ffmpeg(log)
@@ -148,34 +652,78 @@ def auto_setup_ffmpeg(log=lambda *_: None):
     else:
         log("[WARN] 지원하지 않는 OS입니다.")
 
+def _write_member(src, dest: Path, executable: bool):
+    """압축 파일 멤버 스트림을 임시 파일에 쓴 뒤 원자적으로 교체합니다(중간 실패 시 깨진 실행 파일 방지)."""
+    tmp = dest.with_name(dest.name + ".tmp")
+    with open(tmp, "wb") as out:
+        shutil.copyfileobj(src, out, 1024 * 1024)
+    if executable:
+        os.chmod(tmp, 0o755)
+    os.replace(tmp, dest)
+
+def _extract_tools_from_zip(archive: Path, names: set[str], log) -> bool:
+    """
+    zip 중앙 디렉터리(목록)만 읽어 names에 해당하는 멤버만 FFMPEG_DIR 최상위로 풀어냅니다.
+    - 전체 압축 해제 → 탐색 → 복사 → 정리 과정 없이 필요한 두 파일만 디스크에 씁니다.
+    """
+    import zipfile
+    found = set()
+    with zipfile.ZipFile(archive, 'r') as zf:
+        for info in zf.infolist():
+            base = info.filename.rsplit("/", 1)[-1].lower()
+            if info.is_dir() or base not in names or base in found:
+                continue
+            with zf.open(info) as src:
+                _write_member(src, FFMPEG_DIR / base, executable=False)
+            found.add(base)
+            log(f"[OK] 추출: {info.filename}")
+    return found == names
+
+def _extract_tools_from_tar(archive: Path, names: set[str], log) -> bool:
+    """
+    tar(.xz) 스트림을 처음부터 한 번만 읽으면서 names에 해당하는 멤버만 FFMPEG_DIR 최상위로 풀어냅니다.
+    - 스트리밍 모드('r|*')라 압축은 한 번만 풀고, 두 파일을 모두 찾으면 바로 멈춥니다.
+    """
+    import tarfile
+    found = set()
+    with tarfile.open(archive, 'r|*') as tf:
+        for member in tf:
+            base = member.name.rsplit("/", 1)[-1]
+            if not member.isfile() or base not in names or base in found:
+                continue
+            src = tf.extractfile(member)
+            if src is None:
+                continue
+            with src:
+                _write_member(src, FFMPEG_DIR / base, executable=True)
+            found.add(base)
+            log(f"[OK] 추출: {member.name}")
+            if found == names:
+                break
+    return found == names
+
 def _setup_windows_ffmpeg(log):
-    """Windows용 ffmpeg 빌드를 다운로드하고 압축을 해제합니다."""
-    z = FFMPEG_DIR / "ffmpeg-download.zip"
-    
-    # 안정적으로 최신 릴리스를 받을 수 있는 URL 목록
+    """Windows용 ffmpeg 빌드를 다운로드하고 ffmpeg.exe/ffprobe.exe만 추출합니다."""
+    # 안정적으로 최신 릴리스를 받을 수 있는 URL 목록 (URL, 체크섬 파일 URL)
     urls = [
-        "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip",
-        "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip",
+        ("https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip",
+         "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip.sha256"),
+        ("https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip",
+         "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/checksums.sha256"),
     ]
 
-    for url in urls:
+    for url, checksum_url in urls:
         log(f"[DL] {url}")
-        if not _download(url, z, log): continue
+        # URL마다 다른 파일명: 대체 URL이 앞 URL의 이어받기 조각(.partN/.parts.json)을 지우거나 잇지 않도록
+        z = FFMPEG_DIR / url.split("/")[-1]
+        if not _download(url, z, log, checksum_url): continue
         try:
-            with zipfile.ZipFile(z, 'r') as zf:
-                zf.extractall(FFMPEG_DIR)
-            
-            ffmpeg = ffprobe = None
-            for p in FFMPEG_DIR.rglob("*"): # 하위 폴더까지 탐색
-                if p.name.lower() == "ffmpeg.exe": ffmpeg = str(p.resolve())
-                elif p.name.lower() == "ffprobe.exe": ffprobe = str(p.resolve())
-            
-            if ffmpeg and ffprobe:
-                # 실행 파일들을 최상위 ffmpeg-bin 폴더로 복사
-                shutil.copy2(ffmpeg, FFMPEG_DIR / "ffmpeg.exe")
-                shutil.copy2(ffprobe, FFMPEG_DIR / "ffprobe.exe")
-                tidy_ffmpeg_dir(log)
+            ok = _extract_tools_from_zip(z, {"ffmpeg.exe", "ffprobe.exe"}, log)
+            z.unlink()
+            if ok:
+                log("[OK] ffmpeg 준비 완료")
                 return
+            log("[WARN] 압축 파일에 ffmpeg.exe/ffprobe.exe가 없습니다.")
         except Exception as e:
             log(f"[ERR] 압축 해제 실패: {e}")
             
@@ -188,7 +736,7 @@ def _setup_macos_ffmpeg(log):
     if brew:
         log("[INFO] Homebrew를 사용하여 ffmpeg 설치를 시도합니다...")
         try:
-            run_quiet([brew, "install", "ffmpeg"])
+            run_quiet([brew, "install", "ffmpeg"], kind="setup")
         except Exception as e:
             log(f"[ERR] Homebrew 설치 실패: {e}")
     else:
@@ -200,8 +748,8 @@ def _setup_linux_ffmpeg(log):
     if apt:
         log("[INFO] apt-get을 사용하여 ffmpeg 설치를 시도합니다...")
         try:
-            run_quiet(["sudo", "apt-get", "update"])
-            run_quiet(["sudo", "apt-get", "-y", "install", "ffmpeg"])
+            run_quiet(["sudo", "apt-get", "update"], kind="setup")
+            run_quiet(["sudo", "apt-get", "-y", "install", "ffmpeg"], kind="setup")
         except Exception as e:
             log(f"[ERR] apt-get 설치 실패: {e}")
             
@@ -215,19 +763,13 @@ def _setup_linux_ffmpeg(log):
             log(f"[WARN] 지원하지 않는 아키텍처입니다: {arch}"); return
             
         tar = FFMPEG_DIR / url.split("/")[-1]
-        if _download(url, tar, log):
+        if _download(url, tar, log, url + ".md5"):
             try:
-                with tarfile.open(tar, 'r:*') as tf: tf.extractall(FFMPEG_DIR)
-                ffmpeg = ffprobe = None
-                for p in FFMPEG_DIR.rglob("*"):
-                    if p.name == "ffmpeg": ffmpeg = str(p.resolve())
-                    elif p.name == "ffprobe": ffprobe = str(p.resolve())
-                if ffmpeg and ffprobe:
-                    shutil.copy2(ffmpeg, FFMPEG_DIR / "ffmpeg")
-                    shutil.copy2(ffprobe, FFMPEG_DIR / "ffprobe")
-                    os.chmod(FFMPEG_DIR / "ffmpeg", 0o755)
-                    os.chmod(FFMPEG_DIR / "ffprobe", 0o755)
-                    tidy_ffmpeg_dir(log)
+                if _extract_tools_from_tar(tar, {"ffmpeg", "ffprobe"}, log):
+                    log("[OK] ffmpeg 준비 완료")
+                else:
+                    log("[WARN] 압축 파일에 ffmpeg/ffprobe가 없습니다.")
+                tar.unlink()
             except Exception as e:
                 log(f"[ERR] 압축 해제 실패: {e}")
 
@@ -0,0 +1,28 @@
+# frame_probe.py
+# 중복 제거/장면 감지 등 분석 패스가 공유하는 저해상도 프레임 로더.
+from .ffmpeg_tools import read_raw_frames
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 분석 기능은 비활성화되고 ffmpeg 필터로 대체됩니다.
+    np = None
+
+# 분석용 프레임 크기 (16:9, 블록 8x6 단위로 나누어떨어지도록)
+PROBE_W, PROBE_H = 64, 36
+
+
+def load_probe_frames(ffmpeg_path: str, video_path: str, start: float, end: float, fps: float,
+                      source=None):
+    """
+    구간을 fps로 샘플링한 64x36 흑백 프레임 배열(n, H, W, int16)을 반환합니다.
+    - 출력 GIF와 같은 fps로 읽으면 배열 인덱스가 GIF 프레임 번호와 일치합니다.
+    - source: range_cache.RangeSource가 있으면 원본 대신 디코딩된 구간 파일에서 읽습니다.
+    - numpy가 없으면 None을 반환합니다.
+    """
+    if np is None:
+        return None
+    raw = read_raw_frames(ffmpeg_path, video_path, start, max(0.0, end - start), fps, PROBE_W, PROBE_H,
+                          input_args=source.input_args() if source is not None else None)
+    size = PROBE_W * PROBE_H
+    n = len(raw) // size
+    return np.frombuffer(raw, np.uint8, count=n * size).reshape(n, PROBE_H, PROBE_W).astype(np.int16)
@@ -0,0 +1,214 @@
+# gif_parallel.py
+# 구간 분할 병렬 GIF 인코딩: paletteuse/GIF 인코더는 사실상 한 코어만 쓰므로, 긴 구간은 시간 순으로
+# 여러 조각으로 나눠 ffmpeg 프로세스 여러 개가 같은 전역 팔레트로 동시에 인코딩하고,
+# 조각 GIF들의 프레임 블록을 다시 압축하지 않고 그대로 이어 붙여 GIF 하나로 만듭니다.
+#   - 조각 경계는 출력 프레임 경계에 맞춥니다. 지연 시간(GCE delay, 1/100초)은 조각마다 반올림이 다시
+#     시작되므로, 이어 붙일 때 전체 프레임 번호 기준으로 다시 계산해 누적 시간이 어긋나지 않게 합니다.
+#   - 반복(NETSCAPE loop)과 화면 크기/전역 색상표는 첫 조각의 것을 쓰고, 색상표가 다른 조각의 프레임에는
+#     그 조각의 전역 색상표를 로컬 색상표로 붙여 색이 바뀌지 않게 합니다.
+#   - 중복 제거(가변 지연)·장면별 팔레트·추가 출력 형식과 함께일 때는 사용하지 않습니다.
+import math, os, shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .constants import CACHE_DIR
+from .ffmpeg_tools import build_gif_commands_auto, run_quiet
+from . import autotune
+
+PARTS_DIR = CACHE_DIR / "gif_parts"
+PARALLEL_MIN_FRAMES = 240   # 출력 프레임이 이보다 적으면 나누지 않습니다(프로세스 시작 비용이 더 큼)
+MIN_PART_FRAMES = 60
+MAX_PARTS = 8
+PART_LEAD_SEC = 0.5          # 조각 앞뒤로 더 읽는 여유(격자의 첫/끝 프레임이 한 번에 인코딩할 때와 같은 원본 프레임을 고르도록)
+
+
+def plan_parts(duration: float, fps: int, jobs: int | None = None, source=None) -> list[tuple[int, int]]:
+    """
+    출력 프레임 번호 기준 조각 [(시작, 끝)] 목록. 나눌 가치가 없으면 빈 목록.
+    - source(range_cache.RangeSource)가 있으면 조각 경계가 그 파일의 프레임 경계와도 맞도록 정렬합니다.
+    """
+    n = int(round(duration * fps))
+    jobs = jobs or os.cpu_count() or 1
+    parts = min(jobs, MAX_PARTS, n // MIN_PART_FRAMES)
+    if n < PARALLEL_MIN_FRAMES or parts < 2:
+        return []
+    align = fps // math.gcd(fps, source.fps) if source is not None else 1
+    bounds = sorted({min(n, round(n * i / parts / align) * align) for i in range(parts)} | {n})
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _sub_segments(segments, t0: float, t1: float) -> list[tuple[float, float]]:
+    """이어 붙인 타임라인의 [t0, t1) 초를 원본 (시작, 끝) 구간 목록으로 되돌립니다."""
+    out, pos = [], 0.0
+    for a, b in segments:
+        lo, hi = max(t0, pos), min(t1, pos + (b - a))
+        if hi > lo:
+            out.append((a + lo - pos, a + hi - pos))
+        pos += b - a
+    return out
+
+
+def part_commands(ffmpeg_path, video_path, segments, fps, w, h, mode, dither, palette_path, parts,
+                  source=None, thread_args=None, diff_rect: bool = False) -> list[tuple[list[str], Path]]:
+    """
+    조각마다 (paletteuse 명령, 조각 GIF 경로). 모두 같은 palette_path를 쓰고, 긴 그래프 스크립트는 조각별 폴더에 둡니다.
+    - 조각은 한 번에 인코딩할 때와 같은 출력 프레임 격자에서 [f0, f1)번 프레임만 남깁니다(frame_window).
+      시간으로만 자르면 조각 시작이 원본 프레임 경계와 어긋날 때 fps 필터가 한 장을 더 내거나 한 칸 밀려 이음새가 어긋납니다.
+    - 구간 하나: 격자에 맞춰 lead장 앞에서부터 읽어 첫 프레임도 같은 원본 프레임을 고르게 하고, 마지막 조각은 구간 끝
+      (trim으로 자른 같은 끝 경계)까지 그대로 둡니다.
+    - 여러 구간: 구간마다 첫 프레임 기준으로 시각을 다시 매기므로 중간에서 자르면 격자가 달라집니다. 그래서 조각마다
+      처음부터 같은 그래프를 조각 끝까지 디코딩합니다. 앞부분 디코딩은 겹치지만 paletteuse/GIF 인코딩은 나뉩니다.
+    - 미리 디코딩한 파일(source)은 조각 경계가 파일 프레임 경계와 맞으므로(plan_parts) 그 위치부터 읽습니다.
+    """
+    PARTS_DIR.mkdir(parents=True, exist_ok=True)
+    tail = math.ceil(PART_LEAD_SEC * fps)
+    cmds = []
+    for k, (f0, f1) in enumerate(parts):
+        path = PARTS_DIR / f"part_{k}.gif"
+        last = k == len(parts) - 1
+        if source is not None:
+            step, lead = source.fps / fps, 0
+            sub = {"source": source.part(round(f0 * step), source.n if last else min(source.n, round((f1 + tail) * step)))}
+        elif len(segments) == 1:
+            lead = min(f0, tail)
+            sub = {"segments": _sub_segments(segments, (f0 - lead) / fps, math.inf if last else (f1 + tail) / fps)}
+        else:  # 같은 그래프 그대로 (frame_window가 끝나면 ffmpeg도 읽기를 멈춥니다)
+            lead, sub = f0, {"segments": segments}
+        window = (lead, None if last else lead + f1 - f0)
+        cmd = build_gif_commands_auto(ffmpeg_path, video_path, 0.0, 0.0, fps, w, h, mode, "even", dither,
+                                      str(path), thread_args=thread_args, palette_path=palette_path,
+                                      work_dir=PARTS_DIR / f"part_{k}", diff_rect=diff_rect,
+                                      frame_window=window, **sub)
+        cmds.append((cmd[0], path))
+    return cmds
+
+
+# --- GIF 블록 이어 붙이기 ---
+def _skip_sub_blocks(data: bytes, i: int) -> int:
+    """데이터 하위 블록(크기 바이트 + 데이터, 0으로 끝남)을 건너뛴 위치."""
+    while data[i]:
+        i += data[i] + 1
+    return i + 1
+
+
+def _parse_gif(data: bytes):
+    """반환: (헤더+논리 화면 기술자 13바이트, 전역 색상표, [(종류, 블록 바이트)]) — 종류: 'ext'|'app'|'image'"""
+    if data[:6] not in (b"GIF87a", b"GIF89a"):
+        raise ValueError("not a GIF")
+    packed = data[10]
+    gct_len = 3 * (2 << (packed & 7)) if packed & 0x80 else 0
+    head, gct = data[:13], data[13:13 + gct_len]
+    i, blocks = 13 + gct_len, []
+    while i < len(data) and data[i] != 0x3B:
+        start = i
+        if data[i] == 0x21:        # 확장 블록 (0xF9 그래픽 제어, 0xFF 애플리케이션, 0xFE 주석 등)
+            kind = "app" if data[i + 1] in (0xFF, 0xFE) else "ext"
+            i = _skip_sub_blocks(data, i + 2)
+        elif data[i] == 0x2C:      # 이미지 기술자(10바이트) + 로컬 색상표 + LZW 데이터
+            kind = "image"
+            lp = data[i + 9]
+            i += 10 + (3 * (2 << (lp & 7)) if lp & 0x80 else 0)
+            i = _skip_sub_blocks(data, i + 1)
+        else:
+            raise ValueError(f"unexpected GIF block 0x{data[i]:02x} at {i}")
+        blocks.append((kind, data[start:i]))
+    return head, gct, blocks
+
+
+def _with_local_table(image: bytes, gct: bytes) -> bytes:
+    """로컬 색상표가 없는 이미지 블록에 주어진 색상표를 로컬 색상표로 붙입니다."""
+    if image[9] & 0x80 or not gct:
+        return image
+    size_bits = (len(gct) // 3).bit_length() - 2
+    packed = (image[9] & 0x78) | 0x80 | size_bits  # 인터레이스 비트 유지, 정렬 플래그는 끔
+    return image[:9] + bytes([packed]) + gct + image[10:]
+
+
+def _set_delay(gce: bytes, centisec: int) -> bytes:
+    """그래픽 제어 확장(21 F9 04 packed delay(2) transparent 00)의 지연 시간을 바꿉니다."""
+    return gce[:4] + centisec.to_bytes(2, "little") + gce[6:]
+
+
+def concat_gifs(part_paths, out_path, fps: float | None = None) -> int:
+    """
+    조각 GIF들을 순서대로 이어 붙여 out_path에 씁니다. 반환: 전체 프레임 수.
+    - 첫 조각의 헤더/화면 기술자/전역 색상표/애플리케이션 확장(반복 설정)을 쓰고,
+      이후 조각에서는 그래픽 제어 확장과 이미지 블록만 가져옵니다(압축 데이터는 그대로).
+    - fps: 고정 fps면 i번째 프레임의 지연을 (i+1)번째와 i번째 프레임 시각(1/100초, 반올림)의 차로 다시 씁니다.
+    """
+    out, frames, base_gct = bytearray(), 0, None
+    for k, p in enumerate(part_paths):
+        head, gct, blocks = _parse_gif(Path(p).read_bytes())
+        if k == 0:
+            out += head + gct
+            base_gct = gct
+        elif head[6:10] != out[6:10]:
+            raise ValueError("GIF parts have different sizes")
+        for kind, blk in blocks:
+            if kind == "app" and k > 0:
+                continue
+            if kind == "ext" and blk[1] == 0xF9 and fps:
+                cs = lambda i: int(i * 100 / fps + 0.5)  # ffmpeg처럼 0.5는 올림
+                blk = _set_delay(blk, cs(frames + 1) - cs(frames))
+            if kind == "image":
+                frames += 1
+                if gct != base_gct:
+                    blk = _with_local_table(blk, gct)
+            out += blk
+    out += b"\x3B"
+    tmp = Path(out_path).with_name(f".{Path(out_path).name}.tmp")
+    tmp.write_bytes(bytes(out))
+    os.replace(tmp, out_path)
+    return frames
+
+
+def encode(ffmpeg_path: str, video_path: str, segments, fps: int, w: int, h: int, mode: str, dither: str,
+           out_path: str, parts, source=None, palette_path=None, palette_sample: str = "full",
+           diff_rect: bool = False, log=print) -> bool:
+    """
+    전역 팔레트(palette_path가 없으면 Pass 1로 한 번 생성) → 조각 병렬 인코딩 → 이어 붙이기.
+    parts는 plan_parts() 결과입니다. 실패하면 로그를 남기고 False.
+    """
+    start, end = segments[0][0], segments[-1][1]
+    if palette_path is None:
+        palette_path = PARTS_DIR / "palette.png"
+        PARTS_DIR.mkdir(parents=True, exist_ok=True)
+        pass1 = build_gif_commands_auto(ffmpeg_path, video_path, start, end, fps, w, h, mode, "even", dither,
+                                        out_path, thread_args=autotune.thread_args(ffmpeg_path), palette_out=palette_path,
+                                        segments=segments, source=source, palette_sample=palette_sample)[0]
+        log(f"[RUN] Pass 1: {' '.join(map(str, pass1))}")
+        with autotune.job_slot():
+            p = run_quiet(pass1, kind="pass1", outputs=[palette_path])
+        if p.returncode != 0:
+            log(f"[ERR] Pass 1 실패: {p.stderr.strip()[:300]}")
+            return False
+
+    jobs = len(parts)
+    cmds = part_commands(ffmpeg_path, video_path, segments, fps, w, h, mode, dither, palette_path, parts,
+                         source=source, thread_args=autotune.thread_args(ffmpeg_path, jobs), diff_rect=diff_rect)
+    log(f"[RUN] Pass 2: {jobs}개 조각을 동시에 인코딩합니다 "
+        f"({', '.join(f'{a / fps:.1f}~{b / fps:.1f}s' for a, b in parts)})")
+
+    def run(job):
+        cmd, path = job
+        with autotune.job_slot():
+            return run_quiet(cmd, kind="pass2", outputs=[path])
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="gifpart") as pool:
+        results = list(pool.map(run, cmds))
+    try:
+        for k, p in enumerate(results):
+            if p.returncode != 0:
+                log(f"[ERR] 조각 {k + 1} 인코딩 실패: {p.stderr.strip()[:300]}")
+                return False
+        frames = concat_gifs([path for _, path in cmds], out_path, fps)
+        log(f"[INFO] 조각 {jobs}개를 이어 붙였습니다: {frames}프레임")
+        return True
+    except (OSError, ValueError) as e:
+        log(f"[ERR] 조각 이어 붙이기 실패: {e}")
+        return False
+    finally:
+        for _, path in cmds:
+            try: path.unlink()
+            except OSError: pass
+            shutil.rmtree(path.with_suffix(""), ignore_errors=True)
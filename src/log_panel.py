@@ -0,0 +1,89 @@
+# log_panel.py
+# 로그 창: 메시지를 모아 두었다가 타이머로 한 번에 추가하고(최대 줄 수 제한),
+# 전체 로그는 cache/logs/app.log 파일에 그대로 남깁니다(일정 크기를 넘으면 app.log.1로 교체).
+import os, time
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QPlainTextEdit
+
+from .constants import CACHE_DIR
+
+LOG_PATH = CACHE_DIR / "logs" / "app.log"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+
+FLUSH_MS = 100           # 화면 반영 주기
+MAX_BLOCKS = 5000        # 화면에 남길 최대 줄 수 (오래된 줄부터 삭제)
+MAX_VIEW_CHARS = 4000    # 한 메시지가 이보다 길면 화면에는 앞부분만 표시
+
+
+class _RotatingLogFile:
+    """추가 전용 로그 파일. 크기가 max_bytes를 넘으면 .1로 교체합니다."""
+    def __init__(self, path, max_bytes: int):
+        self.path, self.max_bytes = path, max_bytes
+        self._f = None
+
+    def write(self, lines: list[str]):
+        try:
+            if self._f is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._f = open(self.path, "a", encoding="utf-8")
+            if self._f.tell() > self.max_bytes:
+                self._f.close()
+                os.replace(self.path, self.path.with_name(self.path.name + ".1"))
+                self._f = open(self.path, "a", encoding="utf-8")
+            self._f.write("".join(lines))
+            self._f.flush()
+        except OSError:
+            self._f = None  # 파일 기록 실패가 화면 로그를 막지 않도록 무시합니다.
+
+    def close(self):
+        if self._f is not None:
+            try: self._f.close()
+            except OSError: pass
+            self._f = None
+
+
+class LogView(QPlainTextEdit):
+    """
+    append()로 받은 메시지를 버퍼에 모았다가 FLUSH_MS마다 한 번에 화면에 추가합니다.
+    - 메시지마다 레이아웃을 다시 계산하지 않으므로 긴 ffmpeg 출력이 쏟아져도 UI가 멈추지 않습니다.
+    - 화면은 MAX_BLOCKS줄까지만 유지하고, 전체 내용은 LOG_PATH 파일에 남습니다.
+    """
+    def __init__(self, parent=None, log_path=LOG_PATH):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(MAX_BLOCKS)
+        self._pending: list[str] = []
+        self._file = _RotatingLogFile(log_path, LOG_MAX_BYTES) if log_path else None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FLUSH_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def append(self, s: str):
+        self._pending.append(str(s))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        if self._file is not None:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            self._file.write([f"{stamp} {s}\n" for s in batch])
+
+        shown = [s if len(s) <= MAX_VIEW_CHARS else
+                 s[:MAX_VIEW_CHARS] + f"\n… ({len(s) - MAX_VIEW_CHARS}자 생략, 전체: {LOG_PATH.name})"
+                 for s in batch]
+        # 스크롤이 맨 아래에 있을 때만 따라 내려갑니다(QPlainTextEdit 기본 동작).
+        self.appendPlainText("\n".join(shown))
+
+    def clear(self):
+        self._pending.clear()
+        super().clear()
+
+    def close_file(self):
+        """남은 메시지를 기록하고 로그 파일을 닫습니다(프로그램 종료 시)."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
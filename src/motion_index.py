@@ -0,0 +1,158 @@
+# motion_index.py
+# 영상 전체의 초당 움직임/장면 전환 지표(분석 인덱스)와 GIF 구간 추천.
+#   - 영상을 아주 작은 흑백 프레임(64x36, 초당 4장)으로 스트리밍하며 인접 프레임 차이를 계산합니다.
+#   - 결과는 영상별로 cache/analysis/<키>.json에 저장되어 다시 열 때 바로 쓰입니다.
+#   python -m src.motion_index <영상> [--top 5]
+import hashlib, json, os
+from pathlib import Path
+
+from .constants import CACHE_DIR, RECO_MIN, RECO_MAX, TRIM_MIN_SEC, TRIM_MAX_SEC
+from .ffmpeg_tools import stream_raw_frames
+from .frame_probe import np, PROBE_W, PROBE_H
+
+INDEX_DIR = CACHE_DIR / "analysis"
+INDEX_VERSION = 1
+
+ANALYSIS_FPS = 4
+CHUNK_SEC = 30          # 한 번에 처리하는 길이(초)
+
+# 컷 점수 = 해당 초의 최대 프레임 차이 / 주변(±4초) 중앙값. 이 값 이상이면 장면 전환으로 봅니다.
+CUT_SCORE = 4.0
+CUT_MIN_DIFF = 20.0     # 0~255 밝기 기준 최소 차이 (어두운 화면의 작은 변화가 컷으로 잡히지 않도록)
+
+
+def _index_path(video_path: str) -> Path:
+    st = os.stat(video_path)
+    ident = f"{Path(video_path).resolve()}|{st.st_mtime_ns}|{st.st_size}"
+    return INDEX_DIR / f"{hashlib.sha1(ident.encode('utf-8')).hexdigest()[:16]}.json"
+
+
+def load_index(video_path: str) -> dict | None:
+    """저장된 분석 인덱스(같은 파일, 같은 수정 시각)가 있으면 반환합니다."""
+    try:
+        data = json.loads(_index_path(video_path).read_text(encoding="utf-8"))
+        return data if data.get("version") == INDEX_VERSION else None
+    except (OSError, ValueError):
+        return None
+
+
+def build_index(ffmpeg_path: str, video_path: str, should_stop=lambda: False,
+                progress=lambda sec: None) -> dict | None:
+    """
+    영상 전체를 분석해 인덱스를 만들고 저장합니다.
+    - 반환: {"motion": [초당 평균 움직임], "cut": [초당 컷 점수], "seconds": 길이, ...}
+    - should_stop()이 True가 되면 중단하고 None을 반환합니다(ffmpeg도 종료). numpy가 없어도 None.
+    """
+    if np is None:
+        return None
+    chunks = stream_raw_frames(ffmpeg_path, video_path, ANALYSIS_FPS, PROBE_W, PROBE_H,
+                               CHUNK_SEC * ANALYSIS_FPS)
+    return index_from_chunks(video_path, chunks, should_stop, progress)
+
+
+def index_from_chunks(video_path: str, chunks, should_stop=lambda: False,
+                      progress=lambda sec: None) -> dict | None:
+    """
+    PROBE_W x PROBE_H 흑백, 초당 ANALYSIS_FPS장 원시 프레임 조각들(bytes)로 인덱스를 만들고 저장합니다.
+    (build_index와 analysis_decode가 공유. 중단되면 chunks를 닫고 None)
+    """
+    frame_size = PROBE_W * PROBE_H
+    diffs, prev = [], None
+    try:
+        for buf in chunks:
+            if should_stop():
+                return None
+            n = len(buf) // frame_size
+            f = np.frombuffer(buf, np.uint8, count=n * frame_size).reshape(n, PROBE_H, PROBE_W).astype(np.int16)
+            if prev is not None:
+                f = np.concatenate([prev[None], f])
+            if len(f) > 1:
+                diffs.append(np.abs(f[1:] - f[:-1]).mean(axis=(1, 2)))
+            prev = f[-1]
+            progress(sum(len(d) for d in diffs) / ANALYSIS_FPS)
+    finally:
+        chunks.close()
+
+    diff = np.concatenate(diffs) if diffs else np.zeros(0)
+    # 프레임 i→i+1 차이를 (i+1)번째 프레임이 속한 초에 배정
+    seconds = (len(diff) + 1 + ANALYSIS_FPS - 1) // ANALYSIS_FPS
+    per_sec = np.zeros((seconds, ANALYSIS_FPS))
+    flat = np.concatenate([[0.0], diff])
+    per_sec.flat[:len(flat)] = flat
+    motion = per_sec.mean(axis=1)
+    peak = per_sec.max(axis=1)
+
+    # 주변 9초 중앙값 대비 최대 차이 비율 → 컷 점수 (scenes.find_scene_cuts와 같은 방식)
+    if seconds:
+        pad = np.pad(motion, 4, mode="edge")
+        baseline = np.median(np.lib.stride_tricks.sliding_window_view(pad, 9), axis=1)
+        cut = np.where(peak >= CUT_MIN_DIFF, peak / np.maximum(baseline, 1.0), 0.0)
+    else:
+        cut = np.zeros(0)
+
+    index = {"version": INDEX_VERSION, "fps": ANALYSIS_FPS, "seconds": int(seconds),
+             "motion": [round(float(v), 3) for v in motion],
+             "cut": [round(float(v), 3) for v in cut]}
+    path = _index_path(video_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(index), encoding="utf-8")
+    except OSError:
+        pass
+    return index
+
+
+def cut_seconds(index: dict) -> list[int]:
+    """컷 점수가 CUT_SCORE 이상인 초(새 장면이 시작되는 초) 목록."""
+    return [i for i, c in enumerate(index.get("cut", [])) if c >= CUT_SCORE]
+
+
+def suggest_ranges(index: dict, duration: float, count: int = 5) -> list[tuple[float, float, float]]:
+    """
+    움직임이 많은 구간을 추천합니다. 반환: [(시작, 끝, 점수)] (점수 내림차순, 서로 겹치지 않음)
+    - 장면 전환을 가로지르지 않도록 장면 안에서만 고르고, 길이는 RECO_MIN~RECO_MAX(트림 제한 안)로 맞춥니다.
+    - 점수는 구간의 초당 평균 움직임입니다.
+    """
+    motion = np.asarray(index.get("motion", []), dtype=float) if np is not None else None
+    if motion is None or len(motion) == 0:
+        return []
+    n = len(motion)
+    lo_len = int(max(RECO_MIN, TRIM_MIN_SEC))
+    hi_len = int(min(RECO_MAX, TRIM_MAX_SEC))
+    csum = np.concatenate([[0.0], np.cumsum(motion)])
+
+    edges = [0, *cut_seconds(index), n]
+    cands = []
+    for a, b in zip(edges, edges[1:]):
+        span = b - a
+        if span < lo_len:
+            continue  # 추천 최소 길이보다 짧은 장면
+        length = min(hi_len, span)
+        starts = np.arange(a, b - length + 1)
+        scores = (csum[starts + length] - csum[starts]) / length
+        best = int(np.argmax(scores))
+        cands.append((float(starts[best]), float(min(duration, starts[best] + length)), float(scores[best])))
+
+    picked = []
+    for c in sorted(cands, key=lambda c: -c[2]):
+        if all(c[1] <= p[0] or c[0] >= p[1] for p in picked):
+            picked.append(c)
+        if len(picked) >= count:
+            break
+    return picked
+
+
+if __name__ == "__main__":
+    import argparse, sys
+    from .ffmpeg_tools import find_executable
+    ap = argparse.ArgumentParser(prog="python -m src.motion_index", description="움직임/장면 분석 및 구간 추천")
+    ap.add_argument("video")
+    ap.add_argument("--top", type=int, default=5)
+    args = ap.parse_args()
+    ff = find_executable("ffmpeg")
+    if not ff or np is None:
+        print("[ERR] ffmpeg 또는 numpy가 없습니다."); sys.exit(2)
+    idx = load_index(args.video) or build_index(ff, args.video)
+    print(f"[INFO] {idx['seconds']}초, 장면 전환 {len(cut_seconds(idx))}회")
+    for a, b, sc in suggest_ranges(idx, float(idx["seconds"]), args.top):
+        print(f"  {a:7.1f} ~ {b:7.1f}s  움직임 {sc:.2f}")
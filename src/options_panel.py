@@ -4,10 +4,34 @@ from PySide6.QtWidgets import (
     QWidget, QGridLayout, QLabel, QComboBox, QSpinBox, QPushButton
 )
 
+# 콤보박스 인덱스 → ffmpeg 키워드 (설정/프리셋에는 인덱스로 저장됩니다)
+SCALE_KEYS   = {0: "cover", 1: "letterbox", 2: "stretch"}
+DITHER_KEYS  = {0: "floyd_steinberg", 1: "bayer", 2: "none"}
+PALETTE_KEYS = {0: "global", 1: "scene"}
+SAMPLE_KEYS  = {0: "full", 1: "auto", 2: "fast", 3: "index"}
+
+
+def preset_values(opts: dict) -> tuple:
+    """
+    get_options_dict() 형식의 딕셔너리(저장된 프리셋)를 values()와 같은 튜플로 바꿉니다.
+    창 없이 변환할 때(감시 폴더 등) 사용합니다.
+    반환: (mode_idx, fps, w, h, scale, dither, palette_mode, palette_sample, fixed_palette)
+      - fixed_palette: 고정 팔레트 키(palette_library) 또는 ""(영상마다 팔레트 생성)
+    """
+    return (int(opts.get("mode_idx", 0)), int(opts.get("fps", 12)),
+            int(opts.get("width", 160)), int(opts.get("height", 80)),
+            SCALE_KEYS.get(opts.get("scale_idx", 0), "cover"),
+            DITHER_KEYS.get(opts.get("dither_idx", 0), "floyd_steinberg"),
+            PALETTE_KEYS.get(opts.get("palette_idx", 0), "global"),
+            SAMPLE_KEYS.get(opts.get("palette_sample_idx", 0), "full"),
+            str(opts.get("fixed_palette", "") or ""))
+
+
 class OptionsPanel(QWidget):
     """GIF 생성에 필요한 모든 옵션(모드, FPS, 해상도 등)을 설정하는 UI 패널입니다."""
     
     ditherHelp = Signal()
+    savePalette = Signal()   # 현재 구간에서 팔레트를 만들어 라이브러리에 저장 (MainWindow가 처리)
 
     def __init__(self, lang: str = "ko", parent=None):
         super().__init__(parent)
@@ -47,6 +71,40 @@ class OptionsPanel(QWidget):
         self.combo_dither.setItemData(1, "규칙적인 격자 패턴(선명)", Qt.ToolTipRole)
         self.combo_dither.setItemData(2, "디더링 없음(또렷하지만 색상 경계 발생 가능)", Qt.ToolTipRole)
 
+        self.combo_palette = QComboBox()
+        self.combo_palette.addItems([
+            "전역(구간 전체)" if lang == "ko" else "Global (whole range)",
+            "장면별" if lang == "ko" else "Per scene",
+        ])
+        self.combo_palette.setItemData(0, "구간 전체에서 256색 팔레트 하나를 만듭니다", Qt.ToolTipRole)
+        self.combo_palette.setItemData(1, "장면 전환을 감지해 장면마다 팔레트를 따로 만듭니다(컷이 있는 구간에 유리)", Qt.ToolTipRole)
+
+        self.combo_sample = QComboBox()
+        self.combo_sample.addItems([
+            "전체 프레임" if lang == "ko" else "All frames",
+            "자동" if lang == "ko" else "Auto",
+            "샘플(빠름)" if lang == "ko" else "Sampled (fast)",
+            "색 인덱스(즉시)" if lang == "ko" else "Colour index (instant)",
+        ])
+        self.combo_sample.setItemData(0, "구간의 모든 프레임을 출력 크기로 분석합니다(가장 정확)", Qt.ToolTipRole)
+        self.combo_sample.setItemData(1, "긴 구간/큰 출력일 때만 일부 프레임을 줄인 크기로 분석합니다", Qt.ToolTipRole)
+        self.combo_sample.setItemData(2, "항상 일부 프레임을 줄인 크기로 분석합니다(팔레트 생성이 훨씬 빠름)", Qt.ToolTipRole)
+        self.combo_sample.setItemData(3, "영상을 불러올 때 만든 초당 색 인덱스로 팔레트를 바로 만듭니다(Pass 1 생략, 준비 전에는 자동)", Qt.ToolTipRole)
+
+        # 고정 팔레트(palette_library): 선택하면 Pass 1 없이 그 팔레트로 바로 양자화합니다.
+        self.combo_fixed = QComboBox()
+        self.combo_fixed.setToolTip("정해 둔 팔레트를 쓰면 팔레트 생성 단계가 생략되고 여러 GIF의 색이 같아집니다"
+                                    if lang == "ko" else
+                                    "A fixed palette skips palette generation and keeps colours uniform across GIFs")
+        self.btn_save_palette = QPushButton("저장…" if lang == "ko" else "Save…")
+        self.btn_save_palette.setToolTip("현재 구간에서 팔레트를 만들어 이름을 붙여 저장합니다"
+                                         if lang == "ko" else "Build a palette from the current range and save it")
+        self.btn_del_palette = QPushButton("삭제" if lang == "ko" else "Delete")
+        self.btn_save_palette.clicked.connect(self.savePalette.emit)
+        self.btn_del_palette.clicked.connect(self._delete_palette)
+        self.combo_fixed.currentIndexChanged.connect(self._on_fixed_changed)
+        self.refresh_palettes()
+
         self.btn_dither_help = QPushButton("?")
         self.btn_dither_help.setObjectName("HelpBubble")
         self.btn_dither_help.setCursor(Qt.PointingHandCursor)
@@ -68,6 +126,9 @@ class OptionsPanel(QWidget):
         lbl_h      = QLabel("세로:" if lang == "ko" else "Height:")
         lbl_scale  = QLabel("스케일:" if lang == "ko" else "Scale:")
         lbl_dither = QLabel("디더링" if lang == "ko" else "Dithering:")
+        lbl_palette = QLabel("팔레트:" if lang == "ko" else "Palette:")
+        lbl_sample  = QLabel("팔레트 분석:" if lang == "ko" else "Palette analysis:")
+        lbl_fixed   = QLabel("고정 팔레트:" if lang == "ko" else "Fixed palette:")
         g.addWidget(lbl_mode,     0, 0); g.addWidget(self.combo_mode, 0, 1)
         g.addWidget(lbl_fps,      0, 2); g.addWidget(self.spin_fps,   0, 3)
         g.addWidget(lbl_w,        0, 4); g.addWidget(self.spin_w,     0, 5)
@@ -75,14 +136,16 @@ class OptionsPanel(QWidget):
         g.addWidget(lbl_scale,    1, 0); g.addWidget(self.combo_scale,   1, 1, 1, 3)
         g.addWidget(lbl_dither,   1, 4); g.addWidget(self.btn_dither_help, 1, 5)
         g.addWidget(self.combo_dither,   1, 6, 1, 2)
+        g.addWidget(lbl_palette,  2, 0); g.addWidget(self.combo_palette, 2, 1, 1, 3)
+        g.addWidget(lbl_sample,   2, 4, 1, 2); g.addWidget(self.combo_sample, 2, 6, 1, 2)
+        g.addWidget(lbl_fixed,    3, 0); g.addWidget(self.combo_fixed, 3, 1, 1, 3)
+        g.addWidget(self.btn_save_palette, 3, 4, 1, 2); g.addWidget(self.btn_del_palette, 3, 6, 1, 2)
         g.setColumnStretch(1, 1); g.setColumnStretch(7, 1)
 
     def values(self) -> tuple:
         """GIF 생성 로직에 필요한 값들을 ffmpeg 키워드로 변환하여 반환합니다."""
-        scale_map = { 0: "cover", 1: "letterbox", 2: "stretch" }
-        scale_mode = scale_map.get(self.combo_scale.currentIndex(), "cover")
-        dither_map = { 0: "floyd_steinberg", 1: "bayer", 2: "none" }
-        dither_key = dither_map.get(self.combo_dither.currentIndex(), "floyd_steinberg")
+        scale_mode = SCALE_KEYS.get(self.combo_scale.currentIndex(), "cover")
+        dither_key = DITHER_KEYS.get(self.combo_dither.currentIndex(), "floyd_steinberg")
         
         mode_idx = self.combo_mode.currentIndex()
         fps = self.spin_fps.value()
@@ -91,6 +154,43 @@ class OptionsPanel(QWidget):
 
         return mode_idx, fps, w, h, scale_mode, dither_key
 
+    def palette_mode(self) -> str:
+        """팔레트 생성 방식 키를 반환합니다: 'global' | 'scene'"""
+        return PALETTE_KEYS.get(self.combo_palette.currentIndex(), "global")
+
+    def palette_sample(self) -> str:
+        """팔레트(Pass 1) 분석 범위 키를 반환합니다: 'full' | 'auto' | 'fast' | 'index'"""
+        return SAMPLE_KEYS.get(self.combo_sample.currentIndex(), "full")
+
+    def fixed_palette(self) -> str:
+        """선택한 고정 팔레트 키('builtin:…' | 'user:…'), 영상마다 생성이면 ""."""
+        return self.combo_fixed.currentData() or ""
+
+    def refresh_palettes(self, select: str | None = None):
+        """팔레트 목록을 다시 읽습니다. select가 없으면 현재 선택을 유지합니다(없어졌으면 '사용 안 함')."""
+        from .palette_library import list_palettes
+        keep = self.fixed_palette() if select is None else select
+        self.combo_fixed.blockSignals(True)
+        self.combo_fixed.clear()
+        self.combo_fixed.addItem("사용 안 함(영상마다 생성)" if self.lang == "ko" else "None (per video)", "")
+        for key, label in list_palettes(self.lang):
+            self.combo_fixed.addItem(label, key)
+        self.combo_fixed.setCurrentIndex(max(0, self.combo_fixed.findData(keep)))
+        self.combo_fixed.blockSignals(False)
+        self._on_fixed_changed()
+
+    def _on_fixed_changed(self, *_):
+        key = self.fixed_palette()
+        # 고정 팔레트를 쓰면 팔레트 생성 방식/분석 옵션은 적용되지 않습니다.
+        self.combo_palette.setEnabled(not key)
+        self.combo_sample.setEnabled(not key)
+        self.btn_del_palette.setEnabled(key.startswith("user:"))
+
+    def _delete_palette(self):
+        from .palette_library import delete
+        if delete(self.fixed_palette()):
+            self.refresh_palettes(select="")
+
     # ▼▼▼ 추가된 부분: 설정 로드/저장을 위한 메소드들 ▼▼▼
     def set_values(self, opts: dict):
         """
@@ -106,6 +206,9 @@ class OptionsPanel(QWidget):
         self.spin_h.setValue(opts.get("height", 80))
         self.combo_scale.setCurrentIndex(opts.get("scale_idx", 0))
         self.combo_dither.setCurrentIndex(opts.get("dither_idx", 0))
+        self.combo_palette.setCurrentIndex(opts.get("palette_idx", 0))
+        self.combo_sample.setCurrentIndex(opts.get("palette_sample_idx", 0))
+        self.refresh_palettes(select=opts.get("fixed_palette", ""))
 
     def get_options_dict(self) -> dict:
         """
@@ -119,5 +222,8 @@ class OptionsPanel(QWidget):
             "height": self.spin_h.value(),
             "scale_idx": self.combo_scale.currentIndex(),
             "dither_idx": self.combo_dither.currentIndex(),
+            "palette_idx": self.combo_palette.currentIndex(),
+            "palette_sample_idx": self.combo_sample.currentIndex(),
+            "fixed_palette": self.fixed_palette(),
         }
     # ▲▲▲ 추가 완료 ▲▲▲
\ No newline at end of file
@@ -1,9 +1,11 @@
 # output_panel.py
 from PySide6.QtCore import Signal, Qt
 from PySide6.QtWidgets import (
-    QWidget, QGridLayout, QLabel, QLineEdit, QPushButton
+    QWidget, QGridLayout, QLabel, QLineEdit, QPushButton, QCheckBox, QHBoxLayout, QSpinBox
 )
 
+FORMAT_MAX_W = 3840
+
 class OutputPanel(QWidget):
     chooseClicked = Signal()
     generateClicked = Signal()
@@ -28,6 +30,34 @@ class OutputPanel(QWidget):
         g.addWidget(self.btn_choose, 0, 4)
         g.addWidget(self.btn_generate, 0, 5)
 
+        # 같은 구간을 GIF와 함께 다른 형식으로도 저장(한 번의 디코딩으로 동시 인코딩)
+        # 형식마다 가로 크기를 따로 정할 수 있습니다(0 = GIF와 같음, 세로는 GIF 비율을 따름).
+        self.chk_formats = {
+            "webp": QCheckBox("WebP"),
+            "apng": QCheckBox("APNG"),
+            "mp4": QCheckBox("MP4"),
+        }
+        self.spin_widths = {}
+        fmt_row = QHBoxLayout()
+        fmt_row.setSpacing(12)
+        for k, chk in self.chk_formats.items():
+            chk.setToolTip("GIF와 같은 이름으로 함께 저장합니다" if self.lang == "ko"
+                           else "Also save with the GIF's name")
+            sp = QSpinBox()
+            sp.setRange(0, FORMAT_MAX_W)
+            sp.setSingleStep(16)
+            sp.setSuffix(" px")
+            sp.setSpecialValueText("GIF 크기" if self.lang == "ko" else "GIF size")
+            sp.setToolTip("가로 크기 (0 = GIF와 같음)" if self.lang == "ko" else "Width (0 = same as GIF)")
+            sp.setEnabled(False)
+            chk.toggled.connect(sp.setEnabled)
+            self.spin_widths[k] = sp
+            fmt_row.addWidget(chk)
+            fmt_row.addWidget(sp)
+        fmt_row.addStretch(1)
+        g.addWidget(QLabel("추가 출력:" if self.lang == "ko" else "Also:"), 1, 0)
+        g.addLayout(fmt_row, 1, 1, 1, 5)
+
         self.btn_choose.clicked.connect(self.chooseClicked.emit)
         self.btn_generate.clicked.connect(self.generateClicked.emit)
 
@@ -35,6 +65,22 @@ class OutputPanel(QWidget):
     def set_path(self, p: str): self.ed_out.setText(p)
     def get_path(self) -> str:  return self.ed_out.text().strip()
 
+    def extra_formats(self) -> list[str]:
+        """GIF와 함께 저장할 형식 키 목록: 'webp' | 'apng' | 'mp4'"""
+        return [k for k, chk in self.chk_formats.items() if chk.isChecked()]
+
+    def set_extra_formats(self, fmts):
+        for k, chk in self.chk_formats.items():
+            chk.setChecked(k in (fmts or []))
+
+    def format_widths(self) -> dict[str, int]:
+        """형식별 가로 크기 {키: 픽셀}. 0이면 GIF와 같은 크기입니다."""
+        return {k: sp.value() for k, sp in self.spin_widths.items()}
+
+    def set_format_widths(self, widths):
+        for k, sp in self.spin_widths.items():
+            sp.setValue(int((widths or {}).get(k, 0)))
+
     def apply_texts(self, tr):
         self.btn_choose.setText(tr("choose") if tr else ("저장 위치..." if self.lang=="ko" else "Choose…"))
         self.btn_generate.setText(tr("generate") if tr else ("GIF 생성" if self.lang=="ko" else "Generate GIF"))
@@ -0,0 +1,100 @@
+# palette_check.py
+# 팔레트 샘플링 품질 확인: 같은 구간에서 전체 분석 팔레트와 샘플링 팔레트를 만들어
+# Pass 1 시간과 양자화 품질(디더링 없이 가장 가까운 색으로 바꿨을 때의 PSNR)을 비교합니다.
+#   python -m src.palette_check <영상> --start 0 --end 10 [--fps 12 --width 160 --height 80 --sample auto]
+import math, time
+
+from .constants import CACHE_DIR
+from .ffmpeg_tools import (
+    _run_span, build_filters, build_gif_commands_auto, palette_sampling
+)
+from .frame_probe import np
+
+CHECK_DIR = CACHE_DIR / "palette_check"
+MAX_DB_LOSS = 1.0   # 샘플링 팔레트의 PSNR이 이보다 더 떨어지면 경고 (palettegen 자체 편차가 0.5 dB 안팎)
+CHECK_PIXELS = 300_000  # PSNR 계산에 쓰는 최대 픽셀 수 (전체 프레임에서 고르게 뽑음)
+
+
+def _raw_rgb(cmd: list[str]) -> bytes:
+    p = _run_span(cmd, "palette_check")
+    if p.returncode != 0:
+        raise RuntimeError(p.stderr.decode("utf-8", "ignore").strip() or "decode failed")
+    return p.stdout
+
+
+def _quant_psnr(frames, palette) -> float:
+    """프레임(n, h, w, 3)을 팔레트(k, 3)의 가장 가까운 색으로 바꿨을 때의 PSNR(dB)."""
+    px = frames.reshape(-1, 3)
+    px = px[::max(1, len(px) // CHECK_PIXELS)].astype(np.float32)
+    pal = palette.astype(np.float32)
+    pal_sq = (pal ** 2).sum(axis=1)
+    err = 0.0
+    for i in range(0, len(px), 65536):  # 메모리를 아끼기 위해 나눠서 계산
+        x = px[i:i + 65536]
+        # |x - c|^2 = |x|^2 - 2x·c + |c|^2 (행렬 곱으로 한 번에)
+        d = (x ** 2).sum(axis=1)[:, None] - 2 * x @ pal.T + pal_sq[None, :]
+        err += float(np.maximum(d.min(axis=1), 0).sum())
+    mse = err / max(1, px.size)
+    return 99.0 if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+
+def quality_check(ffmpeg_path: str, video_path: str, start: float, end: float, fps: int, w: int, h: int,
+                  mode: str = "cover", sample: str = "auto") -> dict:
+    """
+    반환: {"plan": 샘플링 (fps, w, h) 또는 None, "full": {"sec", "psnr"}, "sampled": {"sec", "psnr"}, "ok": bool}
+    numpy가 없으면 RuntimeError.
+    """
+    if np is None:
+        raise RuntimeError("numpy가 필요합니다.")
+    CHECK_DIR.mkdir(parents=True, exist_ok=True)
+    result = {"plan": palette_sampling(sample, end - start, fps, w, h)}
+    for name, how in (("full", "full"), ("sampled", sample)):
+        pal = CHECK_DIR / f"palette_{name}.png"
+        pass1 = build_gif_commands_auto(ffmpeg_path, video_path, start, end, fps, w, h, mode, "even", "none",
+                                        str(CHECK_DIR / "unused.gif"), palette_out=pal, palette_sample=how)[0]
+        t0 = time.perf_counter()
+        p = _run_span(pass1, "pass1", outputs=[pal])
+        sec = time.perf_counter() - t0
+        if p.returncode != 0:
+            raise RuntimeError(p.stderr.decode("utf-8", "ignore").strip() or "palettegen failed")
+        colors = np.frombuffer(_raw_rgb([ffmpeg_path, "-hide_banner", "-loglevel", "error", "-i", str(pal),
+                                         "-f", "rawvideo", "-pix_fmt", "rgb24", "-"]), np.uint8).reshape(-1, 3)
+        result[name] = {"sec": sec, "palette": np.unique(colors, axis=0)}
+
+    # 기준 프레임: 출력과 같은 fps/크기로 만든 원본(양자화 전)
+    raw = _raw_rgb([ffmpeg_path, "-hide_banner", "-loglevel", "error",
+                    "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}", "-i", video_path,
+                    "-vf", build_filters(w, h, mode, fps), "-f", "rawvideo", "-pix_fmt", "rgb24", "-"])
+    frames = np.frombuffer(raw, np.uint8)[:len(raw) // (w * h * 3) * w * h * 3].reshape(-1, h, w, 3)
+    for name in ("full", "sampled"):
+        result[name]["psnr"] = _quant_psnr(frames, result[name].pop("palette"))
+    result["ok"] = result["full"]["psnr"] - result["sampled"]["psnr"] <= MAX_DB_LOSS
+    return result
+
+
+if __name__ == "__main__":
+    import argparse, sys
+    from .ffmpeg_tools import find_executable
+    ap = argparse.ArgumentParser(prog="python -m src.palette_check", description="팔레트 샘플링 품질/속도 비교")
+    ap.add_argument("video")
+    ap.add_argument("--start", type=float, default=0.0)
+    ap.add_argument("--end", type=float, default=10.0)
+    ap.add_argument("--fps", type=int, default=12)
+    ap.add_argument("--width", type=int, default=160)
+    ap.add_argument("--height", type=int, default=80)
+    ap.add_argument("--mode", default="cover", choices=["cover", "letterbox", "stretch"])
+    ap.add_argument("--sample", default="auto", choices=["auto", "fast"])
+    args = ap.parse_args()
+    ff = find_executable("ffmpeg")
+    if not ff:
+        print("[ERR] ffmpeg를 찾을 수 없습니다."); sys.exit(2)
+    try:
+        r = quality_check(ff, args.video, args.start, args.end, args.fps, args.width, args.height,
+                          args.mode, args.sample)
+    except RuntimeError as e:
+        print(f"[ERR] {e}"); sys.exit(1)
+    plan = r["plan"]
+    print(f"[INFO] 샘플링: {'없음(전체 분석)' if plan is None else f'{plan[0]}fps {plan[1]}x{plan[2]}'}")
+    for name in ("full", "sampled"):
+        print(f"  {name:<8} Pass 1 {r[name]['sec']:6.2f}s   PSNR {r[name]['psnr']:6.2f} dB")
+    print("[OK] 품질 차이 허용 범위" if r["ok"] else f"[WARN] 샘플링 팔레트 품질 저하가 {MAX_DB_LOSS} dB를 넘습니다.")
@@ -0,0 +1,119 @@
+# palette_library.py
+# 고정 팔레트 라이브러리: 영상마다 팔레트를 새로 만들지 않고 정해 둔 256색으로 양자화합니다.
+#   - 기본 제공 팔레트는 코드로 생성해 cache/palettes/builtin_<키>.png에 두고,
+#     사용자가 저장한 팔레트는 palettes/<이름>.png(앱 폴더, 캐시 정리와 무관)에 보관합니다.
+#   - 선택한 팔레트는 build_gif_commands_auto(palette_path=...)로 넘겨 Pass 1(palettegen)을 생략하므로,
+#     일괄 변환 결과의 색이 파일마다 달라지지 않습니다.
+#   - 옵션/프리셋에는 "builtin:<키>" 또는 "user:<이름>" 형식의 키로 저장합니다.
+import shutil, struct, zlib
+from pathlib import Path
+
+from .constants import APP_DIR, CACHE_DIR
+
+USER_DIR = APP_DIR / "palettes"
+BUILTIN_DIR = CACHE_DIR / "palettes"
+PALETTE_SIZE = 256
+_BAD_CHARS = set('\\/:*?"<>|')
+
+
+def _rgb565_levels(n: int, bits: int) -> list[int]:
+    """0~255를 n단계로 나누되, 5/6비트로 정확히 표현되는 값(RGB565 화면에서 그대로 보이는 색)만 씁니다."""
+    top = (1 << bits) - 1
+    out = []
+    for i in range(n):
+        c = round(i * top / (n - 1))
+        out.append((c << (8 - bits)) | (c >> (2 * bits - 8)))
+    return out
+
+
+def _apex565() -> list[tuple[int, int, int]]:
+    """패드 스크린용: R 8단계 x G 8단계 x B 4단계 균등 격자(RGB565 정확 값). 디더링과 함께 쓰면 색이 고르게 나옵니다."""
+    rs, gs, bs = _rgb565_levels(8, 5), _rgb565_levels(8, 6), _rgb565_levels(4, 5)
+    return [(r, g, b) for r in rs for g in gs for b in bs]
+
+
+def _websafe() -> list[tuple[int, int, int]]:
+    """웹 안전 216색 + 그 사이를 채우는 회색 40단계."""
+    steps = [0, 51, 102, 153, 204, 255]
+    cube = [(r, g, b) for r in steps for g in steps for b in steps]
+    greys = [round(255 * (i + 1) / 41) for i in range(40)]
+    return cube + [(v, v, v) for v in greys]
+
+
+def _grey() -> list[tuple[int, int, int]]:
+    return [(v, v, v) for v in range(256)]
+
+
+# 키 → (한국어 이름, 영어 이름, 색 목록 생성 함수)
+BUILTIN = {
+    "apex565": ("APEX 스크린(RGB565 균등)", "APEX screen (RGB565 uniform)", _apex565),
+    "web": ("웹 안전 216 + 회색", "Web-safe 216 + greys", _websafe),
+    "grey": ("회색조 256", "Greyscale 256", _grey),
+}
+
+
+def write_palette_png(colors, path) -> Path:
+    """
+    색 목록((r, g, b) 최대 256개)을 paletteuse가 읽는 16x16 RGB PNG로 저장합니다(남는 칸은 마지막 색 반복).
+    별도 이미지 라이브러리나 numpy 없이 zlib로 직접 씁니다.
+    """
+    px = [tuple(int(v) for v in c) for c in colors][:PALETTE_SIZE]
+    px += [px[-1]] * (PALETTE_SIZE - len(px))
+    rows = b"".join(b"\0" + bytes(v for c in px[r * 16:(r + 1) * 16] for v in c) for r in range(16))  # 행마다 필터 0
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    png = (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", 16, 16, 8, 2, 0, 0, 0))
+           + chunk(b"IDAT", zlib.compress(rows, 9)) + chunk(b"IEND", b""))
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(png)
+    return path
+
+
+def list_palettes(lang: str = "ko") -> list[tuple[str, str]]:
+    """[(키, 표시 이름)] — 기본 제공 팔레트 다음에 사용자 팔레트(이름순)."""
+    items = [(f"builtin:{k}", ko if lang == "ko" else en) for k, (ko, en, _) in BUILTIN.items()]
+    if USER_DIR.is_dir():
+        items += [(f"user:{p.stem}", p.stem) for p in sorted(USER_DIR.glob("*.png"), key=lambda p: p.stem.lower())]
+    return items
+
+
+def resolve(key: str) -> Path | None:
+    """키에 해당하는 팔레트 PNG 경로. 기본 제공 팔레트는 처음 쓸 때 만듭니다. 없는 키면 None."""
+    kind, _, name = (key or "").partition(":")
+    if kind == "builtin" and name in BUILTIN:
+        path = BUILTIN_DIR / f"builtin_{name}.png"
+        if not path.is_file():
+            write_palette_png(BUILTIN[name][2](), path)
+        return path
+    if kind == "user" and name:
+        path = USER_DIR / f"{name}.png"
+        return path if path.is_file() else None
+    return None
+
+
+def save(name: str, src_path) -> str:
+    """src_path의 팔레트 PNG를 사용자 팔레트로 저장하고 키를 반환합니다(같은 이름은 덮어씀). 이름이 잘못되면 ValueError."""
+    name = "".join(c for c in name.strip() if c not in _BAD_CHARS and c >= " ").strip(". ")
+    if not name:
+        raise ValueError("팔레트 이름이 비어 있습니다.")
+    USER_DIR.mkdir(parents=True, exist_ok=True)
+    dest = USER_DIR / f"{name}.png"
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    shutil.copyfile(src_path, tmp)
+    tmp.replace(dest)
+    return f"user:{name}"
+
+
+def delete(key: str) -> bool:
+    """사용자 팔레트를 지웁니다. 기본 제공 팔레트는 지울 수 없습니다(False)."""
+    kind, _, name = (key or "").partition(":")
+    if kind != "user" or not name:
+        return False
+    try:
+        (USER_DIR / f"{name}.png").unlink()
+        return True
+    except OSError:
+        return False
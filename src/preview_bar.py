@@ -1,7 +1,8 @@
 # preview_bar.py
+import threading
 from pathlib import Path
-from PySide6.QtCore import Qt, Signal, QRect, QSize
-from PySide6.QtGui import QPixmap, QPainter, QColor, QPalette
+from PySide6.QtCore import Qt, Signal, QRect, QSize, QObject, QTimer
+from PySide6.QtGui import QPixmap, QPainter, QColor, QPalette, QImage, QImageReader, QPixmapCache
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QSizePolicy
 )
@@ -64,6 +65,50 @@ class LabelLineEdit(QWidget):
     def text(self) -> str:
         return self.time_edit.text()
 
+# 디코딩된 프리뷰 이미지 메모리 예산(KB). 같은 위치로 되돌아가면 파일을 다시 읽지 않고 바로 그립니다.
+PIXMAP_CACHE_KB = 64 * 1024
+RESIZE_RELOAD_MS = 150
+
+
+class _PreviewDecoder(QObject):
+    """
+    QImageReader로 이미지를 표시 크기에 맞춰 줄여 읽는 작업 스레드(뷰마다 하나, 필요할 때 시작).
+    - 대기 중인 요청은 가장 최근 것 하나만 남기므로, 구간을 빠르게 드래그해도 밀린 디코딩이 쌓이지 않습니다.
+    - QPixmap 변환은 GUI 스레드에서 해야 하므로 결과는 QImage로 done 시그널에 실어 보냅니다.
+    """
+    done = Signal(int, str, QImage)   # 요청 번호, 캐시 키, 이미지
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cond = threading.Condition()
+        self._pending = None
+        self._thread = None
+
+    def request(self, serial: int, key: str, path: str, target: QSize):
+        with self._cond:
+            self._pending = (serial, key, path, QSize(target))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="PreviewDecoder", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                serial, key, path, target = self._pending
+                self._pending = None
+            reader = QImageReader(path)
+            size = reader.size()
+            if size.isValid() and not target.isEmpty():
+                reader.setScaledSize(size.scaled(target, Qt.KeepAspectRatio))
+            try:
+                self.done.emit(serial, key, reader.read())
+            except RuntimeError:  # 뷰가 이미 삭제됨 → 스레드도 끝냅니다.
+                return
+
+
 class PreviewView(QWidget):
     """
     16:9 비율을 유지하는 프리뷰 이미지와 하단 오버레이 UI를 포함하는 위젯.
@@ -74,6 +119,14 @@ class PreviewView(QWidget):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
         self._pixmap = QPixmap()
+        self._path, self._key, self._serial = "", "", 0
+        self._loaded_target = QSize()   # 마지막으로 요청한 디코딩 크기 (같은 크기면 다시 읽지 않음)
+        self._decoder = _PreviewDecoder(self)
+        self._decoder.done.connect(self._on_decoded)
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(RESIZE_RELOAD_MS)
+        self._reload_timer.timeout.connect(self._request)
 
         # '라벨 + 입력창' 통합 위젯을 자식으로 생성
         self.overlay_widget = LabelLineEdit(label_text, label_bg_color, self)
@@ -88,6 +141,40 @@ class PreviewView(QWidget):
         self._pixmap = pixmap
         self.update()
 
+    def set_image_path(self, path: str, key: str = ""):
+        """
+        이미지 파일을 표시합니다. 위젯의 실제 픽셀 크기로 줄인 이미지를 작업 스레드에서 읽고,
+        결과는 QPixmapCache에 (key, 크기)로 보관합니다. key를 생략하면 파일 경로를 키로 씁니다.
+        """
+        self._path, self._key = path, key or path
+        self._request()
+
+    def _target_size(self) -> QSize:
+        dpr = self.devicePixelRatioF()
+        return QSize(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+
+    def _request(self):
+        if not self._path:
+            return
+        target = self._target_size()
+        self._loaded_target = target
+        key = f"preview|{self._key}|{target.width()}x{target.height()}"
+        self._serial += 1
+        pm = QPixmapCache.find(key)
+        if pm is not None and not pm.isNull():
+            self.set_pixmap(pm)
+            return
+        self._decoder.request(self._serial, key, self._path, target)
+
+    def _on_decoded(self, serial: int, key: str, image: QImage):
+        if image.isNull():
+            return
+        pm = QPixmap.fromImage(image)
+        pm.setDevicePixelRatio(self.devicePixelRatioF())
+        QPixmapCache.insert(key, pm)
+        if serial == self._serial:  # 그 사이 다른 위치를 요청했다면 화면에는 반영하지 않습니다.
+            self.set_pixmap(pm)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.fillRect(self.rect(), QColor("#222"))
@@ -97,7 +184,8 @@ class PreviewView(QWidget):
             return
 
         widget_rect = self.rect()
-        pixmap_size = self._pixmap.size()
+        # 디코딩 시 이미 화면 크기로 줄였으므로 보통은 1:1로 그려집니다(크기 변경 직후에만 임시로 확대/축소).
+        pixmap_size = self._pixmap.deviceIndependentSize().toSize()
         scaled_size = pixmap_size.scaled(widget_rect.size(), Qt.KeepAspectRatio)
         
         final_rect = QRect(0, 0, scaled_size.width(), scaled_size.height())
@@ -119,6 +207,10 @@ class PreviewView(QWidget):
         
         self.overlay_widget.move(int(x), int(y))
 
+        # 크기 조절이 끝나면 새 크기에 맞춰 다시 읽습니다(표시 중인 이미지와 크기가 같으면 생략).
+        if self._path and self._target_size() != self._loaded_target:
+            self._reload_timer.start()
+
 
 class PreviewBar(QWidget):
     """
@@ -132,6 +224,9 @@ class PreviewBar(QWidget):
         self.lang = lang
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
+
         root = QHBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(10)
@@ -159,11 +254,15 @@ class PreviewBar(QWidget):
     def heightForWidth(self, width: int) -> int:
         return int(width * 9 / 16)
 
-    def set_images(self, left_path: str, right_path: str):
+    def set_images(self, left_path: str, right_path: str, keys: tuple = ("", "")):
+        """
+        시작/끝 프리뷰 이미지를 바꿉니다. 디코딩은 작업 스레드에서 이루어지며,
+        keys(예: 영상 지문 + 시각)가 같은 이미지는 메모리 캐시에서 바로 그려집니다.
+        """
         if left_path:
-            self.left_preview.set_pixmap(QPixmap(left_path))
+            self.left_preview.set_image_path(left_path, keys[0])
         if right_path:
-            self.right_preview.set_pixmap(QPixmap(right_path))
+            self.right_preview.set_image_path(right_path, keys[1])
 
     def set_times(self, s: str, e: str):
         self.left_preview.overlay_widget.setText(s)
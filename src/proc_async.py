@@ -0,0 +1,160 @@
+# proc_async.py
+# asyncio 기반 외부 프로세스 실행기 (run_quiet의 비동기 버전).
+#   - stdout/stderr를 끝날 때까지 모아 두지 않고 줄 단위로 콜백에 흘려보냅니다(stderr는 마지막 일부만 보관).
+#   - timeout과 취소(cancel)를 지원하며, 어느 경우든 자식 프로세스를 실제로 종료합니다.
+#   - 동시에 실행되는 프로세스 수를 세마포어로 제한합니다(프로브/프리뷰/인코딩을 겹쳐 실행해도 안전).
+#   - Qt 등 동기 코드에서는 AsyncRunner(백그라운드 이벤트 루프)에 작업을 넣고 Future로 결과를 받습니다.
+import asyncio, os, subprocess, threading, time
+from collections import deque
+
+from . import telemetry
+from .ffmpeg_tools import _quiet_kwargs
+
+MAX_CONCURRENCY = max(2, (os.cpu_count() or 2) // 2)
+STDERR_TAIL_LINES = 200   # 결과에 남길 stderr 마지막 줄 수
+LINE_LIMIT = 1024 * 1024  # 한 줄 최대 길이 (긴 필터 그래프 오류 메시지 대비)
+
+
+class ProcessTimeout(RuntimeError):
+    """timeout 안에 끝나지 않아 종료된 프로세스."""
+
+
+async def _pump(stream, sink, keep: deque | None, text: bool):
+    """스트림을 한 줄씩 읽어 콜백(sink)에 넘기고, keep이 있으면 마지막 일부만 보관합니다."""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        if text:
+            line = line.decode("utf-8", "ignore").rstrip("\r\n")
+        if sink is not None:
+            sink(line)
+        if keep is not None:
+            keep.append(line)
+
+
+async def _kill(proc):
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+
+async def run_async(cmd: list[str], kind: str = "other", timeout: float | None = None,
+                    on_stdout=None, on_stderr=None, capture_stdout: bool = True,
+                    semaphore: asyncio.Semaphore | None = None, outputs=()):
+    """
+    외부 명령을 비동기로 실행하고 subprocess.CompletedProcess를 반환합니다(stdout/stderr는 텍스트).
+    - on_stdout/on_stderr: 줄 단위 콜백 (이벤트 루프 스레드에서 호출)
+    - capture_stdout: False면 stdout을 결과에 보관하지 않습니다(콜백만)
+    - timeout 초과 시 프로세스를 종료하고 ProcessTimeout, 취소되면 종료 후 CancelledError를 다시 던집니다.
+    - semaphore: 동시 실행 수 제한 (AsyncRunner는 MAX_CONCURRENCY개짜리를 넘깁니다)
+    - outputs: 명령이 쓰는 출력 파일 경로들 (실행 기록의 출력 크기)
+    """
+    if semaphore is not None:
+        async with semaphore:
+            return await run_async(cmd, kind, timeout, on_stdout, on_stderr, capture_stdout, outputs=outputs)
+
+    started = time.perf_counter()
+    proc = await asyncio.create_subprocess_exec(*map(str, cmd), stdout=asyncio.subprocess.PIPE,
+                                                stderr=asyncio.subprocess.PIPE, limit=LINE_LIMIT,
+                                                **_quiet_kwargs())
+    out = deque() if capture_stdout else None
+    err = deque(maxlen=STDERR_TAIL_LINES)
+    pumps = asyncio.gather(_pump(proc.stdout, on_stdout, out, True),
+                           _pump(proc.stderr, on_stderr, err, True))
+    try:
+        await asyncio.wait_for(asyncio.shield(pumps), timeout)
+        await proc.wait()
+    except asyncio.TimeoutError:
+        await _kill(proc)
+        raise ProcessTimeout(f"timeout after {timeout}s: {cmd[0]}")
+    finally:
+        # 취소/시간 초과/예외 모두에서 자식 프로세스가 남지 않도록 합니다.
+        if proc.returncode is None:
+            await asyncio.shield(_kill(proc))
+        pumps.cancel()
+        pumps.add_done_callback(lambda f: f.cancelled() or f.exception())  # 취소 결과를 회수(경고 방지)
+        result = subprocess.CompletedProcess(cmd, proc.returncode,
+                                             "\n".join(out) if out is not None else "", "\n".join(err))
+        telemetry.record(kind, cmd, time.perf_counter() - started, None, result, outputs)
+    return result
+
+
+class AsyncRunner:
+    """
+    백그라운드 스레드에서 asyncio 이벤트 루프를 돌리며 동기 코드(Qt 등)의 실행 요청을 받습니다.
+    - submit()은 concurrent.futures.Future를 반환하며, future.cancel()로 실행 중인 프로세스까지 종료됩니다.
+    """
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY):
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="AsyncRunner", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        self._sem = asyncio.run_coroutine_threadsafe(self._make_sem(max_concurrency), self._loop).result()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._ready.set)
+        self._loop.run_forever()
+
+    @staticmethod
+    async def _make_sem(n: int):
+        return asyncio.Semaphore(n)
+
+    def submit(self, cmd: list[str], kind: str = "other", timeout: float | None = None,
+               on_stdout=None, on_stderr=None, capture_stdout: bool = True, outputs=()):
+        """명령 하나를 실행 대기열에 넣습니다. 반환: concurrent.futures.Future[CompletedProcess]"""
+        return asyncio.run_coroutine_threadsafe(
+            run_async(cmd, kind, timeout, on_stdout, on_stderr, capture_stdout, self._sem, outputs), self._loop)
+
+    def run_all(self, cmds: list[list[str]], kind: str = "other", timeout: float | None = None,
+                outputs=None) -> list:
+        """
+        여러 명령을 동시에(동시 실행 수 제한 안에서) 실행하고 모두 끝날 때까지 기다립니다.
+        - outputs: 명령마다의 출력 경로 목록 (cmds와 같은 순서, 생략 가능)
+        """
+        futures = [self.submit(c, kind, timeout, outputs=o) for c, o in zip(cmds, outputs or [()] * len(cmds))]
+        try:
+            return [f.result() for f in futures]
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
+
+    def close(self):
+        """남은 작업을 취소하고(자식 프로세스 종료) 이벤트 루프를 멈춥니다."""
+        async def _cancel_all():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(_cancel_all(), self._loop).result(timeout=5)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+
+_runner: AsyncRunner | None = None
+_runner_lock = threading.Lock()
+
+
+def get_runner() -> AsyncRunner:
+    """앱 전체가 공유하는 AsyncRunner (처음 호출 시 생성)."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = AsyncRunner()
+        return _runner
+
+
+def close_runner():
+    """공유 AsyncRunner가 만들어져 있으면 닫습니다(없으면 새로 만들지 않음). 프로그램 종료 시 사용."""
+    global _runner
+    with _runner_lock:
+        runner, _runner = _runner, None
+    if runner is not None:
+        runner.close()
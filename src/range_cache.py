@@ -0,0 +1,161 @@
+# range_cache.py
+# 선택 구간 디코딩 캐시: 구간을 작업 해상도의 raw(rgb24) 프레임 파일로 한 번만 디코딩해 두고,
+# 이후 팔레트/인코딩/분석 패스는 원본 대신 이 파일을 읽습니다(디더링·fps·팔레트·크기만 바꿔 다시 만들 때 빠름).
+#   - 처음 만드는 구간은 원본에서 바로 변환하고, 같은 구간을 다시 만들 때 캐시를 채웁니다(ensure(build=...)).
+#   - 작업 해상도는 출력 크기가 아니라 고정 너비(WORK_W, 설정으로 변경)이므로 출력 크기를 바꿔도 다시 디코딩하지
+#     않습니다. 출력이 그보다 커서 캐시로 채울 수 없을 때만 더 큰 크기로 다시 만듭니다.
+#   - 파일 구조: 64바이트 헤더(크기, fps, 프레임 수, pts, 원본 크기) + 프레임 데이터 (cache/range/range_<키>.raw)
+#     키는 영상 지문(경로, 크기, 수정 시각)과 구간/fps뿐이라, 캐시가 있으면 ffprobe 없이 헤더만 읽어 재사용합니다.
+#   - ffmpeg는 '-f rawvideo -skip_initial_bytes 64'로 헤더를 건너뛰고 읽습니다.
+#   - 캐시는 한 구간만 유지합니다. 구간이 바뀌면 evict()로 지웁니다.
+import hashlib, os, struct
+from pathlib import Path
+
+from .constants import CACHE_DIR
+from .ffmpeg_tools import _segment_source, _run_span, probe_video_size
+
+RANGE_DIR = CACHE_DIR / "range"
+
+MAGIC = b"AGRC"
+# magic, ver, 예약, w, h, fps 분자, fps 분모, 프레임 수, 첫 pts, pts 간격, 원본 w, 원본 h
+HEADER = struct.Struct("<4sHHIIIIIddII")
+HEADER_SIZE = 64
+VERSION = 2
+
+CACHE_FPS = 30               # 이 fps 이하의 출력은 같은 캐시를 재사용
+WORK_W = 640                 # 작업 해상도 너비(기본값). 이 너비 이하로 채울 수 있는 출력은 같은 캐시를 재사용
+MAX_BYTES = 768 * 1024 ** 2  # 이보다 커지는 구간은 캐시하지 않고 원본에서 바로 변환
+
+
+class RangeSource:
+    """디코딩된 구간 파일 하나. build_gif_commands_auto(source=...) 등에 넘깁니다."""
+    def __init__(self, path: Path, w: int, h: int, fps: int, n: int, pts0: float = 0.0,
+                 first: int | None = None, src_size: tuple[int, int] | None = None):
+        self.path, self.w, self.h, self.fps, self.n, self.pts0 = Path(path), w, h, fps, n, pts0
+        self.first = first  # part()로 만든 일부 구간이면 파일 안의 시작 프레임 번호 (전체면 None)
+        self.src_size = src_size  # 원본 영상 크기 (캐시가 출력을 채울 수 있는지 판단용)
+
+    @property
+    def duration(self) -> float:
+        return self.n / self.fps
+
+    @property
+    def frame_bytes(self) -> int:
+        return self.w * self.h * 3
+
+    def pts(self, i: int) -> float:
+        """i번째 프레임의 시각(이어 붙인 구간 기준, 초)."""
+        return self.pts0 + i / self.fps
+
+    def input_args(self) -> list[str]:
+        """ffmpeg 입력 옵션 (원본의 '-ss .. -t .. -i 영상' 자리에 그대로 사용)."""
+        skip = HEADER_SIZE + (self.first or 0) * self.frame_bytes
+        limit = ["-t", f"{self.n / self.fps:.6f}"] if self.first is not None else []
+        return ["-f", "rawvideo", "-pix_fmt", "rgb24", "-video_size", f"{self.w}x{self.h}",
+                "-framerate", str(self.fps), "-skip_initial_bytes", str(skip), *limit, "-i", str(self.path)]
+
+    def part(self, i0: int, i1: int) -> "RangeSource":
+        """[i0, i1) 프레임만 읽는 같은 파일의 부분 입력 (구간 분할 병렬 인코딩용)."""
+        return RangeSource(self.path, self.w, self.h, self.fps, i1 - i0, self.pts(i0), (self.first or 0) + i0,
+                           self.src_size)
+
+
+def open_source(path: Path) -> RangeSource | None:
+    """헤더를 읽어 RangeSource를 만듭니다. 헤더가 깨졌거나 파일 크기가 맞지 않으면 None."""
+    try:
+        with open(path, "rb") as f:
+            magic, ver, _, w, h, fps_n, fps_d, n, pts0, _, src_w, src_h = HEADER.unpack(f.read(HEADER.size))
+        size = os.path.getsize(path)
+    except (OSError, struct.error):
+        return None
+    if magic != MAGIC or ver != VERSION or fps_d != 1 or n == 0 or size != HEADER_SIZE + n * w * h * 3:
+        return None
+    return RangeSource(path, w, h, fps_n, n, pts0, src_size=(src_w, src_h))
+
+
+def work_size(src_w: int, src_h: int, out_w: int, out_h: int, work_w: int = WORK_W) -> tuple[int, int]:
+    """
+    원본 비율을 유지한 작업 해상도: 너비 work_w와, 출력(cover 기준 w, h 모두)을 채우는 크기 중 큰 쪽
+    (원본보다 크게는 안 함). (짝수로 맞춤)
+    """
+    s = min(1.0, max(work_w / src_w, out_w / src_w, out_h / src_h))
+    even = lambda v: max(2, int(round(v / 2)) * 2)
+    return even(src_w * s), even(src_h * s)
+
+
+def _key(video_path: str, segments, fps: int) -> str:
+    st = os.stat(video_path)
+    ident = "|".join([str(Path(video_path).resolve()), str(st.st_mtime_ns), str(st.st_size),
+                      ";".join(f"{a:.3f}-{b:.3f}" for a, b in segments), str(fps)])
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()[:16]
+
+
+def evict(keep: Path | None = None):
+    """캐시된 구간 파일을 지웁니다(keep은 남김)."""
+    if not RANGE_DIR.exists():
+        return
+    for p in RANGE_DIR.glob("range_*.raw*"):
+        if keep is None or p != keep:
+            try: p.unlink()
+            except OSError: pass
+
+
+def ensure(ffmpeg_path: str, ffprobe_path: str, video_path: str, segments, fps: int,
+           out_w: int, out_h: int, log=lambda *_: None, build: bool = True,
+           work_w: int = WORK_W) -> RangeSource | None:
+    """
+    segments([(시작, 끝), ...] 초) 구간의 디코딩 캐시를 돌려줍니다. 같은 구간의 캐시가 출력을 채울 수 있으면
+    재사용하고(ffprobe 없이), 없으면 build일 때만 한 번 디코딩해 만듭니다.
+    캐시를 쓰지 않는 경우(미생성, 용량 초과, 실패)에는 None.
+    """
+    if not segments:
+        return None
+    cfps = max(CACHE_FPS, int(fps))
+    path = RANGE_DIR / f"range_{_key(video_path, segments, cfps)}.raw"
+    src = open_source(path) if path.exists() else None
+    if src is not None:
+        need_w, _ = work_size(*src.src_size, out_w, out_h, work_w=0)
+        if src.w >= need_w:
+            log(f"[INFO] 구간 캐시 재사용: {src.w}x{src.h} {src.n}프레임")
+            return src
+        src = None  # 출력이 캐시보다 커졌습니다. build면 더 큰 크기로 다시 만듭니다.
+    if not build:
+        return None
+
+    src_w, src_h = probe_video_size(ffprobe_path, video_path)
+    w, h = work_size(src_w, src_h, out_w, out_h, work_w)
+    total = sum(b - a for a, b in segments)
+    if w * h * 3 * cfps * total > MAX_BYTES:
+        log(f"[INFO] 구간 캐시 생략: 예상 크기 {w * h * 3 * cfps * total / 1048576:.0f} MB")
+        return None
+
+    evict()
+    RANGE_DIR.mkdir(parents=True, exist_ok=True)
+    if len(segments) > 1:
+        inputs, prefix, _ = _segment_source(video_path, segments)
+    else:
+        a, b = segments[0]
+        inputs, prefix = ["-ss", f"{a:.3f}", "-t", f"{b - a:.3f}", "-i", video_path], "[0:v]"
+    graph = f"{prefix}fps={cfps},scale={w}:{h}:flags=lanczos,format=rgb24"
+    cmd = [ffmpeg_path, "-hide_banner", "-loglevel", "error", *inputs, "-lavfi", graph,
+           "-f", "rawvideo", "-pix_fmt", "rgb24", "-"]
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(b"\0" * HEADER_SIZE)
+        f.flush()
+        p = _run_span(cmd, "range_cache", stdout=f, outputs=[tmp])  # ffmpeg가 헤더 뒤에 바로 씁니다(메모리 경유 없음)
+        n = (os.fstat(f.fileno()).st_size - HEADER_SIZE) // (w * h * 3) if p.returncode == 0 else 0
+        if n:
+            f.truncate(HEADER_SIZE + n * w * h * 3)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, 0, w, h, cfps, 1, n, 0.0, 1.0 / cfps, src_w, src_h))
+    if not n:
+        err = p.stderr.decode("utf-8", "ignore").strip() if isinstance(p.stderr, bytes) else p.stderr
+        log(f"[WARN] 구간 캐시 생성 실패: {(err or '')[:300]}")
+        try: tmp.unlink()
+        except OSError: pass
+        return None
+    os.replace(tmp, path)
+    log(f"[INFO] 구간 캐시 생성: {w}x{h} {n}프레임 ({path.stat().st_size / 1048576:.0f} MB)")
+    return RangeSource(path, w, h, cfps, n, src_size=(src_w, src_h))
@@ -4,23 +4,68 @@ from PySide6.QtGui import QPainter, QColor
 from PySide6.QtWidgets import QWidget
 
 class RangeSlider(QWidget):
-    """양끝 핸들 슬라이더 (0..1), active 핸들 노출"""
+    """양끝 핸들 슬라이더 (0..1), active 핸들 노출. 여러 구간 GIF용으로 추가해 둔 구간(marks)도 표시"""
     changed = Signal(float, float)  # lower, upper (0..1)
+    hovered = Signal(float)         # 마우스 위치 (0..1), 벗어나면 -1
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(36)
+        self.setMouseTracking(True)  # 버튼을 누르지 않아도 호버 위치를 알림
         self._lower = 0.0
         self._upper = 0.1
         self._active = None  # 'l'|'u'|None
+        self._marks: list[tuple[float, float]] = []  # 추가된 구간 (0..1)
+        self._activity: list[float] = []   # 초당 움직임 (0..1로 정규화, 막대 아래 그래프)
+        self._cuts: list[float] = []       # 장면 전환 위치 (0..1)
+        self._step = 0.0                   # 한 프레임 간격 (0..1 기준, 0이면 맞추지 않음)
 
     def lower(self): return self._lower
     def upper(self): return self._upper
     def active_handle(self): return self._active
 
+    def marks(self) -> list[tuple[float, float]]:
+        return sorted(self._marks)
+
+    def add_mark(self, lower: float, upper: float):
+        """현재 구간 등을 목록에 추가합니다. 겹치는 기존 구간은 하나로 합칩니다."""
+        lo, hi = max(0.0, min(lower, upper)), min(1.0, max(lower, upper))
+        if hi <= lo:
+            return
+        keep = []
+        for a, b in self._marks:
+            if b < lo or a > hi:
+                keep.append((a, b))
+            else:
+                lo, hi = min(lo, a), max(hi, b)
+        self._marks = keep + [(lo, hi)]
+        self.update()
+
+    def clear_marks(self):
+        self._marks = []
+        self.update()
+
+    def set_activity(self, values: list[float], cuts: list[float]):
+        """분석 인덱스(motion_index)의 움직임 그래프와 장면 전환 위치를 표시합니다."""
+        self._activity, self._cuts = list(values), list(cuts)
+        self.update()
+
+    def set_step(self, step: float):
+        """
+        핸들이 멈출 간격을 정합니다(보통 1프레임 = 1 / (fps * 길이)). 0이면 연속 값.
+        간격이 있으면 값이 실제 프레임 시각에만 놓이고, 드래그 중 프레임이 바뀔 때만 changed가 발생합니다.
+        """
+        self._step = max(0.0, float(step))
+        self.setRange(self._lower, self._upper, emit_signal=False)
+
+    def _snap(self, v: float) -> float:
+        if self._step > 0:
+            v = round(v / self._step) * self._step
+        return max(0.0, min(1.0, v))
+
     def setRange(self, lower: float, upper: float, emit_signal=True):
-        lower = max(0.0, min(1.0, lower))
-        upper = max(0.0, min(1.0, upper))
+        lower = self._snap(lower)
+        upper = self._snap(upper)
         if upper < lower:
             upper = lower
         self._lower, self._upper = lower, upper
@@ -33,6 +78,25 @@ class RangeSlider(QWidget):
         w, h = self.width(), self.height()
         bar = QRect(10, h//2 - 4, w-20, 8)
         p.setPen(Qt.NoPen); p.setBrush(QColor("#e5e7eb")); p.drawRect(bar)
+        if self._activity:
+            # 막대 아래쪽 여백에 초당 움직임 그래프 (그리기 비용을 줄이기 위해 픽셀 열 단위로 최대값만)
+            n, base, room = len(self._activity), h - 1, max(1, h - bar.bottom() - 3)
+            p.setBrush(QColor(148, 163, 184))
+            cols = max(1, bar.width())
+            for x in range(0, cols, 2):
+                i0, i1 = x * n // cols, max(x * n // cols + 1, (x + 2) * n // cols)
+                v = max(self._activity[i0:i1])
+                if v > 0:
+                    hh = max(1, int(v * room))
+                    p.drawRect(QRect(bar.x() + x, base - hh, 2, hh))
+        if self._cuts:
+            p.setBrush(QColor(239, 68, 68))
+            for c in self._cuts:
+                p.drawRect(QRect(bar.x() + int(bar.width()*c), bar.y() - 2, 1, bar.height() + 4))
+        p.setBrush(QColor(245, 158, 11))
+        for a, b in self._marks:
+            ax, bx = bar.x() + int(bar.width()*a), bar.x() + int(bar.width()*b)
+            p.drawRect(QRect(ax, bar.y() - 5, max(2, bx - ax), 4))
         lpx = bar.x() + int(bar.width()*self._lower)
         upx = bar.x() + int(bar.width()*self._upper)
         sel = QRect(lpx, bar.y(), upx - lpx, bar.height())
@@ -51,16 +115,24 @@ class RangeSlider(QWidget):
         self.mouseMoveEvent(e)
 
     def mouseMoveEvent(self, e):
+        pos = max(0.0, min(1.0, (e.position().x()-10)/max(1,(self.width()-20))))
+        self.hovered.emit(pos)
         if not self._active:
             return
-        val = (e.position().x()-10)/max(1,(self.width()-20))
-        val = max(0.0, min(1.0, val))
+        val = self._snap(pos)
+        prev = (self._lower, self._upper)
         if self._active == 'l':
             self._lower = min(val, self._upper)
         else:
             self._upper = max(val, self._lower)
+        if (self._lower, self._upper) == prev:
+            return  # 같은 프레임 안에서 움직인 경우
         self.update()
         self.changed.emit(self._lower, self._upper)
 
     def mouseReleaseEvent(self, e):
         self._active = None
+
+    def leaveEvent(self, e):
+        self.hovered.emit(-1.0)
+        super().leaveEvent(e)
@@ -0,0 +1,40 @@
+# scenes.py
+# 저해상도 분석 프레임으로 장면 전환(하드 컷)을 찾아 장면별 팔레트 구간을 나눕니다.
+from .frame_probe import np
+
+# 0~255 밝기 기준 컷 판정 임계값과, 주변 움직임 대비 최소 배율
+CUT_THRESHOLD = 30.0
+CUT_RATIO     = 3.0
+
+# 너무 짧은 장면은 별도 팔레트를 만들 가치가 없으므로 앞 장면에 합칩니다.
+MIN_SCENE_SEC = 1.0
+MAX_SCENES    = 8
+
+
+def find_scene_cuts(frames, fps: float) -> list[float]:
+    """
+    분석 프레임 배열(frame_probe.load_probe_frames)에서 장면 전환 시각(구간 시작 기준, 초)을 반환합니다.
+    - 컷 시각은 두 프레임 사이의 중간값이라 trim 경계에서 프레임이 중복/누락되지 않습니다.
+    - 빠른 움직임을 컷으로 오인하지 않도록 주변 프레임 차이의 중앙값과 비교합니다.
+    """
+    n = len(frames)
+    if n < 2:
+        return []
+    diff = np.abs(frames[1:] - frames[:-1]).mean(axis=(1, 2))
+
+    # 각 지점 주변(±4 프레임)의 중앙값: 지속적인 움직임의 기준선
+    pad = np.pad(diff, 4, mode="edge")
+    windows = np.lib.stride_tricks.sliding_window_view(pad, 9)
+    baseline = np.median(windows, axis=1)
+    is_cut = (diff >= CUT_THRESHOLD) & (diff >= CUT_RATIO * np.maximum(baseline, 1.0))
+
+    cuts, last = [], 0.0
+    min_frames = MIN_SCENE_SEC * fps
+    for i in np.flatnonzero(is_cut) + 1:  # i: 새 장면의 첫 프레임 번호
+        if i - last * fps < min_frames or n - i < min_frames:
+            continue
+        cuts.append(float((i - 0.5) / fps))
+        last = i / fps
+        if len(cuts) >= MAX_SCENES - 1:
+            break
+    return cuts
@@ -0,0 +1,151 @@
+# scrub.py
+# 타임라인 호버 미리보기: 영상 전체를 작은 프레임(160x90) 격자 한 장(스프라이트)으로 만들어 두고,
+# 마우스를 올린 위치의 칸을 잘라 팝업으로 보여 줍니다. 호버 중에는 ffmpeg를 실행하지 않습니다.
+#   - 스프라이트는 백그라운드 분석 작업에서 한 번 만들고 cache/sprites/<키>.jpg(+.json)에 저장합니다.
+#   - 스프라이트가 준비되기 전에는 타임라인 썸네일 중 가장 가까운 것을 보여 줍니다.
+import hashlib, json, math, os, time
+from pathlib import Path
+
+from PySide6.QtCore import Qt, QPoint, QRect
+from PySide6.QtGui import QPixmap, QPainter, QColor
+from PySide6.QtWidgets import QLabel
+
+from .constants import CACHE_DIR
+
+SPRITE_DIR = CACHE_DIR / "sprites"
+SPRITE_VERSION = 1
+TILE_W, TILE_H = 160, 90
+SPRITE_COLS = 20
+SPRITE_MAX_TILES = 400
+SPRITE_MIN_INTERVAL = 0.5   # 칸 사이 최소 간격(초). 짧은 영상은 이 간격으로 촘촘하게
+POPUP_SCALE = 1.5
+
+
+def _sprite_path(video_path: str) -> Path:
+    st = os.stat(video_path)
+    ident = f"{Path(video_path).resolve()}|{st.st_mtime_ns}|{st.st_size}"
+    return SPRITE_DIR / f"{hashlib.sha1(ident.encode('utf-8')).hexdigest()[:16]}.jpg"
+
+
+def load_sprite(video_path: str) -> dict | None:
+    """저장된 스프라이트 정보({"path", "interval", "count", "cols", "tile"})가 있으면 반환합니다."""
+    path = _sprite_path(video_path)
+    try:
+        meta = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != SPRITE_VERSION or not path.is_file():
+        return None
+    return {**meta, "path": str(path)}
+
+
+def sprite_plan(video_path: str, duration: float) -> dict | None:
+    """
+    스프라이트 생성 계획: {"vf": 필터, "out_args": 출력 옵션(임시 파일 포함), "tmp", "path", "meta"}.
+    build_sprite와 analysis_decode(다른 분석과 한 번에 디코딩)가 공유합니다. 길이가 0이면 None.
+    """
+    if duration <= 0:
+        return None
+    interval = max(SPRITE_MIN_INTERVAL, duration / SPRITE_MAX_TILES)
+    count = max(1, math.ceil(duration / interval))
+    cols = min(SPRITE_COLS, count)
+    rows = math.ceil(count / cols)
+    path = _sprite_path(video_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.stem + ".tmp.jpg")
+    try: tmp.unlink()  # 이전에 실패한 작업의 임시 파일을 결과로 오인하지 않도록
+    except OSError: pass
+    vf = (f"fps=1/{interval:.6f},scale={TILE_W}:{TILE_H}:force_original_aspect_ratio=decrease:flags=area,"
+          f"pad={TILE_W}:{TILE_H}:(ow-iw)/2:(oh-ih)/2,tile={cols}x{rows}")
+    meta = {"version": SPRITE_VERSION, "interval": interval, "count": count, "cols": cols,
+            "tile": [TILE_W, TILE_H]}
+    return {"vf": vf, "out_args": ["-frames:v", "1", "-q:v", "5", "-y", str(tmp)],
+            "tmp": tmp, "path": path, "meta": meta}
+
+
+def finish_sprite(plan: dict) -> dict | None:
+    """ffmpeg가 임시 파일을 다 쓴 뒤 호출: 결과 파일과 정보(.json)를 저장하고 스프라이트 정보를 반환합니다."""
+    if not plan["tmp"].is_file():
+        return None
+    os.replace(plan["tmp"], plan["path"])
+    plan["path"].with_suffix(".json").write_text(json.dumps(plan["meta"]), encoding="utf-8")
+    return {**plan["meta"], "path": str(plan["path"])}
+
+
+def build_sprite(ffmpeg_path: str, video_path: str, duration: float,
+                 should_stop=lambda: False) -> dict | None:
+    """
+    영상 전체를 일정 간격으로 뽑아 TILE_W x TILE_H 칸 격자 이미지 한 장으로 저장합니다.
+    - should_stop()이 True가 되면 ffmpeg를 종료하고 None을 반환합니다.
+    """
+    plan = sprite_plan(video_path, duration)
+    if plan is None:
+        return None
+    cmd = [ffmpeg_path, "-hide_banner", "-loglevel", "error", "-i", video_path, "-vf", plan["vf"],
+           *plan["out_args"]]
+
+    # 비동기 실행기로 돌려 중단 요청 시 ffmpeg를 바로 종료합니다.
+    from .proc_async import get_runner
+    fut = get_runner().submit(cmd, kind="sprite", outputs=[plan["tmp"]])
+    while not fut.done():
+        if should_stop():
+            fut.cancel()
+            return None
+        time.sleep(0.1)
+    if fut.result().returncode != 0:
+        return None
+    return finish_sprite(plan)
+
+
+class ScrubSource:
+    """호버 위치(초)에 해당하는 프레임 QPixmap을 돌려줍니다. 스프라이트가 없으면 썸네일 목록에서 고릅니다."""
+    def __init__(self):
+        self.duration = 0.0
+        self.thumbs: list[QPixmap] = []
+        self._sheet: QPixmap | None = None
+        self._meta: dict | None = None
+
+    def set_sprite(self, meta: dict | None):
+        self._meta, self._sheet = None, None
+        if meta:
+            sheet = QPixmap(meta["path"])
+            if not sheet.isNull():
+                self._meta, self._sheet = meta, sheet
+
+    def clear(self):
+        self.thumbs, self._meta, self._sheet = [], None, None
+
+    def frame_at(self, sec: float) -> QPixmap | None:
+        if self._sheet is not None:
+            m = self._meta
+            i = min(m["count"] - 1, max(0, int(round(sec / m["interval"]))))
+            tw, th = m["tile"]
+            return self._sheet.copy(QRect((i % m["cols"]) * tw, (i // m["cols"]) * th, tw, th))
+        if self.thumbs and self.duration > 0:
+            i = min(len(self.thumbs) - 1, max(0, int(sec / self.duration * len(self.thumbs))))
+            return self.thumbs[i]
+        return None
+
+
+class ScrubPopup(QLabel):
+    """마우스 위쪽에 뜨는 작은 프레임 미리보기(시각 표시 포함)."""
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.ToolTip | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setStyleSheet("background:#000; border:1px solid #94a3b8;")
+
+    def show_frame(self, pm: QPixmap, text: str, global_pos: QPoint):
+        w, h = int(TILE_W * POPUP_SCALE), int(TILE_H * POPUP_SCALE)
+        img = pm.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        canvas = QPixmap(w, h)
+        canvas.fill(QColor("#000"))
+        p = QPainter(canvas)
+        p.drawPixmap((w - img.width()) // 2, (h - img.height()) // 2, img)
+        p.fillRect(QRect(0, h - 20, w, 20), QColor(0, 0, 0, 170))
+        p.setPen(QColor("#ffffff"))
+        p.drawText(QRect(0, h - 20, w, 20), Qt.AlignCenter, text)
+        p.end()
+        self.setPixmap(canvas)
+        self.resize(w + 2, h + 2)
+        self.move(global_pos.x() - self.width() // 2, global_pos.y() - self.height() - 12)
+        self.show()
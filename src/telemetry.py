@@ -0,0 +1,126 @@
+# telemetry.py
+# 외부 프로세스(ffmpeg/ffprobe) 실행마다 시간·자원 사용량을 기록하는 span 로거.
+#   - 기록 위치: cache/spans.jsonl (일정 크기를 넘으면 spans.jsonl.1로 교체)
+#   - 요약 보기: python -m src.telemetry [--last N]
+import json, os, sys, threading, time
+from pathlib import Path
+
+from .constants import CACHE_DIR
+
+SPANS_PATH = CACHE_DIR / "spans.jsonl"
+MAX_BYTES  = 2 * 1024 * 1024
+
+_lock = threading.Lock()
+
+
+def usage_from_rusage(ru) -> tuple[float, int]:
+    """os.wait4/getrusage 결과를 (CPU 초, 최대 RSS KB)로 바꿉니다."""
+    # macOS의 ru_maxrss는 바이트, Linux는 KB 단위입니다.
+    rss = ru.ru_maxrss // 1024 if sys.platform == "darwin" else ru.ru_maxrss
+    return round(ru.ru_utime + ru.ru_stime, 4), int(rss)
+
+
+def _output_size(outputs) -> int:
+    """호출자가 알려 준 출력 파일들의 크기 합(바이트). 폴더면 그 안의 파일들을 합칩니다. 없으면 0."""
+    total = 0
+    for out in outputs or ():
+        p = Path(out)
+        try:
+            if p.is_dir():
+                total += sum(f.stat().st_size for f in p.iterdir() if f.is_file())
+            else:
+                total += p.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def record(kind: str, cmd: list, wall: float, usage, proc, outputs=()) -> dict:
+    """
+    한 번의 실행을 span으로 기록합니다.
+    - wall: 실행 시간(초), usage: usage_from_rusage() 결과 또는 None(Windows 등 측정 불가)
+    - outputs: 이 명령이 쓴 출력 파일(또는 폴더) 경로들. 조회/표준 출력 명령은 비워 두며 0으로 기록됩니다.
+    """
+    cpu, rss = usage if usage is not None else (None, None)
+    span = {
+        "ts": round(time.time(), 3),
+        "kind": kind,
+        "exe": Path(str(cmd[0])).stem if cmd else "",
+        "wall_s": round(wall, 4),
+        "cpu_s": cpu,
+        "peak_rss_kb": rss,
+        "rc": getattr(proc, "returncode", None),
+        "out_bytes": _output_size(outputs),
+        "argc": len(cmd),
+    }
+    _append(span)
+    return span
+
+
+def _append(span: dict):
+    try:
+        with _lock:
+            SPANS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            if SPANS_PATH.exists() and SPANS_PATH.stat().st_size > MAX_BYTES:
+                os.replace(SPANS_PATH, SPANS_PATH.with_name(SPANS_PATH.name + ".1"))
+            with open(SPANS_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(span, ensure_ascii=False) + "\n")
+    except OSError:
+        pass  # 기록 실패가 변환 작업을 방해하지 않도록 무시합니다.
+
+
+def load_spans(last: int | None = None) -> list[dict]:
+    """교체된 이전 파일까지 포함해 기록된 span 목록을 시간순으로 반환합니다."""
+    spans = []
+    for p in (SPANS_PATH.with_name(SPANS_PATH.name + ".1"), SPANS_PATH):
+        if not p.exists():
+            continue
+        with open(p, "r", encoding="utf-8") as f:
+            for line in f:
+                try: spans.append(json.loads(line))
+                except ValueError: pass
+    return spans[-last:] if last else spans
+
+
+def summarize(spans: list[dict]) -> list[dict]:
+    """종류(kind)별 실행 횟수, 총/평균/p95 시간, CPU 합계, 최대 RSS, 실패 수를 집계합니다."""
+    groups: dict[str, list[dict]] = {}
+    for s in spans:
+        groups.setdefault(s.get("kind", "?"), []).append(s)
+    rows = []
+    for kind, items in groups.items():
+        walls = sorted(s["wall_s"] for s in items)
+        cpus = [s["cpu_s"] for s in items if s.get("cpu_s") is not None]
+        rss = [s["peak_rss_kb"] for s in items if s.get("peak_rss_kb")]
+        rows.append({
+            "kind": kind,
+            "count": len(items),
+            "total_s": sum(walls),
+            "mean_s": sum(walls) / len(walls),
+            "p95_s": walls[min(len(walls) - 1, int(len(walls) * 0.95))],
+            "cpu_s": sum(cpus) if cpus else None,
+            "max_rss_mb": max(rss) / 1024 if rss else None,
+            "failed": sum(1 for s in items if s.get("rc") not in (0, None)),
+        })
+    return sorted(rows, key=lambda r: r["total_s"], reverse=True)
+
+
+def format_summary(rows: list[dict]) -> list[str]:
+    """summarize() 결과를 로그/콘솔용 텍스트 줄로 만듭니다."""
+    lines = [f"{'kind':<10}{'n':>5}{'total':>9}{'mean':>8}{'p95':>8}{'cpu':>8}{'rss':>8}{'fail':>5}"]
+    for r in rows:
+        cpu = f"{r['cpu_s']:.1f}s" if r["cpu_s"] is not None else "-"
+        rss = f"{r['max_rss_mb']:.0f}M" if r["max_rss_mb"] is not None else "-"
+        lines.append(f"{r['kind']:<10}{r['count']:>5}{r['total_s']:>8.1f}s{r['mean_s']:>7.2f}s"
+                     f"{r['p95_s']:>7.2f}s{cpu:>8}{rss:>8}{r['failed']:>5}")
+    return lines
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(prog="python -m src.telemetry", description="ffmpeg 실행 기록 요약")
+    ap.add_argument("--last", type=int, default=None, help="최근 N개 span만 집계")
+    args = ap.parse_args()
+    spans = load_spans(args.last)
+    print(f"[INFO] {len(spans)}개 span ({SPANS_PATH})")
+    print("\n".join(format_summary(summarize(spans))))
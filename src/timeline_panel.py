@@ -1,11 +1,12 @@
 # timeline_panel.py
 from pathlib import Path
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QPoint, QEvent
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QLabel, QSizePolicy
 )
 from .rangeslider import RangeSlider
+from .scrub import ScrubSource, ScrubPopup
 
 # 썸네일 UI 관련 상수
 THUMB_H = 72          # 썸네일 이미지의 고정 높이
@@ -48,6 +49,57 @@ class TimelinePanel(QWidget):
         self.scroll.setFixedHeight(THUMB_H + THUMB_PAD_V*2 + 24)
         root.addWidget(self.scroll)
 
+        # 3. 슬라이더/썸네일 스트립 호버 미리보기 (썸네일/스프라이트에서 바로 잘라 보여 줌)
+        self.scrub = ScrubSource()
+        self._popup = ScrubPopup(self)
+        self.range.hovered.connect(self._on_hover)
+        self.inner.setMouseTracking(True)
+        self.inner.installEventFilter(self)
+
+    def set_duration(self, sec: float):
+        """호버 위치를 시간으로 바꾸기 위한 영상 길이. 새 영상이면 이전 스프라이트와 썸네일은 버립니다."""
+        self.scrub.clear()
+        self.scrub.duration = sec
+        self._popup.hide()
+
+    def set_sprite(self, meta: dict | None):
+        """백그라운드에서 만든 스프라이트(scrub.build_sprite 결과)를 호버 미리보기에 사용합니다."""
+        self.scrub.set_sprite(meta)
+
+    def _on_hover(self, frac: float):
+        x = 10 + int(frac * (self.range.width() - 20))
+        self._show_scrub(frac, self.range.mapToGlobal(QPoint(x, 0)))
+
+    def _show_scrub(self, frac: float, global_pos: QPoint):
+        """영상의 frac(0~1, 음수면 숨김) 위치 프레임을 global_pos 위에 띄웁니다."""
+        pm = self.scrub.frame_at(frac * self.scrub.duration) if frac >= 0 else None
+        if pm is None or pm.isNull():
+            self._popup.hide()
+            return
+        sec = frac * self.scrub.duration
+        self._popup.show_frame(pm, f"{int(sec // 60):02d}:{sec % 60:06.3f}", global_pos)
+
+    def eventFilter(self, obj, ev):
+        # 썸네일 스트립 위에서도 슬라이더와 같은 호버 미리보기를 보여 줍니다.
+        if obj is self.inner:
+            if ev.type() == QEvent.MouseMove:
+                self._on_strip_hover(ev.position().toPoint())
+            elif ev.type() == QEvent.Leave:
+                self._popup.hide()
+        return super().eventFilter(obj, ev)
+
+    def _on_strip_hover(self, pos: QPoint):
+        """썸네일 i는 영상을 칸 수로 나눈 i번째 구간의 시작이므로, 칸 안의 가로 위치로 그 구간 안의 시각을 고릅니다."""
+        cells = [self.inner_lay.itemAt(i).widget() for i in range(self.inner_lay.count())]
+        cells = [w for w in cells if isinstance(w, QLabel)]
+        for i, lb in enumerate(cells):
+            g = lb.geometry()
+            if g.left() <= pos.x() <= g.right():
+                frac = (i + (pos.x() - g.left()) / max(1, g.width())) / len(cells)
+                self._show_scrub(frac, self.inner.mapToGlobal(QPoint(pos.x(), g.top())))
+                return
+        self._popup.hide()
+
     def visible_cells(self) -> int:
         """현재 위젯 너비를 기준으로 화면에 보여질 썸네일 개수를 추정합니다."""
         w = max(1, self.width() - 16)
@@ -55,6 +107,7 @@ class TimelinePanel(QWidget):
 
     def clear_thumbs(self):
         """현재 표시된 모든 썸네일 이미지를 제거합니다."""
+        self.scrub.thumbs = []
         while self.inner_lay.count():
             item = self.inner_lay.takeAt(0)
             widget = item.widget()
@@ -71,12 +124,14 @@ class TimelinePanel(QWidget):
             lb = QLabel()
             lb.setAlignment(Qt.AlignCenter)
             lb.setStyleSheet("background:#000; border-radius:6px;")
+            lb.setAttribute(Qt.WA_TransparentForMouseEvents)  # 호버는 스트립(self.inner)에서 처리
             
             pm = QPixmap(str(fp))
             if not pm.isNull():
                 # 이미지를 고정 높이에 맞춰 부드럽게 스케일링
                 pm = pm.scaledToHeight(THUMB_H, Qt.SmoothTransformation)
                 lb.setPixmap(pm)
+                self.scrub.thumbs.append(pm)
                 
             lb.setFixedHeight(THUMB_H)
             lb.setMinimumWidth(CELL_W_MIN - 10)
@@ -1,9 +1,9 @@
 # ui.py
-import json
+import json, threading
 from pathlib import Path
 from PySide6.QtCore import Qt, QTimer, QUrl, QThread, Signal, QLocale
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QSplitter, QTextEdit, QFileDialog, QMessageBox,
+    QMainWindow, QWidget, QVBoxLayout, QSplitter, QFileDialog, QMessageBox,
     QHBoxLayout, QLabel, QLineEdit, QPushButton, QSizePolicy
 )
 from PySide6.QtGui import QDesktopServices
@@ -15,19 +15,24 @@ from .constants import (
 )
 from .i18n import t
 from .ffmpeg_tools import (
-    find_executable, run_quiet, probe_duration_sec, extract_preview_frame,
-    build_gif_commands_auto, tidy_ffmpeg_dir, auto_setup_ffmpeg
+    find_executable, run_quiet, output_paths, probe_duration_sec, probe_frame_rate, preview_frame_cmd,
+    build_gif_commands_auto, build_export_commands, EXPORT_FORMATS,
+    build_timeline_thumbs, clear_timeline_thumbs,
+    auto_setup_ffmpeg
 )
-from .updater import check_latest
+from . import autotune
 from .preview_bar import PreviewBar
 from .timeline_panel import TimelinePanel
 from .options_panel import OptionsPanel
 from .output_panel import OutputPanel
-from .about_dialog import AboutDialog # 새로 만든 AboutDialog 클래스를 가져옵니다.
+from .log_panel import LogView
+# 업데이트 확인(urllib), 정보 창, 프레임 분석(numpy), 실행 통계는 첫 화면에 필요 없으므로
+# 실제로 쓰이는 메소드 안에서 불러옵니다(시작 속도).
 
 REPO_OWNER = "deuxdoom"
 REPO_NAME  = "APEXGIFMAKER"
 RELEASES_URL = f"https://github.com/{REPO_OWNER}/{REPO_NAME}/releases/latest"
+PREVIEW_TIMEOUT_SEC = 15
 
 class _FfmpegPrepareWorker(QThread):
     log = Signal(str)
@@ -37,14 +42,85 @@ class _FfmpegPrepareWorker(QThread):
             auto_setup_ffmpeg(lambda s: self.log.emit(s))
         except Exception as e:
             self.log.emit(f"[ERR] ffmpeg 준비 실패: {e}")
+        ffmpeg = find_executable("ffmpeg")
+        if ffmpeg:
+            # 기능 조회(버전/필터/옵션 문법)를 미리 해 두면 첫 변환 때 지연이 없습니다(실행 파일당 1회 캐시).
+            from .capabilities import version_line
+            self.log.emit(f"[INFO] {version_line(ffmpeg) or ffmpeg}")
         self.done.emit(find_executable("ffmpeg") or "", find_executable("ffprobe") or "")
 
+class _UpdateCheckWorker(QThread):
+    """업데이트 확인을 GUI 스레드 밖에서 실행합니다(오프라인에서도 창이 멈추지 않도록)."""
+    done = Signal(str, bool, str, bool)  # tag, newer, error, from_cache
+    def __init__(self, interval_sec: float, force: bool, parent=None):
+        super().__init__(parent)
+        self.interval_sec = interval_sec
+        self.force = force
+    def run(self):
+        from .updater import check_latest_cached
+        tag, newer, err, cached = check_latest_cached(
+            REPO_OWNER, REPO_NAME, APP_VERSION, CACHE_DIR / "update_check.json",
+            interval_sec=self.interval_sec, force=self.force)
+        self.done.emit(tag or "", bool(newer), err or "", cached)
+
+class _AutotuneWorker(QThread):
+    """
+    이 머신에 맞는 ffmpeg 스레드 설정을 백그라운드에서 측정합니다('스레드 보정' 버튼으로만 시작).
+    다른 변환이 도는 동안은 측정을 미루고, 중단 요청(requestInterruption)을 조합 사이마다 확인합니다.
+    """
+    log = Signal(str)
+    def __init__(self, ffmpeg_path: str, parent=None):
+        super().__init__(parent)
+        self.ffmpeg_path = ffmpeg_path
+    def run(self):
+        try:
+            self.log.emit("[TUNE] ffmpeg 스레드 설정 자동 보정을 시작합니다(다른 변환이 없을 때만 측정)…")
+            autotune.calibrate(self.ffmpeg_path, lambda s: self.log.emit(s),
+                               should_stop=self.isInterruptionRequested)
+        except Exception as e:
+            self.log.emit(f"[WARN] 자동 보정 실패: {e}")
+
+class _AnalysisWorker(QThread):
+    """
+    영상 전체의 움직임/장면 분석 인덱스, 타임라인 호버 미리보기용 스프라이트, 초당 색 인덱스(color_index)를
+    백그라운드에서 만듭니다(영상별 캐시). 캐시가 없는 것들은 원본을 한 번만 디코딩해 함께 만듭니다.
+    """
+    done = Signal(str, object)         # video_path, index(dict) 또는 None
+    sprite_done = Signal(str, object)  # video_path, 스프라이트 정보(dict) 또는 None
+    def __init__(self, ffmpeg_path: str, video_path: str, duration: float = 0.0, parent=None):
+        super().__init__(parent)
+        self.ffmpeg_path, self.video_path, self.duration = ffmpeg_path, video_path, duration
+    def run(self):
+        from .motion_index import load_index as load_motion
+        from .scrub import load_sprite
+        from .color_index import load_index as load_colors
+        from .analysis_decode import build_all
+        idx = meta = None
+        try:
+            idx, meta = load_motion(self.video_path), load_sprite(self.video_path)
+            # 색 인덱스는 생성 시점에 캐시에서 읽으므로 완료 알림이 필요 없습니다.
+            need_colors = load_colors(self.video_path) is None
+            if idx is None or meta is None or need_colors:
+                with autotune.job_slot():
+                    res = build_all(self.ffmpeg_path, self.video_path, self.duration,
+                                    motion=idx is None, sprite=meta is None, colors=need_colors,
+                                    should_stop=self.isInterruptionRequested)
+                idx, meta = idx or res["motion"], meta or res["sprite"]
+        except Exception:
+            pass
+        if self.isInterruptionRequested():
+            return
+        self.done.emit(self.video_path, idx)
+        self.sprite_done.emit(self.video_path, meta)
+
 class MainWindow(QMainWindow):
+    # 프리뷰 추출 완료 (요청 번호, 작업 목록, 캐시 키, futures) — 실행기 스레드에서 GUI 스레드로 전달
+    _previewReady = Signal(object)
+
     def __init__(self):
         super().__init__()
         
         self.setWindowTitle(f"APEX GIF MAKER v{APP_VERSION}")
-        self.setWindowIcon(get_app_icon())
         self.resize(1200, 820)
         self.setMinimumSize(1100, 760)
 
@@ -53,11 +129,21 @@ class MainWindow(QMainWindow):
         self.ffprobe_path = find_executable("ffprobe")
         self.video_path = ""
         self.duration_sec = 0.0
+        self.frame_rate = 0.0   # 원본 프레임 레이트 (타임라인을 프레임 시각에 맞춤, 0이면 연속)
         
         self._drag_active = None
         self._drag_span_sec = None
         self._prev_lo_sec = 0.0
         self._prev_hi_sec = 0.0
+        # 업데이트 확인 간격(시간). settings.json의 "update_check_hours"로 변경 가능
+        self.update_check_hours = 24
+        # 구간 디코딩 캐시: 같은 구간을 다시 만들 때 채웁니다. settings.json의 "range_cache"가 false면 사용 안 함
+        self.range_cache_enabled = True
+        self.range_cache_width = 640    # 구간 캐시 작업 해상도 너비. settings.json의 "range_cache_width"
+        self._range_cached = False
+        self._last_build_range = None   # 마지막으로 만든 (영상, 구간들) — 같은 구간을 다시 만들 때만 캐시를 채움
+        # paletteuse diff_mode=rectangle(정지 구간이 많으면 빠르고 작지만 결과가 달라짐). settings.json의 "paletteuse_diff_rect"
+        self.diff_rect = False
 
         self._timeline_timer = QTimer(self)
         self._timeline_timer.setSingleShot(True)
@@ -68,11 +154,15 @@ class MainWindow(QMainWindow):
         self.preview_timer.setSingleShot(True)
         self.preview_timer.setInterval(200)
         self.preview_timer.timeout.connect(self._update_split_preview)
+        self._preview_serial = 0
+        self._previewReady.connect(self._on_preview_ready)
         
         self._build_ui()
         self._load_settings()
         
         self._prep_worker = None
+        # 아이콘 디코딩은 첫 화면이 그려진 뒤로 미룹니다.
+        QTimer.singleShot(0, lambda: self.setWindowIcon(get_app_icon()))
         QTimer.singleShot(0, self._prepare_tools_async)
         QTimer.singleShot(1200, lambda: self._check_updates(True))
 
@@ -110,9 +200,20 @@ class MainWindow(QMainWindow):
         
         self.btn_open = QPushButton("열기…")
         self.btn_open.setObjectName("OpenButton")
+
+        # 여러 구간 GIF: 현재 구간을 목록에 추가(여러 번) → GIF 생성 시 하나로 이어 붙임
+        self.btn_add_seg = QPushButton("구간 추가" if self.lang == "ko" else "Add Range")
+        self.btn_clear_seg = QPushButton("구간 비우기" if self.lang == "ko" else "Clear Ranges")
+        self.btn_clear_seg.setEnabled(False)
         
         file_row.addWidget(QLabel("입력 비디오:"))
         file_row.addWidget(self.le_video, 1)
+        # 분석 인덱스 기반 추천 구간: 누를 때마다 다음 추천 구간으로 이동
+        self.btn_suggest = QPushButton("추천 구간" if self.lang == "ko" else "Suggest")
+        self.btn_suggest.setEnabled(False)
+        file_row.addWidget(self.btn_suggest)
+        file_row.addWidget(self.btn_add_seg)
+        file_row.addWidget(self.btn_clear_seg)
         file_row.addWidget(self.btn_play)
         file_row.addWidget(self.btn_open)
         lay.addLayout(file_row)
@@ -127,7 +228,7 @@ class MainWindow(QMainWindow):
         log_layout.setContentsMargins(0, 0, 0, 0)
         log_layout.setSpacing(5)
 
-        self.log = QTextEdit(); self.log.setReadOnly(True)
+        self.log = LogView()  # 일괄 반영 + 최대 줄 수 제한 + 파일 기록(cache/logs/app.log)
         log_layout.addWidget(self.log, 1) # 로그창이 수직 공간을 모두 차지
 
         # 버튼들을 담을 수평 레이아웃
@@ -136,7 +237,12 @@ class MainWindow(QMainWindow):
 
         self.btn_log_clear = QPushButton("로그 지우기")
         self.btn_about = QPushButton("정보")
+        self.btn_stats = QPushButton("실행 통계")
+        self.btn_tune = QPushButton("스레드 보정")
+        self.btn_tune.setToolTip("짧은 테스트 영상을 여러 번 변환해 이 PC에 맞는 ffmpeg 스레드 설정을 측정합니다(수 분).")
         
+        button_row.addWidget(self.btn_tune)
+        button_row.addWidget(self.btn_stats)
         button_row.addWidget(self.btn_log_clear)
         button_row.addWidget(self.btn_about)
         
@@ -153,24 +259,42 @@ class MainWindow(QMainWindow):
         # --- 시그널 연결 (새 버튼들 추가) ---
         self.btn_open.clicked.connect(self._browse_video)
         self.btn_play.clicked.connect(self._play_range)
+        self.btn_add_seg.clicked.connect(self._add_segment)
+        self.btn_suggest.clicked.connect(self._apply_next_suggestion)
+        self.btn_clear_seg.clicked.connect(self._clear_segments)
         self.preview.startEdited.connect(self._apply_edits_to_range)
         self.preview.endEdited.connect(self._apply_edits_to_range)
         self.timeline.range.changed.connect(self._on_range_changed)
         self.options.ditherHelp.connect(self._show_dither_help)
+        self.options.savePalette.connect(self._save_palette)
         self.output.chooseClicked.connect(self._choose_output)
         self.output.generateClicked.connect(self._generate)
         self.btn_log_clear.clicked.connect(self.log.clear) # 로그 지우기 버튼 연결
         self.btn_about.clicked.connect(self._show_about_dialog) # 정보 버튼 연결
+        self.btn_stats.clicked.connect(self._show_span_summary)
+        self.btn_tune.clicked.connect(self._start_autotune)
         
         self._apply_language()
 
     # ▼▼▼ 추가된 부분: About 다이얼로그를 표시하는 메소드 ▼▼▼
     def _show_about_dialog(self):
         """'정보' 버튼 클릭 시 About 다이얼로그를 생성하고 표시합니다."""
+        from .about_dialog import AboutDialog
         dialog = AboutDialog(self)
         dialog.exec()
     # ▲▲▲ 추가 완료 ▲▲▲
 
+    def _show_span_summary(self):
+        """ffmpeg 실행 기록(cache/spans.jsonl)을 종류별로 집계해 로그창에 표시합니다."""
+        from .telemetry import load_spans, summarize, format_summary
+        spans = load_spans()
+        if not spans:
+            self._append_log("[STATS] 기록된 실행 내역이 없습니다.")
+            return
+        self._append_log(f"[STATS] ffmpeg 실행 {len(spans)}회 요약")
+        for line in format_summary(summarize(spans)):
+            self._append_log(line)
+
     def _apply_language(self):
         tr = lambda k: t(self.lang, k)
         self.output.apply_texts(tr)
@@ -222,6 +346,24 @@ class MainWindow(QMainWindow):
     def _on_prepare_done(self, ff, fp):
         self.ffmpeg_path, self.ffprobe_path = ff, fp
         self._append_log(f"[INFO] ffmpeg: {Path(ff).name if ff else '없음'} | ffprobe: {Path(fp).name if fp else '없음'}")
+        if ff and not autotune.has_profile(ff):
+            self._append_log("[INFO] ffmpeg 스레드 설정이 보정되지 않았습니다('스레드 보정' 버튼으로 측정할 수 있습니다).")
+
+    def _start_autotune(self):
+        """스레드 설정 보정을 시작합니다(약 40회 짧은 변환). 이미 실행 중이면 무시합니다."""
+        if not self.ffmpeg_path:
+            self.warn("준비", "ffmpeg를 준비하고 있습니다. 잠시 후 다시 시도해 주세요.")
+            return
+        if getattr(self, "_tune_worker", None) and self._tune_worker.isRunning():
+            return
+        if autotune.has_profile(self.ffmpeg_path) and not self.ask_yes_no(
+                "스레드 보정", "이미 보정한 설정이 있습니다. 다시 측정하시겠습니까?"):
+            return
+        self._tune_worker = _AutotuneWorker(self.ffmpeg_path, self)
+        self._tune_worker.log.connect(self._append_log)
+        self._tune_worker.finished.connect(lambda: self.btn_tune.setEnabled(True))
+        self.btn_tune.setEnabled(False)
+        self._tune_worker.start()
 
     def _browse_video(self):
         cap = "Videos (*.mp4 *.mov *.mkv *.webm *.avi);;All files (*.*)"
@@ -241,24 +383,82 @@ class MainWindow(QMainWindow):
         try:
             self.le_video.setText(str(p))
             self.duration_sec = probe_duration_sec(self.ffprobe_path, str(p))
+            self.frame_rate = probe_frame_rate(self.ffprobe_path, str(p))
+            # 구간 핸들을 실제 프레임 시각에만 놓이게 해, 같은 프레임이면 프리뷰 캐시 키도 같아지도록 합니다.
+            self.timeline.range.set_step(1.0 / (self.frame_rate * self.duration_sec)
+                                         if self.frame_rate > 0 and self.duration_sec > 0 else 0.0)
             self.video_path = str(p)
+            st = p.stat()
+            self._video_fp = f"{p.resolve()}|{st.st_size}|{st.st_mtime_ns}"
 
             span = min(6.0, TRIM_MAX_SEC, self.duration_sec)
             if span < TRIM_MIN_SEC:
                 span = min(self.duration_sec, TRIM_MIN_SEC)
             hi = span / max(1e-9, self.duration_sec)
+            self.timeline.range.clear_marks()
+            self.btn_clear_seg.setEnabled(False)
+            self._evict_range_cache()
+            self.timeline.set_duration(self.duration_sec)  # 이전 영상의 호버 미리보기(스프라이트/썸네일)를 비움
             self.timeline.range.setRange(0.0, hi)
 
             self._update_time_edits()
             self._build_timeline()
             self._update_split_preview()
+            self._start_analysis()
             
             self._append_log(f"[OK] loaded: {p.name}")
         except Exception as e:
             self.error("오류", f"동영상 정보를 읽는 중 문제 발생:\n{e}")
 
+    def _evict_range_cache(self):
+        """구간이 바뀌면 이전 구간의 디코딩 캐시 파일을 지웁니다."""
+        if self._range_cached:
+            from .range_cache import evict
+            evict()
+            self._range_cached = False
+
+    def _start_analysis(self):
+        """새 영상의 움직임/장면 분석을 백그라운드에서 시작합니다(이전 분석은 중단)."""
+        old = getattr(self, "_analysis_worker", None)
+        if old and old.isRunning():
+            old.requestInterruption()
+        self._suggestions, self._suggest_idx = [], 0
+        self.btn_suggest.setEnabled(False)
+        self.timeline.range.set_activity([], [])
+        self._analysis_worker = _AnalysisWorker(self.ffmpeg_path, self.video_path, self.duration_sec, self)
+        self._analysis_worker.done.connect(self._on_analysis_done)
+        self._analysis_worker.sprite_done.connect(self._on_sprite_done)
+        self._analysis_worker.start()
+
+    def _on_analysis_done(self, video_path, index):
+        if video_path != self.video_path or not index:
+            return
+        from .motion_index import cut_seconds, suggest_ranges
+        motion = index.get("motion", [])
+        peak = max(motion, default=0.0) or 1.0
+        dur = max(1e-9, self.duration_sec)
+        self.timeline.range.set_activity([v / peak for v in motion],
+                                         [c / dur for c in cut_seconds(index)])
+        self._suggestions = suggest_ranges(index, self.duration_sec)
+        self._suggest_idx = 0
+        self.btn_suggest.setEnabled(bool(self._suggestions))
+        if self._suggestions:
+            self._append_log("[INFO] 추천 구간: " + ", ".join(f"{a:.0f}~{b:.0f}s" for a, b, _ in self._suggestions))
+
+    def _on_sprite_done(self, video_path, meta):
+        if video_path == self.video_path and meta:
+            self.timeline.set_sprite(meta)
+
+    def _apply_next_suggestion(self):
+        if not self._suggestions or self.duration_sec <= 0: return
+        a, b, _ = self._suggestions[self._suggest_idx % len(self._suggestions)]
+        self._suggest_idx += 1
+        self.timeline.range.setRange(a / self.duration_sec, b / self.duration_sec)
+
     def _on_range_changed(self, _lo, _hi):
         if self.duration_sec <= 0: return
+        if not self.timeline.range.marks():  # 추가한 구간으로 만들 때는 선택 구간이 바뀌어도 캐시 유지
+            self._evict_range_cache()
 
         active = self.timeline.range.active_handle()
         lo = self.timeline.range.lower() * self.duration_sec
@@ -293,6 +493,26 @@ class MainWindow(QMainWindow):
             self._drag_active = None
             self._drag_span_sec = None
 
+    def _segments_sec(self) -> list[tuple[float, float]]:
+        return [(a * self.duration_sec, b * self.duration_sec) for a, b in self.timeline.range.marks()]
+
+    def _add_segment(self):
+        if self.duration_sec <= 0: return
+        rng = self.timeline.range
+        rng.add_mark(rng.lower(), rng.upper())
+        self._evict_range_cache()
+        segs = self._segments_sec()
+        total = sum(b - a for a, b in segs)
+        self.btn_clear_seg.setEnabled(True)
+        self._append_log(f"[INFO] 구간 {len(segs)}개 (합계 {total:.2f}초): "
+                         + ", ".join(f"{a:.2f}~{b:.2f}" for a, b in segs))
+
+    def _clear_segments(self):
+        self.timeline.range.clear_marks()
+        self.btn_clear_seg.setEnabled(False)
+        self._evict_range_cache()
+        self._append_log("[INFO] 추가한 구간을 모두 지웠습니다.")
+
     def _apply_edits_to_range(self):
         if self.duration_sec <= 0: return
 
@@ -352,34 +572,62 @@ class MainWindow(QMainWindow):
             
         lo = self.timeline.range.lower() * self.duration_sec
         hi = self.timeline.range.upper() * self.duration_sec
+        self._preview_serial += 1
+        serial = self._preview_serial
+        fp = getattr(self, "_video_fp", self.video_path)
+        keys = (f"{fp}@{lo:.3f}", f"{fp}@{hi:.3f}")
         try:
-            p1 = extract_preview_frame(self.ffmpeg_path, self.video_path, lo)
-            p2 = extract_preview_frame(self.ffmpeg_path, self.video_path, hi)
-            self.preview.set_images(str(p1), str(p2))
+            jobs = [preview_frame_cmd(self.ffmpeg_path, self.video_path, ts) for ts in (lo, hi)]
+        except OSError as e:
+            self._append_log(f"[ERR] preview: {e}")
+            return
+        if not any(cmd for cmd, _ in jobs):  # 둘 다 캐시에 있음
+            self._on_preview_ready((serial, jobs, keys, []))
+            return
+        # 시작/끝 프레임을 비동기 실행기에서 동시에 추출하고(멈춘 ffmpeg는 시간 초과로 종료),
+        # 둘 다 끝나면 시그널로 GUI 스레드에 알립니다. GUI 스레드는 기다리지 않습니다.
+        from .proc_async import get_runner
+        runner = get_runner()
+        futures = [runner.submit(cmd, kind="preview", timeout=PREVIEW_TIMEOUT_SEC, outputs=[path])
+                   for cmd, path in jobs if cmd]
+        remaining, lock = [len(futures)], threading.Lock()
+
+        def on_done(_):
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self._previewReady.emit((serial, jobs, keys, futures))
+
+        for f in futures:
+            f.add_done_callback(on_done)
+
+    def _on_preview_ready(self, payload):
+        serial, jobs, keys, futures = payload
+        if serial != self._preview_serial:  # 그 사이 구간이 다시 바뀜
+            return
+        try:
+            for f in futures:
+                p = f.result()
+                if p.returncode != 0:
+                    raise RuntimeError(p.stderr.strip() or "preview failed")
         except Exception as e:
             self._append_log(f"[ERR] preview: {e}")
+            return
+        self.preview.set_images(str(jobs[0][1]), str(jobs[1][1]), keys=keys)
 
     def _build_timeline(self):
-        thumbs = CACHE_DIR / "timeline"
-        thumbs.mkdir(parents=True, exist_ok=True)
-        for fp in thumbs.glob("thumb_*.png"):
-            try: fp.unlink()
-            except: pass
         self.timeline.clear_thumbs()
-        
-        if not (self.video_path and self.ffmpeg_path and self.duration_sec > 0): return
+        if not (self.video_path and self.ffmpeg_path and self.duration_sec > 0):
+            clear_timeline_thumbs(CACHE_DIR / "timeline")
+            return
 
         K = self.timeline.visible_cells()
-        fps_val = max(0.01, K / self.duration_sec)
-        
-        vf = f"fps={fps_val:.6f},scale=320:-1:flags=lanczos"
-        cmd = [self.ffmpeg_path, "-hide_banner", "-loglevel", "error",
-               "-i", self.video_path, "-vf", vf, str(thumbs / "thumb_%05d.png")]
-        self._append_log("[RUN] thumbs(adaptive): " + " ".join(map(str, cmd)))
-        run_quiet(cmd)
-
-        files = sorted(thumbs.glob("thumb_*.png"))
-        self.timeline.add_thumb_files(list(files))
+        with autotune.job_slot():
+            files = build_timeline_thumbs(self.ffmpeg_path, self.video_path, self.duration_sec, K,
+                                          CACHE_DIR / "timeline", log=self._append_log,
+                                          thread_args=autotune.thread_args(self.ffmpeg_path, autotune.active_jobs()))
+        self.timeline.add_thumb_files(files)
 
     def _play_range(self):
         if not (self.video_path and self.ffmpeg_path):
@@ -391,16 +639,17 @@ class MainWindow(QMainWindow):
         dur = max(0.0, hi - lo)
         
         try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
             out = CACHE_DIR / "preview_play.mp4"
             cmd_copy = [self.ffmpeg_path, "-ss", f"{lo:.3f}", "-t", f"{dur:.3f}", "-i", self.video_path,
                         "-c", "copy", "-movflags", "faststart", "-y", "-hide_banner", "-loglevel", "error", str(out)]
-            p = run_quiet(cmd_copy)
+            p = run_quiet(cmd_copy, kind="playback", outputs=[out])
             
             if p.returncode != 0 or not out.exists() or out.stat().st_size == 0:
                 cmd_enc = [self.ffmpeg_path, "-ss", f"{lo:.3f}", "-t", f"{dur:.3f}", "-i", self.video_path,
                            "-c:v", "libx264", "-preset", "ultrafast", "-crf", "23", "-c:a", "aac", "-b:a", "128k",
                            "-movflags", "faststart", "-y", "-hide_banner", "-loglevel", "error", str(out)]
-                p = run_quiet(cmd_enc)
+                p = run_quiet(cmd_enc, kind="playback", outputs=[out])
                 if p.returncode != 0: raise RuntimeError(p.stderr)
                 
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(out)))
@@ -432,11 +681,15 @@ class MainWindow(QMainWindow):
             self.warn("오류", "먼저 비디오를 불러오세요.")
             return
 
-        lo = self.timeline.range.lower() * self.duration_sec
-        hi = self.timeline.range.upper() * self.duration_sec
-        duration = max(0.0, hi - lo)
+        # 추가한 구간이 있으면 그 구간들을 이어 붙이고, 없으면 현재 선택 구간 하나를 사용합니다.
+        segments = self._segments_sec()
+        if not segments:
+            segments = [(self.timeline.range.lower() * self.duration_sec,
+                         self.timeline.range.upper() * self.duration_sec)]
+        lo, hi = segments[0][0], segments[-1][1]
+        duration = sum(max(0.0, b - a) for a, b in segments)
         if not (TRIM_MIN_SEC <= duration <= TRIM_MAX_SEC):
-            self.warn("경고", f"구간 길이는 {TRIM_MIN_SEC}~{TRIM_MAX_SEC}초 사이여야 합니다.")
+            self.warn("경고", f"구간 길이(합계)는 {TRIM_MIN_SEC}~{TRIM_MAX_SEC}초 사이여야 합니다.")
             return
 
         mode_idx, fps, w, h, scale_mode, dither_key = self.options.values()
@@ -448,16 +701,182 @@ class MainWindow(QMainWindow):
             self.output.set_path(out_path)
 
         alg = "even" if mode_idx == 0 else "mpdecimate"
-        cmds = build_gif_commands_auto(
-            self.ffmpeg_path, self.video_path, lo, hi, fps, w, h, scale_mode, alg, dither_key, out_path
-        )
+        palette_mode = self.options.palette_mode()
+        palette_sample = self.options.palette_sample()
+        extra_fmts = self.output.extra_formats()
+        extra_paths = [str(Path(out_path).with_suffix(EXPORT_FORMATS[f])) for f in extra_fmts]
+        # 추가 형식의 크기: 가로를 따로 정했으면 GIF 비율로 세로를 맞춥니다.
+        widths = self.output.format_widths()
+        extra_sizes = [(widths[f], max(2, round(h * widths[f] / w))) if widths.get(f) else (w, h)
+                       for f in extra_fmts]
+
+        # 요청한 설정을 그대로 쓸 수 없어 다른 방법으로 대체한 내용은 로그와 완료 창에 모두 알립니다.
+        fallbacks = []
+        def fallback(msg: str):
+            fallbacks.append(msg)
+            self._append_log(f"[WARN] {msg}")
+        def done_text() -> str:
+            text = f"GIF 생성이 완료되었습니다:\n{out_path}"
+            return text + "\n\n" + "\n".join(f"- {m}" for m in fallbacks) if fallbacks else text
+
+        palette_path = None
+        fixed_palette = self.options.fixed_palette()
+        if fixed_palette:
+            from .palette_library import resolve
+            palette_path = resolve(fixed_palette)
+            if palette_path is None:
+                fallback(f"고정 팔레트를 찾을 수 없어 영상에서 팔레트를 만듭니다: {fixed_palette}")
+            else:
+                if palette_mode == "scene":
+                    fallback("고정 팔레트를 쓰므로 장면별 팔레트 대신 고정 팔레트 하나를 사용합니다.")
+                palette_mode = "global"  # 고정 팔레트 하나로 양자화 (장면 감지 생략)
+                self._append_log(f"[INFO] 고정 팔레트 사용: {self.options.combo_fixed.currentText()} (Pass 1 생략)")
+        if palette_path is None and palette_sample == "index":
+            palette_path = self._index_palette(segments, scale_mode)
+            if palette_path is None:
+                fallback("색 인덱스 팔레트를 쓸 수 없어 자동 팔레트 분석을 사용합니다.")
+
+        # 구간 디코딩 캐시(range_cache): 같은 구간을 옵션만 바꿔 다시 만들면 구간을 작업 해상도로 한 번 디코딩해 두고,
+        # 분석/팔레트/인코딩은 그 파일을 읽습니다. 처음 만드는 구간은 원본에서 바로 변환합니다.
+        # 이미 있는 캐시는 먼저 헤더만 읽어 찾고, 새로 디코딩하는 것은 결과 캐시에 없을 때만 합니다.
+        from .range_cache import ensure as ensure_range_cache
+        range_id = (self.video_path, tuple(segments))
+        fill_range = self.range_cache_enabled and range_id == self._last_build_range
+        self._last_build_range = range_id
+        def range_source(build: bool):
+            try:
+                src = ensure_range_cache(self.ffmpeg_path, self.ffprobe_path, self.video_path, segments,
+                                         fps, w, h, self._append_log, build=build, work_w=self.range_cache_width)
+            except Exception as e:
+                self._append_log(f"[WARN] 구간 캐시를 사용할 수 없습니다: {e}")
+                return None
+            self._range_cached = self._range_cached or src is not None
+            return src
+        source = range_source(build=False) if self.range_cache_enabled else None
+
+        # 같은 영상·구간·옵션·ffmpeg로 만든 결과가 캐시에 있으면 변환 없이 바로 내놓습니다.
+        from . import build_cache
+        def make_build_key(source) -> str:
+            opts = self.options.get_options_dict()
+            if palette_sample == "index":
+                opts["index_palette"] = palette_path is not None  # 인덱스 준비 전(자동 대체) 결과와 구분
+            if self.diff_rect:
+                opts["diff_rect"] = True  # paletteuse 결과가 달라지므로 기본 출력과 구분
+            if fixed_palette and palette_path is not None:
+                opts["fixed_palette_mtime"] = palette_path.stat().st_mtime_ns  # 같은 이름으로 다시 저장한 경우 구분
+            if source is not None:
+                opts["range_source"] = [source.w, source.h]  # 구간 캐시를 거친 결과(크기 조절이 다름)와 구분
+            return build_cache.build_key(self.ffmpeg_path, self.video_path, segments, opts,
+                                         ["gif", *(f"{f}@{fw}x{fh}" for f, (fw, fh) in zip(extra_fmts, extra_sizes))])
+        build_key = None
+        try:
+            build_key = make_build_key(source)
+            if build_cache.lookup(build_key, [out_path, *extra_paths]):
+                self._append_log(f"[OK] 같은 조건의 결과를 캐시에서 가져왔습니다: {out_path}")
+                for p in extra_paths:
+                    self._append_log(f"[OK] 저장 완료: {p}")
+                self.info("완료", done_text())
+                return
+            build_cache.release([out_path, *extra_paths])
+        except OSError as e:
+            self._append_log(f"[WARN] 결과 캐시를 사용할 수 없습니다: {e}")
+
+        if source is None and fill_range:
+            source = range_source(build=True)
+            if source is not None and build_key is not None:
+                try:
+                    build_key = make_build_key(source)
+                except OSError:
+                    build_key = None
+
+        # 중복 제거와 장면 감지는 같은 저해상도 분석 프레임을 공유합니다(디코딩 1회).
+        from .frame_probe import load_probe_frames
+        from .dedupe import find_kept_frames
+        from .scenes import find_scene_cuts
+        frames = None
+        if alg == "mpdecimate" or palette_mode == "scene":
+            try:
+                # 여러 구간이면 구간별 분석 프레임을 이어 붙여 GIF와 같은 프레임 순서로 맞춥니다.
+                if source is not None:
+                    parts = [load_probe_frames(self.ffmpeg_path, self.video_path, lo, hi, fps, source=source)]
+                else:
+                    parts = [load_probe_frames(self.ffmpeg_path, self.video_path, a, b, fps) for a, b in segments]
+                if all(f is not None for f in parts):
+                    from .frame_probe import np
+                    frames = parts[0] if len(parts) == 1 else np.concatenate(parts)
+                else:
+                    fallback("numpy가 없어 프레임 분석을 건너뜁니다"
+                             + (" (중복 제거는 mpdecimate, 팔레트는 전역)." if palette_mode == "scene"
+                                else " (중복 제거는 mpdecimate)."))
+            except Exception as e:
+                fallback(f"프레임 분석 실패로 분석 없이 변환합니다: {e}")
+
+        keep_frames = None
+        if alg == "mpdecimate":
+            if frames is None:
+                from . import capabilities as caps
+                if caps.has_filter(self.ffmpeg_path, "mpdecimate"):
+                    self._append_log("[INFO] 중복 제거: mpdecimate 사용")
+                else:
+                    fallback("이 ffmpeg 빌드에는 mpdecimate가 없어 중복 제거 없이 변환합니다.")
+            else:
+                keep_frames = find_kept_frames(frames)
+                self._append_log(f"[INFO] 중복 제거: {len(frames)} → {len(keep_frames)} 프레임")
+
+        scene_cuts = None
+        if palette_mode == "scene" and frames is not None:
+            scene_cuts = find_scene_cuts(frames, fps)
+            self._append_log(f"[INFO] 장면별 팔레트: {len(scene_cuts) + 1}개 장면")
+
+        # GIF 하나만 만드는 긴 구간은 시간 조각으로 나눠 여러 ffmpeg 프로세스가 동시에 인코딩합니다.
+        from . import gif_parallel
+        parts = []
+        if not extra_fmts and alg == "even" and palette_mode == "global":
+            parts = gif_parallel.plan_parts(duration, fps, source=source)
+
+        cmds = []
+        try:
+            if extra_fmts:
+                # 추가 형식이 있으면 한 번의 디코딩으로 GIF와 함께 인코딩합니다(장면별 팔레트는 전역으로 대체).
+                if scene_cuts:
+                    fallback("추가 출력과 함께 만들 때는 장면별 팔레트 대신 전역 팔레트를 사용합니다.")
+                outputs = [{"fmt": "gif", "w": w, "h": h, "path": out_path}]
+                outputs += [{"fmt": f, "w": fw, "h": fh, "path": p}
+                            for f, (fw, fh), p in zip(extra_fmts, extra_sizes, extra_paths)]
+                cmds = build_export_commands(
+                    self.ffmpeg_path, self.video_path, lo, hi, fps, scale_mode, alg, dither_key, outputs,
+                    keep_frames=keep_frames, thread_args=autotune.thread_args(self.ffmpeg_path), segments=segments,
+                    source=source, palette_sample=palette_sample, palette_path=palette_path,
+                    diff_rect=self.diff_rect
+                )
+            elif not parts:  # 조각 병렬 인코딩은 아래에서 gif_parallel이 직접 실행
+                cmds = build_gif_commands_auto(
+                    self.ffmpeg_path, self.video_path, lo, hi, fps, w, h, scale_mode, alg, dither_key, out_path,
+                    keep_frames=keep_frames, scene_cuts=scene_cuts,
+                    thread_args=autotune.thread_args(self.ffmpeg_path), segments=segments, source=source,
+                    palette_sample=palette_sample, palette_path=palette_path, diff_rect=self.diff_rect
+                )
+        except ValueError as e:
+            self.warn("오류", str(e))
+            return
+        if len(segments) > 1:
+            self._append_log(f"[INFO] {len(segments)}개 구간을 한 번에 이어 붙여 변환합니다(합계 {duration:.2f}초).")
 
         self.output.btn_generate.setEnabled(False)
         self._append_log("[RUN] GIF 생성을 시작합니다...")
-        
+
+        if parts and not gif_parallel.encode(
+                self.ffmpeg_path, self.video_path, segments, fps, w, h, scale_mode, dither_key, out_path, parts,
+                source=source, palette_path=palette_path, palette_sample=palette_sample,
+                diff_rect=self.diff_rect, log=self._append_log):
+            self.error("오류", "ffmpeg 실행에 실패했습니다. 로그를 확인해주세요.")
+            self.output.btn_generate.setEnabled(True)
+            return
+
         for i, cmd in enumerate(cmds, start=1):
             self._append_log(f"[RUN] Pass {i}: {' '.join(map(str, cmd))}")
-            p = run_quiet(cmd)
+            with autotune.job_slot():
+                p = run_quiet(cmd, kind=f"pass{i}", outputs=output_paths(cmd))
             if p.stdout.strip(): self._append_log(p.stdout.strip())
             if p.stderr.strip(): self._append_log(p.stderr.strip())
             if p.returncode != 0:
@@ -467,27 +886,91 @@ class MainWindow(QMainWindow):
 
         if Path(out_path).is_file():
             self._append_log(f"[OK] GIF 저장 완료: {out_path}")
-            self.info("완료", f"GIF 생성이 완료되었습니다:\n{out_path}")
+            for p in extra_paths:
+                self._append_log(f"[OK] 저장 완료: {p}" if Path(p).is_file() else f"[WARN] 생성되지 않음: {p}")
+            if build_key and all(Path(p).is_file() for p in extra_paths):
+                build_cache.store(build_key, [out_path, *extra_paths])
+            self.info("완료", done_text())
         else:
             self._append_log("[ERR] 출력 파일이 생성되지 않았습니다.")
             self.warn("경고", "알 수 없는 오류로 출력 파일이 생성되지 않았습니다.")
 
-        tidy_ffmpeg_dir(self._append_log)
         self.output.btn_generate.setEnabled(True)
 
+    def _save_palette(self):
+        """현재 선택 구간에서 팔레트(Pass 1, 전체 프레임 분석)를 만들어 이름을 붙여 라이브러리에 저장합니다."""
+        if not self._ensure_tools() or not self.video_path:
+            self.warn("오류", "먼저 비디오를 불러오세요.")
+            return
+        from PySide6.QtWidgets import QInputDialog
+        name, ok = QInputDialog.getText(self, "팔레트 저장" if self.lang == "ko" else "Save Palette",
+                                        "이름:" if self.lang == "ko" else "Name:")
+        if not ok or not name.strip():
+            return
+        segments = self._segments_sec() or [(self.timeline.range.lower() * self.duration_sec,
+                                             self.timeline.range.upper() * self.duration_sec)]
+        _, fps, w, h, scale_mode, dither_key = self.options.values()
+        from . import palette_library
+        tmp = CACHE_DIR / "palette_save.png"
+        try:
+            pass1 = build_gif_commands_auto(
+                self.ffmpeg_path, self.video_path, segments[0][0], segments[-1][1], fps, w, h, scale_mode,
+                "even", dither_key, str(tmp.with_suffix(".gif")), thread_args=autotune.thread_args(self.ffmpeg_path),
+                palette_out=tmp, segments=segments
+            )[0]
+            self._append_log(f"[RUN] 팔레트 생성: {' '.join(map(str, pass1))}")
+            with autotune.job_slot():
+                p = run_quiet(pass1, kind="pass1", outputs=[tmp])
+            if p.returncode != 0:
+                raise RuntimeError(p.stderr.strip()[:300])
+            key = palette_library.save(name, tmp)
+        except (OSError, ValueError, RuntimeError) as e:
+            self.error("오류", f"팔레트를 저장하지 못했습니다: {e}")
+            return
+        self.options.refresh_palettes(select=key)
+        self._append_log(f"[OK] 팔레트 저장: {palette_library.USER_DIR / (key.split(':', 1)[1] + '.png')}")
+
+    def _index_palette(self, segments, scale_mode: str):
+        """색 인덱스에서 구간 팔레트를 만들어 경로를 반환합니다. 인덱스가 아직 없으면 None(자동 분석으로 대체)."""
+        import time
+        from .color_index import load_index, range_palette
+        from .palette_library import write_palette_png
+        try:
+            index = load_index(self.video_path)
+            if index is None:
+                self._append_log("[INFO] 색 인덱스가 아직 준비되지 않았습니다.")
+                return None
+            t0 = time.perf_counter()
+            # 레터박스 여백(검정)은 원본 화면에 없으므로 팔레트에 따로 넣습니다.
+            colors = range_palette(index, segments, reserve=[(0, 0, 0)] if scale_mode == "letterbox" else ())
+            path = write_palette_png(colors, CACHE_DIR / "palette_index.png")
+        except Exception as e:
+            self._append_log(f"[WARN] 색 인덱스 팔레트 실패: {e}")
+            return None
+        self._append_log(f"[INFO] 색 인덱스 팔레트: {len(colors)}색, {(time.perf_counter() - t0) * 1000:.0f} ms (Pass 1 생략)")
+        return path
+
     def _show_dither_help(self):
         self.info(t(self.lang, "dither_help"), t(self.lang, "dither_help_text"))
 
     def _check_updates(self, startup=False):
-        tag, newer, err = check_latest(REPO_OWNER, REPO_NAME, APP_VERSION)
+        if getattr(self, "_update_worker", None) and self._update_worker.isRunning():
+            return
+        self._update_startup = startup
+        self._update_worker = _UpdateCheckWorker(self.update_check_hours * 3600, force=not startup, parent=self)
+        self._update_worker.done.connect(self._on_update_checked)
+        self._update_worker.start()
+
+    def _on_update_checked(self, tag, newer, err, from_cache):
         if err:
-            self._append_log(f"[UPDATE] 업데이트 확인 실패: {err}")
+            if not from_cache:
+                self._append_log(f"[UPDATE] 업데이트 확인 실패: {err}")
             return
         if newer:
             self._append_log(f"[UPDATE] 새로운 버전 발견: {tag}")
             if self.ask_yes_no(t(self.lang, "update"), t(self.lang, "update_prompt")):
                 QDesktopServices.openUrl(QUrl(RELEASES_URL))
-        elif not startup:
+        elif not self._update_startup:
             self._append_log("[UPDATE] 현재 최신 버전입니다.")
     
     def _load_settings(self):
@@ -498,6 +981,12 @@ class MainWindow(QMainWindow):
                     settings = json.load(f)
                 self.output.set_path(settings.get("output_path", ""))
                 self.options.set_values(settings.get("options", {}))
+                self.output.set_extra_formats(settings.get("extra_formats", []))
+                self.output.set_format_widths(settings.get("format_widths", {}))
+                self.update_check_hours = float(settings.get("update_check_hours", self.update_check_hours))
+                self.range_cache_enabled = bool(settings.get("range_cache", self.range_cache_enabled))
+                self.range_cache_width = int(settings.get("range_cache_width", self.range_cache_width))
+                self.diff_rect = bool(settings.get("paletteuse_diff_rect", self.diff_rect))
         except Exception as e:
             self._append_log(f"[WARN] 설정 파일을 불러오는 데 실패했습니다: {e}")
 
@@ -507,6 +996,12 @@ class MainWindow(QMainWindow):
             settings = {
                 "output_path": self.output.get_path(),
                 "options": self.options.get_options_dict(),
+                "extra_formats": self.output.extra_formats(),
+                "format_widths": self.output.format_widths(),
+                "update_check_hours": self.update_check_hours,
+                "range_cache": self.range_cache_enabled,
+                "range_cache_width": self.range_cache_width,
+                "paletteuse_diff_rect": self.diff_rect,
             }
             with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
                 json.dump(settings, f, indent=4)
@@ -516,6 +1011,19 @@ class MainWindow(QMainWindow):
     def closeEvent(self, e):
         if self.ask_yes_no("종료", "프로그램을 종료하시겠습니까?"):
             self._save_settings()
+            self.log.close_file()
+            from .proc_async import close_runner
+            close_runner()
+            for name in ("_analysis_worker", "_tune_worker"):
+                worker = getattr(self, name, None)
+                if worker and worker.isRunning():
+                    worker.requestInterruption()
+                    worker.wait(5000)
+            # 업데이트 확인은 중간에 멈출 수 없지만 요청 시간 제한(updater timeout)이 있으므로 끝까지 기다립니다.
+            # (실행 중인 QThread 자식이 창과 함께 파괴되면 프로그램이 비정상 종료됩니다.)
+            worker = getattr(self, "_update_worker", None)
+            if worker and worker.isRunning():
+                worker.wait()
             e.accept()
         else:
             e.ignore()
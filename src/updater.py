@@ -1,5 +1,6 @@
 # updater.py
-import json, urllib.request
+import json, time, urllib.error, urllib.request
+from pathlib import Path
 from typing import Tuple
 
 def normalize_version(v: str) -> tuple:
@@ -11,9 +12,17 @@ def normalize_version(v: str) -> tuple:
     except Exception:
         return tuple()
 
+def _is_newer(tag: str, current_version: str) -> bool:
+    cur = normalize_version(current_version)
+    new = normalize_version(tag)
+    return bool(new and cur and new > cur)
+
+def _api_url(owner: str, repo: str) -> str:
+    return f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+
 def check_latest(owner: str, repo: str, current_version: str, timeout=5) -> Tuple[str, bool, str | None]:
     """GitHub latest tag, is_newer, error_message"""
-    api = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+    api = _api_url(owner, repo)
     try:
         req = urllib.request.Request(api, headers={
             "User-Agent": f"{repo}/{current_version}",
@@ -24,8 +33,70 @@ def check_latest(owner: str, repo: str, current_version: str, timeout=5) -> Tupl
         tag = str(data.get("tag_name","")).strip()
         if not tag:
             return "", False, "no tag_name"
-        cur = normalize_version(current_version)
-        new = normalize_version(tag)
-        return tag, (new and cur and new > cur), None
+        return tag, _is_newer(tag, current_version), None
     except Exception as e:
         return "", False, str(e)
+
+# 실패(오프라인/방화벽) 후 다시 시도하기까지의 최소 간격(초)
+RETRY_AFTER_FAIL_SEC = 3600
+
+def _load_state(cache_path: Path) -> dict:
+    try:
+        return json.loads(Path(cache_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def _save_state(cache_path: Path, state: dict):
+    try:
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(cache_path).write_text(json.dumps(state, indent=2), encoding="utf-8")
+    except OSError:
+        pass
+
+def check_latest_cached(owner: str, repo: str, current_version: str, cache_path: Path,
+                        interval_sec: float = 24 * 3600, timeout=5, force=False,
+                        api_url: str | None = None) -> Tuple[str, bool, str | None, bool]:
+    """
+    check_latest의 캐시/조건부 요청 버전. 반환: (tag, is_newer, error_message, from_cache)
+    - 마지막 확인 후 interval_sec가 지나지 않았으면 네트워크 없이 캐시된 결과를 돌려줍니다.
+    - 저장된 ETag로 If-None-Match 요청을 보내 304(변경 없음)면 본문 없이 캐시를 재사용합니다.
+      (GitHub API는 304 응답을 요청 한도에 포함하지 않습니다)
+    - 실패 시에도 RETRY_AFTER_FAIL_SEC 동안은 다시 시도하지 않습니다.
+    - api_url: 테스트용 로컬 HTTP 서버 주소 등으로 바꿀 때 사용
+    """
+    state = _load_state(cache_path)
+    now = time.time()
+    tag = state.get("tag", "")
+    if not force:
+        if tag and now - state.get("checked_at", 0) < interval_sec:
+            return tag, _is_newer(tag, current_version), None, True
+        if now - state.get("failed_at", 0) < RETRY_AFTER_FAIL_SEC:
+            return tag, _is_newer(tag, current_version) if tag else False, state.get("error"), True
+
+    headers = {
+        "User-Agent": f"{repo}/{current_version}",
+        "Accept": "application/vnd.github+json",
+    }
+    if tag and state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    req = urllib.request.Request(api_url or _api_url(owner, repo), headers=headers)
+    try:
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                data = json.loads(resp.read().decode("utf-8", "ignore"))
+                etag = resp.headers.get("ETag", "")
+            tag = str(data.get("tag_name", "")).strip()
+            if not tag:
+                raise ValueError("no tag_name")
+            state.update(tag=tag, etag=etag)
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or not tag:
+                raise
+            # 304 Not Modified: 캐시된 tag 그대로 사용
+        state.update(checked_at=now, failed_at=0, error=None)
+        _save_state(cache_path, state)
+        return tag, _is_newer(tag, current_version), None, False
+    except Exception as e:
+        state.update(failed_at=now, error=str(e))
+        _save_state(cache_path, state)
+        return "", False, str(e), False
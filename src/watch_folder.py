@@ -0,0 +1,254 @@
+# watch_folder.py
+# 감시 폴더 변환(창 없이 실행): 폴더에 새로 들어오거나 바뀐 영상을 저장된 옵션 프리셋으로 GIF로 변환합니다.
+#   - 폴더를 주기적으로 훑고, 크기/수정 시각이 한동안 변하지 않은(복사가 끝난) 파일만 작업에 넣습니다.
+#   - 여러 파일을 동시에 변환합니다(--jobs). 스레드 옵션은 autotune 프로필을 동시 작업 수에 맞춰 씁니다.
+#   - 입력 지문(크기, 수정 시각)과 옵션 키를 cache/watch/<폴더 키>.json에 기록해 두므로,
+#     다시 시작해도 이미 변환한 파일은 ffmpeg 실행 없이 바로 건너뜁니다.
+#   - 변환에 실패한 파일은 지문이 바뀔 때까지(다시 복사/저장될 때까지) 다시 시도하지 않습니다.
+#   - 결과 이름에 원본 확장자를 넣어(a.mp4 → a.mp4.gif) 이름만 같은 영상끼리 덮어쓰지 않게 합니다.
+#   python -m src.watch_folder <폴더> [--out 폴더] [--preset settings.json] [--jobs 2] [--once]
+import hashlib, json, os, shutil, tempfile, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .constants import CACHE_DIR, SETTINGS_PATH, TRIM_MIN_SEC, TRIM_MAX_SEC
+from .ffmpeg_tools import build_gif_commands_auto, output_paths, probe_duration_sec, run_quiet
+from .capabilities import version_line
+from . import autotune
+
+WATCH_DIR = CACHE_DIR / "watch"
+MANIFEST_VERSION = 1
+
+VIDEO_EXTS = {".mp4", ".mov", ".mkv", ".webm", ".avi", ".m4v"}
+POLL_SEC = 2.0
+SETTLE_SEC = 3.0   # 크기/수정 시각이 이 시간 동안 그대로여야 복사가 끝난 것으로 봅니다.
+
+
+def load_preset(path) -> dict:
+    """옵션 프리셋을 읽습니다. settings.json이면 그 안의 "options"를, 아니면 파일 전체를 프리셋으로 봅니다."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return data.get("options", data) if isinstance(data, dict) else {}
+
+
+def fingerprint(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def options_key(ffmpeg_path: str, opts: dict, start: float, length: float) -> str:
+    """같은 옵션/구간/ffmpeg(+고정 팔레트 파일)로 만든 결과만 재사용하기 위한 키."""
+    from .palette_library import resolve
+    pal = resolve(opts.get("fixed_palette", "")) if opts.get("fixed_palette") else None
+    extra = [pal.stat().st_mtime_ns] if pal is not None else []  # 같은 이름으로 다시 저장한 팔레트 구분
+    ident = json.dumps([opts, round(start, 3), round(length, 3), version_line(ffmpeg_path), *extra],
+                       sort_keys=True)
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()[:16]
+
+
+class Manifest:
+    """변환 기록: {입력 경로: {"fp": [크기, 수정 시각], "key": 옵션 키, "output": 결과 경로}}"""
+    def __init__(self, folder: Path):
+        ident = str(folder.resolve())
+        self.path = WATCH_DIR / f"{hashlib.sha1(ident.encode('utf-8')).hexdigest()[:16]}.json"
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.entries = data["files"] if data.get("version") == MANIFEST_VERSION else {}
+        except (OSError, ValueError, KeyError):
+            self.entries = {}
+
+    def is_done(self, video: Path, fp: list[int], key: str) -> bool:
+        e = self.entries.get(str(video))
+        return bool(e) and e.get("fp") == fp and e.get("key") == key and Path(e.get("output", "")).is_file()
+
+    def mark_done(self, video: Path, fp: list[int], key: str, output: Path):
+        with self._lock:
+            self.entries[str(video)] = {"fp": fp, "key": key, "output": str(output)}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_name(self.path.name + ".tmp")
+                tmp.write_text(json.dumps({"version": MANIFEST_VERSION, "files": self.entries}, indent=1),
+                               encoding="utf-8")
+                os.replace(tmp, self.path)
+            except OSError:
+                pass  # 기록 실패 시 다음 시작 때 다시 변환될 뿐입니다.
+
+
+def output_path_for(out_dir: Path, video: Path) -> Path:
+    """a.mp4와 a.mov가 같은 GIF를 덮어쓰지 않도록 원본 확장자까지 이름에 넣습니다."""
+    return Path(out_dir) / f"{video.name}.gif"
+
+
+def convert_file(ffmpeg_path: str, ffprobe_path: str, video: Path, opts: dict, out_path: Path,
+                 start: float = 0.0, length: float = TRIM_MAX_SEC, log=print) -> bool:
+    """
+    영상 하나를 프리셋 옵션으로 GIF로 변환합니다(구간: start부터 length초, 영상 길이와 트림 제한 안).
+    결과는 임시 파일에 쓴 뒤 이름을 바꾸므로, 중간에 멈춰도 불완전한 GIF가 남지 않습니다.
+    팔레트/필터 그래프 스크립트는 작업마다 따로 만든 폴더(cache/watch/job_*)에 두고 끝나면 지웁니다.
+    """
+    from .options_panel import preset_values
+    mode_idx, fps, w, h, scale_mode, dither_key, palette_mode, palette_sample, fixed_palette = preset_values(opts)
+    duration = probe_duration_sec(ffprobe_path, str(video))
+    lo = min(max(0.0, start), duration)
+    hi = min(duration, lo + min(length, TRIM_MAX_SEC))
+    if hi - lo < TRIM_MIN_SEC:
+        log(f"[WARN] {video.name}: 변환할 구간이 {TRIM_MIN_SEC}초보다 짧아 건너뜁니다.")
+        return False
+
+    alg = "even" if mode_idx == 0 else "mpdecimate"
+    palette_path = None
+    if fixed_palette:
+        from .palette_library import resolve
+        palette_path = resolve(fixed_palette)
+        if palette_path is None:
+            log(f"[WARN] 고정 팔레트를 찾을 수 없어 파일마다 팔레트를 만듭니다: {fixed_palette}")
+        else:
+            palette_mode = "global"
+    keep_frames = scene_cuts = None
+    if alg == "mpdecimate" or palette_mode == "scene":
+        from .frame_probe import load_probe_frames
+        try:
+            frames = load_probe_frames(ffmpeg_path, str(video), lo, hi, fps)
+        except Exception as e:
+            log(f"[WARN] {video.name}: 프레임 분석 실패: {e}")
+            frames = None
+        if frames is not None and alg == "mpdecimate":
+            from .dedupe import find_kept_frames
+            keep_frames = find_kept_frames(frames)
+        if frames is not None and palette_mode == "scene":
+            from .scenes import find_scene_cuts
+            scene_cuts = find_scene_cuts(frames, fps)
+
+    tmp = out_path.with_name(f".{out_path.stem}.part{out_path.suffix}")
+    WATCH_DIR.mkdir(parents=True, exist_ok=True)
+    work_dir = Path(tempfile.mkdtemp(prefix="job_", dir=WATCH_DIR))
+    threads = autotune.thread_args(ffmpeg_path)  # 슬롯에 들어가기 전(이 작업을 아직 세지 않은 상태)에 고릅니다.
+    try:
+        cmds = build_gif_commands_auto(ffmpeg_path, str(video), lo, hi, fps, w, h, scale_mode, alg, dither_key,
+                                       str(tmp), keep_frames=keep_frames, scene_cuts=scene_cuts,
+                                       thread_args=threads, palette_sample=palette_sample,
+                                       palette_path=palette_path, work_dir=work_dir)
+        with autotune.job_slot():
+            for i, cmd in enumerate(cmds, start=1):
+                p = run_quiet(cmd, kind=f"pass{i}", outputs=output_paths(cmd))
+                if p.returncode != 0:
+                    log(f"[ERR] {video.name}: Pass {i} 실패: {p.stderr.strip()[:300]}")
+                    try: tmp.unlink()
+                    except OSError: pass
+                    return False
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    os.replace(tmp, out_path)
+    return True
+
+
+class FolderWatcher:
+    """
+    폴더를 훑어 변환이 필요한 파일을 작업 풀에 넣습니다.
+    - scan()을 반복 호출하며(run), 같은 파일이 이미 대기/변환 중이면 다시 넣지 않습니다.
+    - 실패한 파일은 (지문, 옵션 키)를 기억해 두고, 둘 중 하나가 바뀌기 전까지는 건너뜁니다.
+    """
+    def __init__(self, ffmpeg_path: str, ffprobe_path: str, folder, out_dir, opts: dict,
+                 jobs: int = 2, start: float = 0.0, length: float = TRIM_MAX_SEC, log=print):
+        self.ffmpeg_path, self.ffprobe_path = ffmpeg_path, ffprobe_path
+        self.folder, self.out_dir = Path(folder), Path(out_dir)
+        self.opts, self.start, self.length, self.log = opts, start, length, log
+        self.key = options_key(ffmpeg_path, opts, start, length)
+        self.manifest = Manifest(self.folder)
+        self.pool = ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="watch")
+        self._busy: set[Path] = set()
+        self._seen: dict[Path, tuple[list[int], float]] = {}  # 파일 → (지문, 처음 본 시각)
+        self._failed: dict[Path, tuple[list[int], str]] = {}  # 파일 → (실패했을 때의 지문, 옵션 키)
+        self._lock = threading.Lock()
+
+    def _settled(self, video: Path, fp: list[int], now: float) -> bool:
+        prev = self._seen.get(video)
+        if prev is None or prev[0] != fp:
+            self._seen[video] = (fp, now)
+            return False
+        return now - prev[1] >= SETTLE_SEC
+
+    def scan(self, wait_settle: bool = True) -> int:
+        """새로 작업에 넣은 파일 수를 반환합니다."""
+        now, queued = time.monotonic(), 0
+        for video in sorted(self.folder.iterdir()):
+            if video.suffix.lower() not in VIDEO_EXTS or not video.is_file():
+                continue
+            try:
+                fp = fingerprint(video)
+            except OSError:
+                continue
+            with self._lock:
+                if video in self._busy or self.manifest.is_done(video, fp, self.key):
+                    continue
+                if self._failed.get(video) == (fp, self.key):
+                    continue
+                self._failed.pop(video, None)
+                if wait_settle and not self._settled(video, fp, now):
+                    continue
+                self._busy.add(video)
+            self.pool.submit(self._job, video, fp)
+            queued += 1
+        return queued
+
+    def _job(self, video: Path, fp: list[int]):
+        out_path = output_path_for(self.out_dir, video)
+        t0, ok = time.perf_counter(), False
+        try:
+            self.log(f"[RUN] {video.name}")
+            ok = convert_file(self.ffmpeg_path, self.ffprobe_path, video, self.opts, out_path,
+                              self.start, self.length, self.log)
+            if ok:
+                self.manifest.mark_done(video, fp, self.key, out_path)
+                self.log(f"[OK] {video.name} → {out_path} ({time.perf_counter() - t0:.1f}s)")
+        except Exception as e:
+            self.log(f"[ERR] {video.name}: {e}")
+        finally:
+            with self._lock:
+                if not ok:
+                    self._failed[video] = (fp, self.key)
+                    self.log(f"[WARN] {video.name}: 파일이 바뀔 때까지 다시 변환하지 않습니다.")
+                self._busy.discard(video)
+
+    def run(self, once: bool = False, should_stop=lambda: False):
+        """once면 현재 있는 파일만 변환하고 끝냅니다. 아니면 should_stop()이 True가 될 때까지 감시합니다."""
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            if once:
+                self.scan(wait_settle=False)
+                return
+            while not should_stop():
+                self.scan()
+                time.sleep(POLL_SEC)
+        finally:
+            self.pool.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    import argparse, sys
+    from .ffmpeg_tools import find_executable
+    ap = argparse.ArgumentParser(prog="python -m src.watch_folder", description="감시 폴더 GIF 자동 변환")
+    ap.add_argument("folder")
+    ap.add_argument("--out", help="GIF 저장 폴더 (기본: <폴더>/gif)")
+    ap.add_argument("--preset", default=str(SETTINGS_PATH), help="옵션 프리셋(JSON) 또는 settings.json")
+    ap.add_argument("--jobs", type=int, default=2, help="동시 변환 수")
+    ap.add_argument("--start", type=float, default=0.0, help="변환 시작 위치(초)")
+    ap.add_argument("--length", type=float, default=TRIM_MAX_SEC, help="변환 길이(초)")
+    ap.add_argument("--once", action="store_true", help="현재 있는 파일만 변환하고 종료")
+    args = ap.parse_args()
+
+    ff, fp = find_executable("ffmpeg"), find_executable("ffprobe")
+    if not ff or not fp:
+        print("[ERR] ffmpeg/ffprobe를 찾을 수 없습니다."); sys.exit(2)
+    try:
+        preset = load_preset(args.preset)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] 프리셋을 읽지 못해 기본 옵션을 사용합니다: {e}")
+        preset = {}
+    watcher = FolderWatcher(ff, fp, args.folder, args.out or Path(args.folder) / "gif", preset,
+                            jobs=args.jobs, start=args.start, length=args.length)
+    print(f"[INFO] 감시 시작: {args.folder} (동시 {args.jobs}개, Ctrl+C로 종료)")
+    try:
+        watcher.run(once=args.once)
+    except KeyboardInterrupt:
+        print("[INFO] 종료합니다(진행 중인 변환은 마치고 끝납니다).")
@@ -0,0 +1,55 @@
+# conftest.py
+# 테스트 공용 픽스처: Range 요청을 지원하는 로컬 HTTP 서버 (downloader 테스트용, 네트워크 없이 동작),
+# 화면 없는(offscreen) QApplication (위젯 테스트용)
+import http.server, os, re, threading
+
+import pytest
+
+
+class _RangeHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        srv = self.server
+        srv.requests.append((self.path, self.headers.get("Range")))
+        data = srv.files.get(self.path)
+        if data is None:
+            self.send_error(404)
+            return
+        m = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+        if m and srv.ranges:
+            a = int(m.group(1))
+            b = int(m.group(2)) if m.group(2) else len(data) - 1
+            body = data[a:b + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {a}-{b}/{len(data)}")
+        else:
+            body = data
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def range_server():
+    """
+    files(경로 → bytes)를 내려주는 서버. 반환 객체의 속성:
+    - url(경로): 전체 URL, files: 내려줄 파일, requests: [(경로, Range 헤더)], ranges: False면 Range 무시(200)
+    """
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    srv.files, srv.requests, srv.ranges = {}, [], True
+    srv.url = lambda path: f"http://127.0.0.1:{srv.server_port}{path}"
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """화면 없이 위젯을 만들 수 있는 QApplication (PySide6가 없으면 해당 테스트를 건너뜀)."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from src import autotune
+
+
+@pytest.fixture
+def profile(tmp_path, monkeypatch):
+    path = tmp_path / "autotune.json"
+    monkeypatch.setattr(autotune, "PROFILE_PATH", path)
+    monkeypatch.setattr(autotune, "_profile_cache", None)
+    monkeypatch.setattr(autotune, "version_line", lambda exe: f"ffmpeg version {exe}")
+
+    def write(key):
+        path.write_text(json.dumps({"key": key, "levels": {
+            "1": {"threads": 4, "filter_threads": 4},
+            "2": {"threads": 2, "filter_threads": 2},
+            "4": {"threads": 0, "filter_threads": 0},
+        }}), encoding="utf-8")
+        monkeypatch.setattr(autotune, "_profile_cache", None)
+    return write
+
+
+def test_thread_args_uses_level_for_concurrency(profile):
+    profile(autotune.machine_key("ff-a"))
+    assert autotune.thread_args("ff-a", 1) == ["-threads", "4", "-filter_threads", "4",
+                                               "-filter_complex_threads", "4"]
+    assert autotune.thread_args("ff-a", 3)[:2] == ["-threads", "2"]  # 3 → 2 이하 단계
+    assert autotune.thread_args("ff-a", 8) == []  # ffmpeg 기본값이 가장 빨랐던 단계
+
+
+def test_thread_args_ignores_profile_from_other_ffmpeg(profile):
+    profile(autotune.machine_key("ff-a"))
+    assert autotune.thread_args("ff-b", 1) == []
+    assert autotune.has_profile("ff-b") is False
+
+
+def test_thread_args_without_profile(profile):
+    assert autotune.thread_args("ff-a") == []
+
+
+def test_job_slot_counts_active_jobs():
+    assert autotune.active_jobs() == 0
+    with autotune.job_slot():
+        with autotune.job_slot():
+            assert autotune.active_jobs() == 2
+    assert autotune.active_jobs() == 0
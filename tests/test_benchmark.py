@@ -0,0 +1,41 @@
+import json
+
+from src import benchmark
+from src.benchmark import compare
+
+
+def _result(machine, **medians):
+    return {"meta": {"machine": machine},
+            "results": {"h264_720p_10s": {s: {"median": m} for s, m in medians.items()}}}
+
+
+def test_compare_flags_regressions_and_speedups():
+    base = _result("m", probe=0.100, pass1=1.0, pass2=2.0)
+    new = _result("m", probe=0.105, pass1=1.5, pass2=1.0)
+    rows = {r[1]: r for r in compare(base, new, 0.10)}
+    assert rows["probe"][5] == "ok"
+    assert rows["pass1"][5] == "REGRESSION" and abs(rows["pass1"][4] - 0.5) < 1e-9
+    assert rows["pass2"][5] == "FASTER"
+
+
+def test_compare_skips_stages_missing_from_base():
+    base = _result("m", probe=0.1)
+    new = _result("m", probe=0.1, thumbs=0.3)
+    assert [r[1] for r in compare(base, new, 0.10)] == ["probe"]
+
+
+def test_compare_command_exit_code(tmp_path, capsys):
+    base, new = tmp_path / "base.json", tmp_path / "new.json"
+    base.write_text(json.dumps(_result("m", pass2=1.0)), encoding="utf-8")
+    new.write_text(json.dumps(_result("m", pass2=1.05)), encoding="utf-8")
+    assert benchmark.main(["compare", str(base), str(new)]) == 0
+    new.write_text(json.dumps(_result("other", pass2=1.5)), encoding="utf-8")
+    assert benchmark.main(["compare", str(base), str(new), "--threshold", "0.2"]) == 1
+    out = capsys.readouterr().out
+    assert "[WARN]" in out and "REGRESSION" in out
+
+
+def test_time_warms_up_once():
+    calls = []
+    runs = benchmark._time(lambda: calls.append(1), 3)
+    assert len(calls) == 4 and len(runs) == 3
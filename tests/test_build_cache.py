@@ -0,0 +1,46 @@
+import pytest
+
+from src import build_cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_cache, "BUILD_DIR", tmp_path / "builds")
+    monkeypatch.setattr(build_cache, "version_line", lambda exe: "ffmpeg version test")
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"video")
+    return tmp_path, str(video)
+
+
+def test_key_depends_on_options_formats_and_source(cache):
+    _, video = cache
+    key = lambda opts, fmts=("gif",): build_cache.build_key("ffmpeg", video, [(0.0, 1.0)], opts, fmts)
+    assert key({"fps": 15}) == key({"fps": 15})
+    assert key({"fps": 15}) != key({"fps": 12})
+    assert key({"fps": 15}) != key({"fps": 15}, ("gif", "webp@160x90"))
+    assert key({"fps": 15}) != key({"fps": 15, "range_source": [640, 360]})
+
+
+def test_lookup_copies_so_editing_output_keeps_cache(cache):
+    tmp, video = cache
+    out = tmp / "out" / "a.gif"
+    out.parent.mkdir()
+    out.write_bytes(b"GIF89a-original")
+    key = build_cache.build_key("ffmpeg", video, [(0.0, 1.0)], {}, ["gif"])
+    assert not build_cache.lookup(key, [str(out)])
+    build_cache.store(key, [str(out)])
+
+    with open(out, "r+b") as f:  # 사용자가 결과를 그 자리에서 고침
+        f.write(b"EDITED")
+    again = tmp / "out" / "b.gif"
+    assert build_cache.lookup(key, [str(again)])
+    assert again.read_bytes() == b"GIF89a-original"
+
+
+def test_lookup_needs_every_output(cache):
+    tmp, video = cache
+    gif, webp = tmp / "a.gif", tmp / "a.webp"
+    gif.write_bytes(b"gif")
+    key = build_cache.build_key("ffmpeg", video, [(0.0, 1.0)], {}, ["gif", "webp"])
+    build_cache.store(key, [str(gif), str(webp)])  # webp는 생성되지 않음
+    assert not build_cache.lookup(key, [str(gif), str(webp)])
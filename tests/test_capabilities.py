@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from src import capabilities
+
+
+@pytest.fixture
+def fake_exe(tmp_path, monkeypatch):
+    monkeypatch.setattr(capabilities, "CAPS_PATH", tmp_path / "capabilities.json")
+    monkeypatch.setattr(capabilities, "_mem", {})
+    exe = tmp_path / "ffmpeg"
+    exe.write_bytes(b"bin")
+    queries = []
+
+    def query(path, paletteuse=("dither", "diff_mode"), options=("fps_mode",), slash=True):
+        queries.append(path)
+        return {"stamp": capabilities._stamp(path), "version": "ffmpeg version 7.1", "version_tuple": [7, 1],
+                "filters": ["paletteuse", "scdet"], "decoders": ["h264"], "encoders": ["gif"],
+                "options": list(options), "slash_files": slash, "paletteuse": list(paletteuse)}
+    monkeypatch.setattr(capabilities, "_query", query)
+    return str(exe), queries
+
+
+def test_probe_queries_once_and_uses_disk_cache(fake_exe):
+    exe, queries = fake_exe
+    assert capabilities.version_line(exe) == "ffmpeg version 7.1"
+    assert capabilities.has_filter(exe, "scdet") and not capabilities.has_filter(exe, "mpdecimate")
+    assert len(queries) == 1                 # 메모리 캐시
+    capabilities.forget()
+    assert capabilities.has_encoder(exe, "gif")
+    assert len(queries) == 1                 # 디스크 캐시
+
+    st = os.stat(exe)
+    os.utime(exe, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # 실행 파일이 바뀜
+    capabilities.probe(exe)
+    assert len(queries) == 2
+
+
+def test_missing_executable_assumes_defaults(fake_exe, tmp_path):
+    missing = str(tmp_path / "nope")
+    assert capabilities.probe(missing) == {}
+    assert capabilities.has_filter(missing, "anything")
+    assert capabilities.vfr_args(missing) == ["-fps_mode", "vfr"]
+    assert capabilities.paletteuse_extra(missing, diff_rect=True) == ""
+
+
+def test_paletteuse_extra_is_opt_in(fake_exe):
+    exe, _ = fake_exe
+    assert capabilities.paletteuse_extra(exe) == ""
+    assert capabilities.paletteuse_extra(exe, diff_rect=True) == ":diff_mode=rectangle"
+
+
+def test_old_builds_use_old_syntax(fake_exe, monkeypatch):
+    exe, _ = fake_exe
+    query = capabilities._query
+    monkeypatch.setattr(capabilities, "_query",
+                        lambda p: query(p, paletteuse=("dither",), options=("vsync",), slash=False))
+    assert capabilities.vfr_args(exe) == ["-vsync", "vfr"]
+    assert capabilities.script_flag(exe, "-lavfi") == "-filter_complex_script"
+    assert capabilities.script_flag(exe, "-vf") == "-filter_script:v"
+    assert capabilities.paletteuse_extra(exe, diff_rect=True) == ""
+
+
+def test_names_parses_listing():
+    listing = (" Filters:\n  T.. = Timeline support\n"
+               " ... paletteuse        VV->V      Use a palette to downsample an input video stream.\n"
+               " TSC scdet             V->V       Detect video scene change\n")
+    assert capabilities._names(listing) == ["paletteuse", "scdet"]
@@ -0,0 +1,54 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.color_index import BINS, BITS, median_cut, range_histogram, range_palette
+
+
+def _bin(r, g, b):
+    s = 8 - BITS
+    return ((r >> s) << (2 * BITS)) | ((g >> s) << BITS) | (b >> s)
+
+
+def _hist(colors):
+    h = np.zeros(BINS)
+    for (r, g, b), w in colors:
+        h[_bin(r, g, b)] += w
+    return h
+
+
+def test_empty_histogram_gives_black():
+    assert median_cut(np.zeros(BINS)).tolist() == [[0, 0, 0]]
+
+
+def test_few_colors_are_kept_exactly():
+    pal = median_cut(_hist([((0, 0, 0), 10), ((255, 255, 255), 5), ((255, 0, 0), 1)]))
+    assert sorted(map(tuple, pal.tolist())) == [(0, 0, 0), (255, 0, 0), (255, 255, 255)]
+
+
+def test_palette_size_is_respected():
+    rng = np.random.default_rng(1)
+    h = rng.random(BINS)
+    pal = median_cut(h, 16)
+    assert pal.shape == (16, 3) and pal.dtype == np.uint8
+    assert len({tuple(c) for c in pal.tolist()}) == 16
+
+
+def test_box_color_is_weighted_mean_and_split_at_weighted_median():
+    assert median_cut(_hist([((0, 0, 0), 3), ((255, 0, 0), 1)]), 1).tolist() == [[64, 0, 0]]  # 255 / 4
+    # 무게 절반 지점에서 나누므로 드문 색은 가까운 무거운 색의 상자에 묻힙니다.
+    pal = median_cut(_hist([((0, 0, 0), 1000), ((4, 0, 0), 1000), ((252, 0, 0), 1)]), 2)
+    assert pal.tolist() == [[0, 0, 0], [4, 0, 0]]
+
+
+def test_range_histogram_and_reserve():
+    # 0초: 검정 2칸, 1초: 흰색 1칸, 2초: 빨강 1칸
+    index = {"seconds": 3, "offsets": np.array([0, 1, 2, 3]),
+             "bins": np.array([_bin(0, 0, 0), _bin(255, 255, 255), _bin(255, 0, 0)], np.uint32),
+             "counts": np.array([2, 1, 1], np.uint16)}
+    h = range_histogram(index, [(1.0, 1.5)])
+    assert np.flatnonzero(h).tolist() == [_bin(255, 255, 255)]
+    h = range_histogram(index, [(0.0, 1.0), (2.0, 3.0)])
+    assert h[_bin(0, 0, 0)] == 2 and h[_bin(255, 0, 0)] == 1 and h.sum() == 3
+    pal = range_palette(index, [(1.0, 2.0)], reserve=[(0, 0, 0)])
+    assert pal.tolist() == [[0, 0, 0], [255, 255, 255]]
@@ -0,0 +1,46 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.dedupe import find_kept_frames
+from src.ffmpeg_tools import select_frames_expr
+from src.frame_probe import PROBE_W, PROBE_H
+
+
+def _frames(n, value=0):
+    return np.full((n, PROBE_H, PROBE_W), value, np.int16)
+
+
+def test_static_clip_keeps_first_and_last():
+    assert find_kept_frames(_frames(10)) == [0, 9]
+
+
+def test_empty_and_single_frame():
+    assert find_kept_frames(_frames(0)) == []
+    assert find_kept_frames(_frames(1)) == [0]
+
+
+def test_full_frame_change_is_kept():
+    f = _frames(6)
+    f[3:] = 100
+    assert find_kept_frames(f) == [0, 3, 5]
+
+
+def test_small_block_change_is_kept():
+    # 화면 평균은 거의 그대로지만 한 블록(8x6)만 크게 바뀐 경우 (커서, 숫자 등)
+    f = _frames(4)
+    f[2:, :6, :8] = 200
+    assert find_kept_frames(f) == [0, 2, 3]
+
+
+def test_slow_drift_is_compared_with_last_kept_frame():
+    # 프레임마다 조금씩(임계값 미만) 밝아져도 마지막으로 남긴 프레임과 차이가 쌓이면 남깁니다.
+    f = np.stack([np.full((PROBE_H, PROBE_W), i, np.int16) for i in range(8)])
+    kept = find_kept_frames(f)
+    assert kept[0] == 0 and kept[-1] == 7
+    assert 1 < len(kept) < 8
+
+
+def test_select_expr_groups_runs_and_leaves_the_tail_open():
+    assert select_frames_expr([0, 1, 2, 5, 7, 8]) == "select='between(n,0,2)+eq(n,5)+gte(n,7)'"
+    assert select_frames_expr([4]) == "select='gte(n,4)'"
@@ -0,0 +1,74 @@
+import hashlib, json, os
+
+import pytest
+
+from src import downloader
+
+
+@pytest.fixture
+def small_split(monkeypatch):
+    # 작은 파일로도 여러 연결 경로를 타도록 기준 크기를 낮춥니다.
+    monkeypatch.setattr(downloader, "MIN_SPLIT_BYTES", 1024)
+    monkeypatch.setattr(downloader, "CHUNK", 4096)
+
+
+def test_multi_connection_download(range_server, tmp_path, small_split):
+    data = os.urandom(50_000)
+    range_server.files["/f.zip"] = data
+    dest = tmp_path / "f.zip"
+    assert downloader.download(range_server.url("/f.zip"), dest, connections=4)
+    assert dest.read_bytes() == data
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["f.zip"]  # 조각과 계획 파일 정리
+    assert sum(1 for path, rng in range_server.requests if rng and rng != "bytes=0-0") == 4
+
+
+def test_resume_fetches_only_missing_bytes(range_server, tmp_path, small_split):
+    data = os.urandom(40_000)
+    url = range_server.url("/f.zip")
+    range_server.files["/f.zip"] = data
+    dest = tmp_path / "f.zip"
+    plan = downloader._parts_plan(len(data), 2)
+    (tmp_path / "f.zip.parts.json").write_text(json.dumps({"url": url, "total": len(data), "ranges": plan}))
+    (tmp_path / "f.zip.part0").write_bytes(data[:plan[0][1] + 1])   # 첫 조각은 다 받음
+    (tmp_path / "f.zip.part1").write_bytes(data[plan[1][0]:plan[1][0] + 100])
+    assert downloader.download(url, dest, connections=2)
+    assert dest.read_bytes() == data
+    fetched = [rng for path, rng in range_server.requests if rng and rng != "bytes=0-0"]
+    assert fetched == [f"bytes={plan[1][0] + 100}-{plan[1][1]}"]
+
+
+def test_parts_of_another_url_are_not_reused(range_server, tmp_path):
+    a, b = os.urandom(3000), os.urandom(2000)
+    range_server.files.update({"/a.zip": a, "/b.zip": b})
+    dest = tmp_path / "x.zip"
+    (tmp_path / "x.zip.part0").write_bytes(a[:1000])
+    (tmp_path / "x.zip.parts.json").write_text(
+        json.dumps({"url": range_server.url("/a.zip"), "total": len(a), "ranges": [[0, len(a) - 1]]}))
+    assert downloader.download(range_server.url("/b.zip"), dest)
+    assert dest.read_bytes() == b
+
+
+def test_server_without_range_support(range_server, tmp_path, small_split):
+    data = os.urandom(20_000)
+    range_server.files["/f.zip"] = data
+    range_server.ranges = False
+    (tmp_path / "f.zip.part0").write_bytes(b"stale")
+    dest = tmp_path / "f.zip"
+    assert downloader.download(range_server.url("/f.zip"), dest)
+    assert dest.read_bytes() == data
+
+
+def test_checksum_list_match_and_mismatch(range_server, tmp_path):
+    data = os.urandom(5000)
+    range_server.files["/f.zip"] = data
+    digest = hashlib.sha256(data).hexdigest()
+    range_server.files["/ok.sha256"] = f"{'0' * 64}  other.zip\n{digest}  f.zip\n".encode()
+    range_server.files["/bad.sha256"] = f"{'0' * 64}  f.zip\n".encode()
+    dest = tmp_path / "f.zip"
+    assert downloader.download(range_server.url("/f.zip"), dest, checksum_url=range_server.url("/ok.sha256"))
+    assert not downloader.download(range_server.url("/f.zip"), dest, checksum_url=range_server.url("/bad.sha256"))
+    assert not dest.exists()
+
+
+def test_failed_download_returns_false(range_server, tmp_path):
+    assert not downloader.download(range_server.url("/missing.zip"), tmp_path / "m.zip")
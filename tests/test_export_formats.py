@@ -0,0 +1,57 @@
+import re, shutil, subprocess
+
+import pytest
+
+from src import capabilities
+from src.ffmpeg_tools import _encoder_args, build_export_commands
+
+FFMPEG = shutil.which("ffmpeg")
+
+
+@pytest.fixture
+def encoders(monkeypatch):
+    available = {"libwebp", "libx264"}
+    monkeypatch.setattr(capabilities, "has_encoder", lambda exe, name: name in available)
+    return available
+
+
+def test_encoder_args_per_format(encoders):
+    assert _encoder_args("ffmpeg", "gif") == ["-loop", "0"]
+    assert _encoder_args("ffmpeg", "webp")[:2] == ["-c:v", "libwebp"]
+    assert _encoder_args("ffmpeg", "apng")[-2:] == ["-f", "apng"]
+    mp4 = _encoder_args("ffmpeg", "mp4")
+    assert mp4[:2] == ["-c:v", "libx264"] and "yuv420p" in mp4 and "-an" in mp4
+    with pytest.raises(ValueError):
+        _encoder_args("ffmpeg", "avif")
+
+
+def test_encoder_fallbacks(encoders):
+    encoders.clear()
+    assert _encoder_args("ffmpeg", "mp4")[:2] == ["-c:v", "mpeg4"]
+    with pytest.raises(ValueError):
+        _encoder_args("ffmpeg", "webp")  # 대체 인코더가 없는 형식
+
+
+def _size(path) -> tuple[int, int]:
+    err = subprocess.run([FFMPEG, "-hide_banner", "-i", str(path)], capture_output=True, text=True).stderr
+    w, h = re.search(r"Video: .*?, (\d+)x(\d+)", err).groups()
+    return int(w), int(h)
+
+
+@pytest.mark.skipif(FFMPEG is None, reason="ffmpeg 없음")
+def test_one_decode_writes_every_format_and_size(tmp_path):
+    clip = tmp_path / "clip.mp4"
+    subprocess.run([FFMPEG, "-hide_banner", "-loglevel", "error", "-f", "lavfi",
+                    "-i", "testsrc2=size=640x360:rate=30:duration=2", "-pix_fmt", "yuv420p", "-y", str(clip)],
+                   check=True)
+    outputs = [{"fmt": "gif", "w": 160, "h": 90, "path": tmp_path / "a.gif"},
+               {"fmt": "apng", "w": 320, "h": 180, "path": tmp_path / "a.png"},
+               {"fmt": "mp4", "w": 320, "h": 180, "path": tmp_path / "a.mp4"}]
+    cmds = build_export_commands(FFMPEG, str(clip), 0.0, 1.0, 10, "stretch", "even", "none", outputs,
+                                 work_dir=tmp_path)
+    assert len(cmds) == 2  # Pass 1(팔레트) + 모든 출력을 쓰는 Pass 2
+    assert sum(c.count("-i") for c in cmds[1:]) == 2  # 원본 1회 + 팔레트
+    for cmd in cmds:
+        subprocess.run(cmd, check=True)
+    for o in outputs:
+        assert _size(o["path"]) == (o["w"], o["h"])
@@ -0,0 +1,39 @@
+import os
+
+from src import ffmpeg_tools
+
+_EXE = ".exe" if os.name == "nt" else ""
+
+
+def _setup(tmp_path, monkeypatch, install):
+    monkeypatch.setattr(ffmpeg_tools, "FFMPEG_DIR", tmp_path)
+    monkeypatch.setattr(ffmpeg_tools, "_install_ffmpeg", install)
+    monkeypatch.setattr(ffmpeg_tools.shutil, "which", lambda name: None)
+    ffmpeg_tools.forget_executables()
+    logs = []
+    try:
+        ffmpeg_tools.auto_setup_ffmpeg(logs.append)
+    finally:
+        ffmpeg_tools.forget_executables()
+    return logs
+
+
+def test_setup_tidies_leftovers_after_local_install(tmp_path, monkeypatch):
+    def install(log):
+        # 첫 URL의 이어받기 조각이 남은 채 두 번째 URL로 설치에 성공한 경우
+        (tmp_path / "first.zip.part0").write_bytes(b"x")
+        (tmp_path / "first.zip.parts.json").write_text("{}")
+        (tmp_path / "extracted").mkdir()
+        for n in ("ffmpeg", "ffprobe"):
+            (tmp_path / (n + _EXE)).write_bytes(b"bin")
+    logs = _setup(tmp_path, monkeypatch, install)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ffmpeg" + _EXE, "ffprobe" + _EXE]
+    assert "[OK] ffmpeg-bin 디렉터리 정리 완료" in logs
+
+
+def test_setup_keeps_files_when_install_failed(tmp_path, monkeypatch):
+    def install(log):
+        (tmp_path / "first.zip.part0").write_bytes(b"x")  # 다음 실행 때 이어받을 조각
+    logs = _setup(tmp_path, monkeypatch, install)
+    assert [p.name for p in tmp_path.iterdir()] == ["first.zip.part0"]
+    assert not any("정리" in line for line in logs)
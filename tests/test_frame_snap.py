@@ -0,0 +1,88 @@
+import os, subprocess, sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+
+from src import ffmpeg_tools
+from src.rangeslider import RangeSlider
+
+
+def _move(slider, pos: float):
+    x = 10 + pos * (slider.width() - 20)
+    ev = QMouseEvent(QEvent.MouseMove, QPointF(x, 18), QPointF(x, 18), Qt.LeftButton, Qt.LeftButton,
+                     Qt.NoModifier)
+    slider.mouseMoveEvent(ev)
+
+
+def test_snap_to_frame_steps(qapp):
+    s = RangeSlider()
+    assert s._snap(0.123456) == 0.123456   # 간격이 없으면 연속 값
+    s.set_step(0.1)
+    assert s._snap(0.123) == pytest.approx(0.1)
+    assert s._snap(0.17) == pytest.approx(0.2)
+    assert s._snap(1.04) == 1.0 and s._snap(-0.2) == 0.0
+    s.setRange(0.26, 0.24)                 # 뒤집힌 구간은 한 점으로
+    assert (s.lower(), s.upper()) == (pytest.approx(0.3), pytest.approx(0.3))
+
+
+def test_drag_emits_only_when_frame_changes(qapp):
+    s = RangeSlider()
+    s.resize(220, 36)
+    s.set_step(0.1)
+    s.setRange(0.0, 0.5, emit_signal=False)
+    seen = []
+    s.changed.connect(lambda a, b: seen.append((round(a, 3), round(b, 3))))
+    s._active = "u"
+    for pos in (0.52, 0.54, 0.56, 0.58, 0.61, 0.64):
+        _move(s, pos)
+    assert seen == [(0.0, 0.6)]            # 0.5 → 0.6으로 바뀔 때 한 번만
+
+
+def test_add_mark_merges_overlaps(qapp):
+    s = RangeSlider()
+    s.add_mark(0.1, 0.2)
+    s.add_mark(0.5, 0.6)
+    s.add_mark(0.15, 0.3)                  # 첫 구간과 겹침 → 합침
+    s.add_mark(0.7, 0.65)                  # 순서가 뒤집힌 입력
+    s.add_mark(0.9, 0.9)                   # 길이 0은 무시
+    assert s.marks() == [(0.1, 0.3), (0.5, 0.6), (0.65, 0.7)]
+    s.add_mark(0.25, 0.68)                 # 세 구간을 모두 덮음
+    assert s.marks() == [(0.1, 0.7)]
+    s.clear_marks()
+    assert s.marks() == []
+
+
+def test_preview_key_is_stable_across_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(ffmpeg_tools, "CACHE_DIR", tmp_path)
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"video")
+    cmd, path = ffmpeg_tools.preview_frame_cmd("ffmpeg", str(video), 1.5)
+    assert cmd and cmd[-1] == str(path)
+    code = ("import sys; from src import ffmpeg_tools as f; from pathlib import Path; "
+            "f.CACHE_DIR = Path(sys.argv[1]); print(f.preview_frame_cmd('ffmpeg', sys.argv[2], 1.5)[1])")
+    other = subprocess.run([sys.executable, "-c", code, str(tmp_path), str(video)], capture_output=True,
+                           text=True, check=True, cwd=os.getcwd(),
+                           env={**os.environ, "PYTHONHASHSEED": "123"}).stdout.strip()
+    assert other == str(path)
+
+    path.write_bytes(b"png")
+    assert ffmpeg_tools.preview_frame_cmd("ffmpeg", str(video), 1.5) == ([], path)   # 캐시된 파일
+    assert ffmpeg_tools.preview_frame_cmd("ffmpeg", str(video), 1.534)[1] != path
+    st = video.stat()
+    os.utime(video, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))                     # 영상이 바뀜
+    assert ffmpeg_tools.preview_frame_cmd("ffmpeg", str(video), 1.5)[1] != path
+
+
+@pytest.mark.parametrize("stdout, fps", [
+    ("30000/1001\n30000/1001\n", 30000 / 1001),
+    ("90000/1\n25/1\n", 25.0),                # 타임베이스 같은 값은 건너뜀
+    ("0/0\n24/1\n", 24.0),
+    ("N/A\n", 0.0),
+])
+def test_probe_frame_rate(monkeypatch, stdout, fps):
+    monkeypatch.setattr(ffmpeg_tools, "run_quiet",
+                        lambda cmd, kind="": subprocess.CompletedProcess(cmd, 0, stdout, ""))
+    assert ffmpeg_tools.probe_frame_rate("ffprobe", "clip.mp4") == pytest.approx(fps)
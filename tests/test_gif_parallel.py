@@ -0,0 +1,106 @@
+import shutil, subprocess
+
+import pytest
+
+from src import gif_parallel
+from src.ffmpeg_tools import build_gif_commands_auto
+from src.gif_parallel import _parse_gif, concat_gifs
+
+# 1x1 이미지(최소 LZW 코드 크기 2) 한 장의 이미지 블록
+_IMAGE = bytes([0x2C, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0x02, 0x02, 0x44, 0x01, 0x00])
+_LOOP = b"\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00"
+
+
+def _gif(n_frames, gct=b"\x00\x00\x00\xff\xff\xff", delay=4, width=1):
+    head = b"GIF89a" + width.to_bytes(2, "little") + b"\x01\x00" + bytes([0x80, 0, 0])  # 전역 색상표 2색
+    frames = b"".join(b"\x21\xF9\x04\x00" + delay.to_bytes(2, "little") + b"\x00\x00" + _IMAGE
+                      for _ in range(n_frames))
+    return head + gct + _LOOP + frames + b"\x3B"
+
+
+def _delays(data):
+    _, _, blocks = _parse_gif(data)
+    return [int.from_bytes(b[4:6], "little") for kind, b in blocks if kind == "ext" and b[1] == 0xF9]
+
+
+def test_concat_rewrites_delays_by_frame_time(tmp_path):
+    a, b, out = tmp_path / "a.gif", tmp_path / "b.gif", tmp_path / "out.gif"
+    a.write_bytes(_gif(3))
+    b.write_bytes(_gif(3))
+    assert concat_gifs([a, b], out, fps=15) == 6
+    # 15fps: 프레임 시각 0, 7, 13, 20, 27, 33, 40 (1/100초) → 차이
+    assert _delays(out.read_bytes()) == [7, 6, 7, 7, 6, 7]
+
+
+def test_concat_keeps_delays_without_fps_and_one_loop_block(tmp_path):
+    a, b, out = tmp_path / "a.gif", tmp_path / "b.gif", tmp_path / "out.gif"
+    a.write_bytes(_gif(2, delay=9))
+    b.write_bytes(_gif(1, delay=9))
+    assert concat_gifs([a, b], out) == 3
+    data = out.read_bytes()
+    assert _delays(data) == [9, 9, 9]
+    assert data.count(b"NETSCAPE2.0") == 1
+    assert data.endswith(b"\x3B")
+
+
+def test_other_global_table_becomes_local_table(tmp_path):
+    a, b, out = tmp_path / "a.gif", tmp_path / "b.gif", tmp_path / "out.gif"
+    a.write_bytes(_gif(1))
+    b.write_bytes(_gif(1, gct=b"\xff\x00\x00\x00\xff\x00"))
+    concat_gifs([a, b], out)
+    head, gct, blocks = _parse_gif(out.read_bytes())
+    images = [blk for kind, blk in blocks if kind == "image"]
+    assert gct == b"\x00\x00\x00\xff\xff\xff"
+    assert not images[0][9] & 0x80
+    assert images[1][9] & 0x80 and images[1][10:16] == b"\xff\x00\x00\x00\xff\x00"
+
+
+def test_parts_with_different_sizes_are_rejected(tmp_path):
+    a, b = tmp_path / "a.gif", tmp_path / "b.gif"
+    a.write_bytes(_gif(1))
+    b.write_bytes(_gif(1, width=2))
+    with pytest.raises(ValueError):
+        concat_gifs([a, b], tmp_path / "out.gif")
+
+
+# --- 실제 ffmpeg로 조각 병렬 인코딩과 한 번에 인코딩한 결과 비교 ---
+FFMPEG = shutil.which("ffmpeg")
+needs_ffmpeg = pytest.mark.skipif(FFMPEG is None, reason="ffmpeg가 없습니다")
+
+
+@pytest.fixture(scope="module")
+def clip(tmp_path_factory):
+    path = tmp_path_factory.mktemp("clip") / "src.mp4"
+    subprocess.run([FFMPEG, "-v", "error", "-f", "lavfi", "-i", "testsrc2=size=320x180:rate=30:duration=8",
+                    "-pix_fmt", "yuv420p", str(path)], check=True)
+    return str(path)
+
+
+def _frame_hashes(path):
+    out = subprocess.run([FFMPEG, "-v", "error", "-i", str(path), "-f", "framemd5", "-"],
+                         capture_output=True, text=True, check=True).stdout
+    return [ln.rsplit(",", 1)[-1].strip() for ln in out.splitlines() if not ln.startswith("#")]
+
+
+@needs_ffmpeg
+@pytest.mark.parametrize("segments", [
+    [(2.0, 7.0)],                   # 조각 시작(2.75초 등)이 원본 프레임 경계와 어긋남
+    [(0.37, 7.9)],                  # 구간 시작도 어긋남
+    [(0.5, 3.2), (4.05, 7.5)],      # 여러 구간
+])
+def test_parallel_parts_match_single_pass(clip, tmp_path, monkeypatch, segments):
+    monkeypatch.setattr(gif_parallel, "PARTS_DIR", tmp_path / "parts")
+    fps = 20
+    palette, single, parallel = tmp_path / "palette.png", tmp_path / "single.gif", tmp_path / "parallel.gif"
+    pass1, pass2 = build_gif_commands_auto(FFMPEG, clip, 0, 0, fps, 80, 45, "stretch", "even", "none",
+                                           str(single), palette_out=palette, segments=segments,
+                                           work_dir=tmp_path)
+    subprocess.run(pass1, check=True)
+    subprocess.run(pass2, check=True)
+    n = round(sum(b - a for a, b in segments) * fps)
+    parts = [(0, n // 4), (n // 4, n // 2), (n // 2, 3 * n // 4), (3 * n // 4, n)]
+    assert gif_parallel.encode(FFMPEG, clip, segments, fps, 80, 45, "stretch", "none", str(parallel), parts,
+                               palette_path=palette, log=lambda *_: None)
+    single_frames, parallel_frames = _frame_hashes(single), _frame_hashes(parallel)
+    assert len(parallel_frames) == len(single_frames)
+    assert parallel_frames == single_frames
@@ -0,0 +1,77 @@
+import shutil, subprocess
+
+import pytest
+
+from src import palette_library
+from src.ffmpeg_tools import build_gif_commands_auto
+
+FFMPEG = shutil.which("ffmpeg")
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(palette_library, "USER_DIR", tmp_path / "palettes")
+    monkeypatch.setattr(palette_library, "BUILTIN_DIR", tmp_path / "cache")
+    return tmp_path
+
+
+def _png_pixels(path):
+    """16x16 RGB PNG(필터 0)의 픽셀 목록."""
+    import zlib
+    data = path.read_bytes()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    i, idat = 8, b""
+    while i < len(data):
+        n = int.from_bytes(data[i:i + 4], "big")
+        if data[i + 4:i + 8] == b"IDAT":
+            idat += data[i + 8:i + 8 + n]
+        i += 12 + n
+    raw = zlib.decompress(idat)
+    rows = [raw[r * 49 + 1:(r + 1) * 49] for r in range(16)]
+    return [tuple(row[c * 3:c * 3 + 3]) for row in rows for c in range(16)]
+
+
+def test_write_palette_png_pads_with_last_color(dirs):
+    path = palette_library.write_palette_png([(255, 0, 0), (0, 0, 255)], dirs / "p.png")
+    px = _png_pixels(path)
+    assert len(px) == 256 and px[:3] == [(255, 0, 0), (0, 0, 255), (0, 0, 255)]
+
+
+def test_builtin_palettes_are_256_rgb565_exact(dirs):
+    assert len(palette_library._apex565()) == 256
+    assert len(palette_library._websafe()) == 256
+    for r, g, b in palette_library._apex565():
+        assert (r >> 3) << 3 | r >> 5 == r and (g >> 2) << 2 | g >> 6 == g
+    path = palette_library.resolve("builtin:apex565")
+    assert path.is_file() and len(set(_png_pixels(path))) == 256
+    assert palette_library.resolve("builtin:nope") is None
+
+
+def test_user_palette_save_resolve_delete(dirs):
+    src = palette_library.write_palette_png([(1, 2, 3)], dirs / "src.png")
+    key = palette_library.save('  my/pal:*  ', src)
+    assert key == "user:mypal"
+    assert palette_library.resolve(key).read_bytes() == src.read_bytes()
+    assert ("user:mypal", "mypal") in palette_library.list_palettes()
+    with pytest.raises(ValueError):
+        palette_library.save(" ./ ", src)
+    assert not palette_library.delete("builtin:grey")
+    assert palette_library.delete(key)
+    assert palette_library.resolve(key) is None and not palette_library.delete(key)
+
+
+@pytest.mark.skipif(FFMPEG is None, reason="ffmpeg 없음")
+def test_fixed_palette_skips_pass1_and_quantizes(dirs):
+    video = dirs / "clip.mp4"
+    subprocess.run([FFMPEG, "-hide_banner", "-loglevel", "error", "-f", "lavfi",
+                    "-i", "testsrc2=size=320x180:rate=25:duration=1", "-pix_fmt", "yuv420p", "-y", str(video)],
+                   check=True)
+    pal = palette_library.resolve("builtin:grey")
+    out = dirs / "out.gif"
+    cmds = build_gif_commands_auto(FFMPEG, str(video), 0.0, 1.0, 10, 80, 45, "stretch", "even", "none", str(out),
+                                   palette_path=pal, work_dir=dirs)
+    assert len(cmds) == 1 and str(pal) in cmds[0]  # palettegen 없이 한 번에
+    subprocess.run(cmds[0], check=True)
+    frame = subprocess.run([FFMPEG, "-hide_banner", "-loglevel", "error", "-i", str(out), "-frames:v", "1",
+                            "-f", "rawvideo", "-pix_fmt", "rgb24", "-"], capture_output=True, check=True).stdout
+    assert all(frame[i] == frame[i + 1] == frame[i + 2] for i in range(0, len(frame), 3))  # 회색만
@@ -0,0 +1,58 @@
+import shutil, subprocess
+
+import pytest
+
+from src import palette_check
+from src.ffmpeg_tools import build_gif_commands_auto, palette_sampling
+
+FFMPEG = shutil.which("ffmpeg")
+
+
+def test_full_and_short_ranges_are_not_sampled():
+    assert palette_sampling("full", 60, 12, 640, 360) is None
+    assert palette_sampling("auto", 6, 12, 160, 80) is None      # 72프레임, 작은 출력
+    assert palette_sampling("fast", 0, 12, 160, 80) is None
+    assert palette_sampling("fast", 10, 2, 160, 80) is None      # 줄일 것이 없음
+
+
+def test_long_or_large_ranges_are_sampled():
+    assert palette_sampling("auto", 60, 12, 160, 80) == (2, 160, 80)         # 90장 목표 → 최소 2fps
+    assert palette_sampling("auto", 30, 15, 160, 80) == (3.0, 160, 80)
+    sfps, pw, ph = palette_sampling("fast", 6, 12, 1280, 720)
+    assert sfps == 12 and pw * ph <= 320 * 180 and (pw, ph) == (320, 180)
+    assert palette_sampling("index", 60, 12, 160, 80) == palette_sampling("auto", 60, 12, 160, 80)
+
+
+def test_pass1_uses_sampled_chain(tmp_path):
+    video = tmp_path / "v.mp4"
+    video.write_bytes(b"v")
+    pass1, pass2 = build_gif_commands_auto("ffmpeg", str(video), 0.0, 60.0, 12, 640, 360, "cover", "even",
+                                           "none", str(tmp_path / "o.gif"), palette_sample="auto",
+                                           palette_out=tmp_path / "p.png", work_dir=tmp_path)
+    graph1, graph2 = " ".join(map(str, pass1)), " ".join(map(str, pass2))
+    assert "fps=2" in graph1 and "flags=neighbor" in graph1
+    assert "fps=12" in graph2 and "flags=neighbor" not in graph2
+
+
+def test_quant_psnr():
+    np = pytest.importorskip("numpy")
+    frames = np.zeros((2, 4, 4, 3), np.uint8)
+    frames[1] = 200
+    assert palette_check._quant_psnr(frames, np.array([[0, 0, 0], [200, 200, 200]])) == 99.0
+    lossy = palette_check._quant_psnr(frames, np.array([[0, 0, 0], [190, 200, 200]]))
+    assert 20 < lossy < 99
+
+
+@pytest.mark.skipif(FFMPEG is None, reason="ffmpeg 없음")
+def test_quality_check_reports_both_palettes(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(palette_check, "CHECK_DIR", tmp_path / "check")
+    video = tmp_path / "clip.mp4"
+    subprocess.run([FFMPEG, "-hide_banner", "-loglevel", "error", "-f", "lavfi",
+                    "-i", "testsrc2=size=640x360:rate=25:duration=10", "-pix_fmt", "yuv420p", "-y", str(video)],
+                   check=True)
+    res = palette_check.quality_check(FFMPEG, str(video), 0.0, 10.0, 12, 320, 180, sample="fast")
+    assert res["plan"] == (9.0, 320, 180)
+    assert 25 < res["sampled"]["psnr"] <= res["full"]["psnr"] + palette_check.MAX_DB_LOSS
+    # 합성 영상(testsrc2)은 색이 계속 바뀌어 손실이 커질 수 있으므로 판정 규칙만 확인합니다.
+    assert res["ok"] == (res["full"]["psnr"] - res["sampled"]["psnr"] <= palette_check.MAX_DB_LOSS)
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QColor, QImage, QPixmapCache
+
+from src.preview_bar import PreviewView
+
+
+def _png(path, w=1280, h=720):
+    img = QImage(w, h, QImage.Format_RGB32)
+    img.fill(QColor("#336699"))
+    assert img.save(str(path))
+    return str(path)
+
+
+def _wait(qapp, cond, timeout=5.0):
+    t0 = time.monotonic()
+    while not cond() and time.monotonic() - t0 < timeout:
+        qapp.processEvents()
+        time.sleep(0.01)
+    return cond()
+
+
+def _view(qapp, w=320, h=180):
+    view = PreviewView("시작", "#ca8a04")
+    view.resize(w, h)
+    return view
+
+
+def test_decodes_to_widget_size_off_thread(qapp, tmp_path):
+    QPixmapCache.clear()
+    view = _view(qapp)
+    view.set_image_path(_png(tmp_path / "a.png"), key="clip@1.000")
+    assert _wait(qapp, lambda: not view._pixmap.isNull())
+    assert view._pixmap.size() == view._target_size()  # 원본(1280x720)이 아닌 표시 크기로 읽음
+    assert view._decoder._thread is not None
+
+
+def test_same_key_and_size_comes_from_pixmap_cache(qapp, tmp_path):
+    QPixmapCache.clear()
+    path = _png(tmp_path / "b.png")
+    first = _view(qapp)
+    first.set_image_path(path, key="clip@2.000")
+    assert _wait(qapp, lambda: not first._pixmap.isNull())
+
+    second = _view(qapp)
+    second.set_image_path(path, key="clip@2.000")
+    assert not second._pixmap.isNull()       # 캐시에서 바로 그림
+    assert second._decoder._thread is None   # 디코딩 스레드를 시작하지 않음
+
+
+def test_stale_result_is_not_shown(qapp, tmp_path):
+    QPixmapCache.clear()
+    view = _view(qapp)
+    view._path, view._key = _png(tmp_path / "c.png"), "k"
+    view._serial = 5
+    img = QImage(QSize(16, 9), QImage.Format_RGB32)
+    view._on_decoded(4, "preview|old|16x9", img)  # 이전 요청의 결과
+    assert view._pixmap.isNull()
+    assert QPixmapCache.find("preview|old|16x9") is not None  # 캐시에는 남겨 둠
+
+
+def test_resize_to_same_size_does_not_reload(qapp, tmp_path):
+    view = _view(qapp)
+    view.show()  # 숨긴 위젯은 resizeEvent가 표시될 때까지 미뤄집니다.
+    view.set_image_path(_png(tmp_path / "d.png"), key="clip@3.000")
+    view.resize(320, 180)
+    assert not view._reload_timer.isActive()
+    view.resize(640, 360)
+    assert view._reload_timer.isActive()
@@ -0,0 +1,79 @@
+import asyncio, os, sys, time
+
+import pytest
+
+from src import telemetry
+from src.proc_async import AsyncRunner, ProcessTimeout, run_async
+
+# 표준 출력에 PID를 먼저 쓰고 오래 기다리는 자식 프로세스
+SLEEPER = [sys.executable, "-c", "import os, sys, time; print(os.getpid(), flush=True); time.sleep(30)"]
+
+
+@pytest.fixture(autouse=True)
+def spans(tmp_path, monkeypatch):
+    monkeypatch.setattr(telemetry, "SPANS_PATH", tmp_path / "spans.jsonl")
+
+
+@pytest.fixture
+def runner():
+    r = AsyncRunner(max_concurrency=2)
+    yield r
+    r.close()
+
+
+def _gone(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    return False
+
+
+def _wait_pid(pids, timeout=10.0):
+    t0 = time.monotonic()
+    while not pids and time.monotonic() - t0 < timeout:
+        time.sleep(0.02)
+    return int(pids[0])
+
+
+def test_streams_lines_and_keeps_stderr_tail():
+    lines = []
+    cmd = [sys.executable, "-c", "import sys\nfor i in range(3): print(i)\nsys.stderr.write('e1\\ne2\\n')"]
+    p = asyncio.run(run_async(cmd, on_stdout=lines.append))
+    assert p.returncode == 0 and lines == ["0", "1", "2"]
+    assert p.stdout == "0\n1\n2" and p.stderr == "e1\ne2"
+    assert [s["kind"] for s in telemetry.load_spans()] == ["other"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX PID 확인")
+def test_timeout_kills_child():
+    pids = []
+    with pytest.raises(ProcessTimeout):
+        asyncio.run(run_async(SLEEPER, timeout=1.0, on_stdout=pids.append))
+    assert _gone(int(pids[0]))
+    span = telemetry.load_spans()[-1]
+    assert span["rc"] not in (0, None) and span["wall_s"] < 10
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX PID 확인")
+def test_cancel_kills_child(runner):
+    pids = []
+    fut = runner.submit(SLEEPER, on_stdout=pids.append)
+    pid = _wait_pid(pids)
+    assert fut.cancel()
+    t0 = time.monotonic()
+    while not _gone(pid) and time.monotonic() - t0 < 5:
+        time.sleep(0.05)
+    assert _gone(pid)
+
+
+def test_runner_limits_concurrency():
+    r = AsyncRunner(max_concurrency=1)
+    try:
+        cmd = [sys.executable, "-c", "import time; time.sleep(0.4)"]
+        t0 = time.perf_counter()
+        results = r.run_all([cmd, cmd])
+        assert [p.returncode for p in results] == [0, 0]
+        assert time.perf_counter() - t0 >= 0.8  # 하나씩 차례로 실행
+    finally:
+        r.close()
@@ -0,0 +1,58 @@
+import shutil, subprocess
+
+import pytest
+
+from src import range_cache
+from src.range_cache import ensure, open_source, work_size
+
+FFMPEG = shutil.which("ffmpeg")
+pytestmark = pytest.mark.skipif(FFMPEG is None, reason="ffmpeg 없음")
+
+
+@pytest.fixture
+def clip(tmp_path, monkeypatch):
+    monkeypatch.setattr(range_cache, "RANGE_DIR", tmp_path / "range")
+    path = tmp_path / "clip.mp4"
+    subprocess.run([FFMPEG, "-hide_banner", "-loglevel", "error", "-f", "lavfi",
+                    "-i", "testsrc2=size=1280x720:rate=30:duration=2",
+                    "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p", "-y", str(path)], check=True)
+    probes = []
+
+    def probe(ffprobe, video):
+        probes.append(video)
+        return 1280, 720
+    monkeypatch.setattr(range_cache, "probe_video_size", probe)
+    return str(path), probes
+
+
+def test_work_size_uses_fixed_width_unless_output_is_larger():
+    assert work_size(1280, 720, 160, 90) == (640, 360)
+    assert work_size(1280, 720, 320, 180) == (640, 360)   # 출력 크기를 바꿔도 같은 작업 해상도
+    assert work_size(1280, 720, 960, 540) == (960, 540)   # 작업 해상도보다 큰 출력
+    assert work_size(320, 240, 160, 90) == (320, 240)     # 원본보다 크게는 안 함
+
+
+def test_cache_hit_skips_probe_and_survives_output_size_change(clip):
+    video, probes = clip
+    segs = [(0.0, 1.0)]
+    src = ensure(FFMPEG, "ffprobe", video, segs, 15, 160, 90)
+    assert (src.w, src.h, src.fps, src.n) == (640, 360, 30, 30)
+    assert len(probes) == 1
+
+    again = ensure(FFMPEG, "ffprobe", video, segs, 15, 320, 180, build=False)
+    assert again is not None and again.path == src.path and again.src_size == (1280, 720)
+    assert len(probes) == 1  # 캐시가 있으면 ffprobe를 다시 부르지 않음
+
+    # 작업 해상도보다 큰 출력은 캐시로 채울 수 없으므로 다시 만듭니다.
+    assert ensure(FFMPEG, "ffprobe", video, segs, 15, 960, 540, build=False) is None
+    bigger = ensure(FFMPEG, "ffprobe", video, segs, 15, 960, 540)
+    assert (bigger.w, bigger.h) == (960, 540)
+    assert open_source(bigger.path).n == 30
+
+
+def test_part_keeps_source_size(clip):
+    video, _ = clip
+    src = ensure(FFMPEG, "ffprobe", video, [(0.0, 1.0)], 15, 160, 90)
+    part = src.part(10, 20)
+    assert (part.first, part.n, part.src_size) == (10, 10, (1280, 720))
+    assert "-skip_initial_bytes" in part.input_args()
@@ -0,0 +1,35 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.frame_probe import PROBE_W, PROBE_H
+from src.scenes import find_scene_cuts, MAX_SCENES
+
+
+def _clip(values):
+    return np.stack([np.full((PROBE_H, PROBE_W), v, np.int16) for v in values])
+
+
+def test_hard_cut_is_between_frames():
+    fps = 10
+    cuts = find_scene_cuts(_clip([0] * 30 + [200] * 30), fps)
+    assert cuts == [pytest.approx(2.95)]
+
+
+def test_short_scene_is_merged():
+    fps = 10
+    # 0.5초짜리 장면은 MIN_SCENE_SEC보다 짧아 다음 장면과 합쳐집니다(두 번째 컷은 버림).
+    assert find_scene_cuts(_clip([0] * 30 + [200] * 5 + [0] * 30), fps) == [pytest.approx(2.95)]
+    assert find_scene_cuts(_clip([0] * 5 + [200] * 30), fps) == []
+
+
+def test_constant_fast_motion_is_not_a_cut():
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, (60, PROBE_H, PROBE_W)).astype(np.int16)
+    assert find_scene_cuts(frames, 10) == []
+
+
+def test_scene_count_is_capped():
+    fps = 10
+    values = [v for k in range(20) for v in [(k % 2) * 200] * 15]
+    assert len(find_scene_cuts(_clip(values), fps)) == MAX_SCENES - 1
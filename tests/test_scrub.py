@@ -0,0 +1,96 @@
+import shutil, subprocess
+
+import pytest
+
+pytest.importorskip("PySide6")
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QColor, QPainter, QPixmap
+
+from src import analysis_decode, color_index, motion_index, scrub
+from src.scrub import ScrubSource, sprite_plan
+
+FFMPEG = shutil.which("ffmpeg")
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(scrub, "SPRITE_DIR", tmp_path / "sprites")
+    monkeypatch.setattr(motion_index, "INDEX_DIR", tmp_path / "analysis")
+    monkeypatch.setattr(color_index, "INDEX_DIR", tmp_path / "colors")
+    return tmp_path
+
+
+def test_sprite_plan_grid(dirs):
+    video = dirs / "v.mp4"
+    video.write_bytes(b"v")
+    assert sprite_plan(str(video), 0) is None
+    short = sprite_plan(str(video), 7.2)["meta"]
+    assert (short["interval"], short["count"], short["cols"]) == (0.5, 15, 15)
+    long = sprite_plan(str(video), 3600)["meta"]
+    assert long["interval"] == 9.0 and long["count"] == 400 and long["cols"] == scrub.SPRITE_COLS
+    assert "tile=20x20" in sprite_plan(str(video), 3600)["vf"]
+
+
+def _sheet(path, count, cols):
+    rows = -(-count // cols)
+    pm = QPixmap(cols * scrub.TILE_W, rows * scrub.TILE_H)
+    p = QPainter(pm)
+    for i in range(count):
+        p.fillRect(QRect((i % cols) * scrub.TILE_W, (i // cols) * scrub.TILE_H, scrub.TILE_W, scrub.TILE_H),
+                   QColor(i * 10, 0, 0))
+    p.end()
+    assert pm.save(str(path))
+
+
+def _red(pm):
+    return pm.toImage().pixelColor(5, 5).red()
+
+
+def test_frame_at_picks_nearest_tile(qapp, tmp_path):
+    path = tmp_path / "sheet.png"
+    _sheet(path, 12, 5)
+    src = ScrubSource()
+    src.set_sprite({"path": str(path), "interval": 0.5, "count": 12, "cols": 5,
+                    "tile": [scrub.TILE_W, scrub.TILE_H]})
+    assert _red(src.frame_at(0.0)) == 0
+    assert _red(src.frame_at(3.6)) == 70     # 3.6초 → 7번째 칸(둘째 줄)
+    assert _red(src.frame_at(99.0)) == 110   # 끝을 넘으면 마지막 칸
+    assert src.frame_at(1.0).size().width() == scrub.TILE_W
+
+
+def test_frame_at_falls_back_to_thumbs_and_clear(qapp):
+    src = ScrubSource()
+    assert src.frame_at(1.0) is None
+    src.duration = 10.0
+    src.thumbs = [QPixmap(4, 4) for _ in range(5)]
+    assert src.frame_at(4.1) is src.thumbs[2]
+    assert src.frame_at(50.0) is src.thumbs[-1]
+    src.set_sprite({"path": "missing.jpg", "interval": 1, "count": 1, "cols": 1, "tile": [160, 90]})
+    assert src.frame_at(0.0) is src.thumbs[0]  # 읽을 수 없는 스프라이트는 무시
+    src.clear()
+    assert src.frame_at(1.0) is None
+
+
+@pytest.mark.skipif(FFMPEG is None or analysis_decode.np is None, reason="ffmpeg/numpy 없음")
+def test_shared_decode_matches_separate_builds(dirs):
+    from src.proc_async import close_runner
+    video = dirs / "clip.mp4"
+    subprocess.run([FFMPEG, "-hide_banner", "-loglevel", "error", "-f", "lavfi",
+                    "-i", "testsrc2=size=320x180:rate=25:duration=6", "-pix_fmt", "yuv420p", "-y", str(video)],
+                   check=True)
+    shared = analysis_decode.build_all(FFMPEG, str(video), 6.0)
+    assert all(shared.values())
+    sprite_bytes = open(shared["sprite"]["path"], "rb").read()
+
+    try:
+        motion = motion_index.build_index(FFMPEG, str(video))
+        colors = color_index.build_index(FFMPEG, str(video))
+        sprite = scrub.build_sprite(FFMPEG, str(video), 6.0)
+    finally:
+        close_runner()
+    assert motion == shared["motion"]
+    assert colors["seconds"] == shared["colors"]["seconds"] == 6
+    for k in ("offsets", "bins", "counts"):
+        assert (colors[k] == shared["colors"][k]).all()
+    assert open(sprite["path"], "rb").read() == sprite_bytes
+    assert not list((dirs / "colors").glob("*.tmp.raw"))  # 임시 파일 정리
@@ -0,0 +1,53 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src import telemetry
+
+
+@pytest.fixture
+def spans_path(tmp_path, monkeypatch):
+    path = tmp_path / "spans.jsonl"
+    monkeypatch.setattr(telemetry, "SPANS_PATH", path)
+    return path
+
+
+def test_output_size_sums_files_and_folders(tmp_path):
+    (tmp_path / "a.gif").write_bytes(b"x" * 10)
+    thumbs = tmp_path / "thumbs"
+    thumbs.mkdir()
+    for i in range(3):
+        (thumbs / f"{i}.jpg").write_bytes(b"y" * 5)
+    assert telemetry._output_size([tmp_path / "a.gif", thumbs, tmp_path / "missing.png"]) == 25
+    assert telemetry._output_size(None) == 0
+
+
+def test_record_appends_span(spans_path, tmp_path):
+    out = tmp_path / "out.gif"
+    out.write_bytes(b"GIF89a")
+    span = telemetry.record("pass2", ["/usr/bin/ffmpeg", "-i", "x"], 1.23456, (0.5, 2048),
+                            SimpleNamespace(returncode=0), outputs=[out])
+    assert span["exe"] == "ffmpeg" and span["out_bytes"] == 6 and span["wall_s"] == 1.2346
+    assert [json.loads(l)["kind"] for l in spans_path.read_text(encoding="utf-8").splitlines()] == ["pass2"]
+
+
+def test_rotation_keeps_previous_file(spans_path, monkeypatch):
+    monkeypatch.setattr(telemetry, "MAX_BYTES", 10)
+    for kind in ("a", "b", "c"):
+        telemetry.record(kind, ["ffmpeg"], 0.1, None, SimpleNamespace(returncode=0))
+    assert spans_path.with_name("spans.jsonl.1").exists()
+    # 교체는 한 세대만 유지: 가장 오래된 "a"는 사라집니다.
+    assert [s["kind"] for s in telemetry.load_spans()] == ["b", "c"]
+    assert [s["kind"] for s in telemetry.load_spans(last=1)] == ["c"]
+
+
+def test_summarize_counts_failures_and_orders_by_total():
+    spans = [{"kind": "pass1", "wall_s": 1.0, "cpu_s": 0.5, "peak_rss_kb": 1024, "rc": 0},
+             {"kind": "pass2", "wall_s": 2.0, "cpu_s": None, "peak_rss_kb": None, "rc": 1},
+             {"kind": "pass2", "wall_s": 3.0, "cpu_s": None, "peak_rss_kb": None, "rc": 0}]
+    rows = telemetry.summarize(spans)
+    assert [r["kind"] for r in rows] == ["pass2", "pass1"]
+    assert rows[0]["failed"] == 1 and rows[0]["cpu_s"] is None and rows[0]["mean_s"] == 2.5
+    assert rows[1]["max_rss_mb"] == 1.0
+    assert len(telemetry.format_summary(rows)) == 3
@@ -0,0 +1,77 @@
+# 업데이트 확인: GitHub releases API 대신 로컬 서버(ETag/304 흉내)로 검사합니다.
+import http.server, json, threading
+
+import pytest
+
+from src import updater
+
+
+class _ApiHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        srv = self.server
+        srv.hits.append(self.headers.get("If-None-Match"))
+        if srv.status != 200:
+            self.send_error(srv.status)
+            return
+        if self.headers.get("If-None-Match") == srv.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"tag_name": srv.tag}).encode()
+        self.send_response(200)
+        self.send_header("ETag", srv.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def api():
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ApiHandler)
+    srv.tag, srv.etag, srv.status, srv.hits = "v1.2.0", '"abc"', 200, []
+    srv.url = f"http://127.0.0.1:{srv.server_port}/releases/latest"
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _check(api, cache, current="1.1.0", **kw):
+    return updater.check_latest_cached("o", "r", current, cache, api_url=api.url, **kw)
+
+
+def test_normalize_version():
+    assert updater.normalize_version("v1.2") == (1, 2, 0)
+    assert updater.normalize_version("V2.10.3-beta") == (2, 10, 3)
+    assert updater._is_newer("v1.10.0", "1.9.9")
+    assert not updater._is_newer("v1.2.0", "1.2.0")
+
+
+def test_newer_release_then_cached_within_interval(api, tmp_path):
+    cache = tmp_path / "update.json"
+    assert _check(api, cache) == ("v1.2.0", True, None, False)
+    assert _check(api, cache) == ("v1.2.0", True, None, True)
+    assert len(api.hits) == 1
+
+
+def test_not_modified_reuses_cached_tag(api, tmp_path):
+    cache = tmp_path / "update.json"
+    _check(api, cache, current="1.2.0")
+    api.tag = "v9.9.9"  # 304면 본문을 읽지 않으므로 바뀐 태그는 보이지 않아야 합니다.
+    assert _check(api, cache, current="1.2.0", force=True) == ("v1.2.0", False, None, False)
+    assert api.hits == [None, '"abc"']
+
+
+def test_failure_is_not_retried_immediately(api, tmp_path):
+    cache = tmp_path / "update.json"
+    api.status = 500
+    tag, newer, err, from_cache = _check(api, cache)
+    assert (tag, newer, from_cache) == ("", False, False) and err
+    tag, newer, err2, from_cache = _check(api, cache)
+    assert from_cache and err2 == err
+    assert len(api.hits) == 1
+    api.status = 200
+    assert _check(api, cache, force=True)[:3] == ("v1.2.0", True, None)
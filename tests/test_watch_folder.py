@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from src import watch_folder
+from src.watch_folder import FolderWatcher, output_path_for
+
+
+@pytest.fixture
+def watcher(tmp_path, monkeypatch):
+    monkeypatch.setattr(watch_folder, "WATCH_DIR", tmp_path / "manifest")
+    monkeypatch.setattr(watch_folder, "version_line", lambda exe: "ffmpeg version test")
+    src = tmp_path / "in"
+    src.mkdir()
+    w = FolderWatcher("ffmpeg", "ffprobe", src, tmp_path / "out", {}, jobs=1, log=lambda *a: None)
+    yield w
+    w.pool.shutdown(wait=True)
+
+
+def _drain(w):
+    # 작업 풀을 비운 뒤(대기 중 작업 완료) 새 풀로 바꿔 다음 scan을 받을 수 있게 합니다.
+    w.pool.shutdown(wait=True)
+    from concurrent.futures import ThreadPoolExecutor
+    w.pool = ThreadPoolExecutor(max_workers=1)
+
+
+def test_failed_file_is_not_retried_until_it_changes(watcher, monkeypatch):
+    calls = []
+    monkeypatch.setattr(watch_folder, "convert_file", lambda *a, **k: calls.append(a[2]) or False)
+    video = watcher.folder / "a.mp4"
+    video.write_bytes(b"x" * 10)
+
+    assert watcher.scan(wait_settle=False) == 1
+    _drain(watcher)
+    assert watcher.scan(wait_settle=False) == 0  # 같은 지문이면 다시 넣지 않음
+    _drain(watcher)
+    assert calls == [video]
+
+    video.write_bytes(b"y" * 20)  # 다시 저장 → 지문이 바뀜
+    st = video.stat()
+    os.utime(video, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert watcher.scan(wait_settle=False) == 1
+    _drain(watcher)
+    assert calls == [video, video]
+
+
+def test_exception_counts_as_failure(watcher, monkeypatch):
+    def boom(*a, **k):
+        raise RuntimeError("broken")
+    monkeypatch.setattr(watch_folder, "convert_file", boom)
+    (watcher.folder / "b.mkv").write_bytes(b"z")
+    assert watcher.scan(wait_settle=False) == 1
+    _drain(watcher)
+    assert watcher.scan(wait_settle=False) == 0
+
+
+def test_success_is_recorded_and_names_do_not_collide(watcher, monkeypatch):
+    outputs = []
+
+    def fake_convert(ff, fp, video, opts, out_path, *a, **k):
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_bytes(b"GIF89a")
+        outputs.append(out_path)
+        return True
+    monkeypatch.setattr(watch_folder, "convert_file", fake_convert)
+    for name in ("a.mp4", "a.mov"):
+        (watcher.folder / name).write_bytes(b"v")
+
+    assert watcher.scan(wait_settle=False) == 2
+    _drain(watcher)
+    assert len(set(outputs)) == 2
+    assert set(outputs) == {output_path_for(watcher.out_dir, watcher.folder / n) for n in ("a.mp4", "a.mov")}
+    assert watcher.scan(wait_settle=False) == 0  # 매니페스트에 기록되어 건너뜀
+
+
+def test_fingerprint_and_options_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(watch_folder, "version_line", lambda exe: f"ffmpeg version {exe}")
+    video = tmp_path / "a.mp4"
+    video.write_bytes(b"abc")
+    fp = watch_folder.fingerprint(video)
+    assert fp[0] == 3
+    video.write_bytes(b"abcd")
+    assert watch_folder.fingerprint(video) != fp
+
+    key = watch_folder.options_key
+    base = key("ff1", {"fps": 12, "width": 160}, 0.0, 6.0)
+    assert base == key("ff1", {"width": 160, "fps": 12}, 0.0, 6.0)   # 키 순서와 무관
+    assert base == key("ff1", {"fps": 12, "width": 160}, 0.0001, 6.0)  # ms 아래는 같은 구간
+    assert base != key("ff1", {"fps": 15, "width": 160}, 0.0, 6.0)
+    assert base != key("ff1", {"fps": 12, "width": 160}, 1.0, 6.0)
+    assert base != key("ff2", {"fps": 12, "width": 160}, 0.0, 6.0)    # 다른 ffmpeg
+
+
+def test_manifest_survives_restart(watcher, monkeypatch):
+    def fake_convert(ff, fp, video, opts, out_path, *a, **k):
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_bytes(b"GIF89a")
+        return True
+    monkeypatch.setattr(watch_folder, "convert_file", fake_convert)
+    (watcher.folder / "c.webm").write_bytes(b"v")
+    assert watcher.scan(wait_settle=False) == 1
+    _drain(watcher)
+
+    again = FolderWatcher("ffmpeg", "ffprobe", watcher.folder, watcher.out_dir, {}, jobs=1, log=lambda *a: None)
+    try:
+        assert again.scan(wait_settle=False) == 0
+    finally:
+        again.pool.shutdown(wait=True)